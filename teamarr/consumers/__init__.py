@@ -76,6 +76,7 @@ from teamarr.consumers.scheduler import (
     start_lifecycle_scheduler,
     stop_lifecycle_scheduler,
 )
+from teamarr.consumers.stream_manifest import ManifestDiff, StreamManifest
 from teamarr.consumers.stream_match_cache import (
     StreamCacheEntry,
     StreamMatchCache,
@@ -120,6 +121,9 @@ __all__ = [
     "event_to_cache_data",
     "get_generation_counter",
     "increment_generation_counter",
+    # Stream manifest (delta stream sync)
+    "ManifestDiff",
+    "StreamManifest",
     # Team/league cache
     "CacheRefresher",
     "CacheStats",
@@ -39,7 +39,7 @@ from teamarr.consumers.filler.event_filler import (
     EventFillerResult,
     template_to_event_filler_config,
 )
-from teamarr.consumers.matching import BatchMatchResult, StreamMatcher
+from teamarr.consumers.matching import AliasIndex, BatchMatchResult, StreamMatcher
 from teamarr.core import Event
 from teamarr.database.groups import (
     EventEPGGroup,
@@ -56,8 +56,10 @@ from teamarr.database.stats import (
     save_matched_streams,
     save_run,
 )
+from teamarr.dispatcharr.types import DispatcharrStream
 from teamarr.services import SportsDataService, create_default_service
-from teamarr.services.stream_filter import FilterResult
+from teamarr.services.stream_filter import FilterResult, StreamFilter, StreamFilterConfig
+from teamarr.templates.event_cache import event_cache_scope
 from teamarr.utilities.xmltv import merge_xmltv_content, programmes_to_xmltv
 
 logger = logging.getLogger(__name__)
@@ -349,6 +351,9 @@ class EventGroupProcessor:
         # while ensuring groups that need fresh API data can still get it
         self._shared_events: dict[str, tuple[list[Event], bool]] = {}
 
+        # Team alias tables, loaded once per run and shared by all matchers
+        self._alias_index: AliasIndex | None = None
+
     def process_group(
         self,
         group_id: int,
@@ -373,8 +378,20 @@ class EventGroupProcessor:
                 result.completed_at = datetime.now()
                 return result
 
+            self._prewarm_tsdb_seasons(group.leagues or [])
+            self._alias_index = AliasIndex.load(self._db_factory)
             return self._process_group_internal(conn, group, target_date)
 
+    def _prewarm_tsdb_seasons(self, leagues: list[str]) -> None:
+        """Load season schedules for the TSDB leagues among these leagues."""
+        tsdb_leagues = [lg for lg in set(leagues) if self._service.get_provider_name(lg) == "tsdb"]
+        if not tsdb_leagues:
+            return
+        try:
+            self._service.prewarm_tsdb_leagues(tsdb_leagues, seasons_only=True)
+        except Exception as e:
+            logger.warning("[EVENT_EPG] TSDB season pre-warm failed: %s", e)
+
     def preview_group(
         self,
         group_id: int,
@@ -538,10 +555,15 @@ class EventGroupProcessor:
         # Clear shared events cache at start of new generation run
         # This ensures fresh data and allows cross-group reuse within this run
         self._shared_events.clear()
+        self._alias_index = AliasIndex.load(self._db_factory)
 
         with self._db_factory() as conn:
             groups = get_all_groups(conn, include_disabled=False)
 
+            # Load TSDB season schedules once so cache-only TSDB lookups
+            # cover every in-season date (1-2 API calls per league)
+            self._prewarm_tsdb_seasons([lg for g in groups for lg in (g.leagues or [])])
+
             # Sort groups: parents first, then children, then multi-league
             parent_groups, child_groups, multi_league_groups = self._sort_groups(groups)
             total_groups = len(parent_groups) + len(child_groups) + len(multi_league_groups)
@@ -816,20 +838,20 @@ class EventGroupProcessor:
         stats_run = create_run(conn, run_type="event_group", group_id=group.id)
 
         try:
-            # Step 1: Fetch M3U streams
-            streams = self._fetch_streams(group)
-            result.streams_fetched = len(streams)
-            stats_run.streams_fetched = len(streams)
+            # Step 1: Fetch M3U streams, filtering pages as they arrive
+            # (include/exclude regex and built-in eligibility checks)
+            streams, filter_result = self._fetch_streams(group)
+            result.streams_fetched = filter_result.total_input
+            stats_run.streams_fetched = filter_result.total_input
 
-            if not streams:
+            if not filter_result.total_input:
                 result.errors.append("No streams found for child group")
                 result.completed_at = datetime.now()
                 stats_run.complete(status="completed", error="No streams found")
                 save_run(conn, stats_run)
                 return result
 
-            # Step 1.5: Apply stream filtering (include/exclude regex)
-            streams, filter_result = self._filter_streams(streams, group)
+            # Step 1.5: Record stream filtering stats
             result.streams_after_filter = filter_result.passed_count
             result.filtered_stale = filter_result.filtered_stale
             # Combine all built-in eligibility filters into filtered_not_event
@@ -1138,20 +1160,20 @@ class EventGroupProcessor:
         stats_run = create_run(conn, run_type="event_group", group_id=group.id)
 
         try:
-            # Step 1: Fetch M3U streams from Dispatcharr
-            streams = self._fetch_streams(group)
-            result.streams_fetched = len(streams)
-            stats_run.streams_fetched = len(streams)
+            # Step 1: Fetch M3U streams from Dispatcharr, filtering pages as they arrive
+            # (include/exclude regex and built-in eligibility checks)
+            streams, filter_result = self._fetch_streams(group)
+            result.streams_fetched = filter_result.total_input
+            stats_run.streams_fetched = filter_result.total_input
 
-            if not streams:
+            if not filter_result.total_input:
                 result.errors.append("No streams found for group")
                 result.completed_at = datetime.now()
                 stats_run.complete(status="completed", error="No streams found")
                 save_run(conn, stats_run)
                 return result
 
-            # Step 1.5: Apply stream filtering (include/exclude regex)
-            streams, filter_result = self._filter_streams(streams, group)
+            # Step 1.5: Record stream filtering stats
             result.streams_after_filter = filter_result.passed_count
             result.filtered_stale = filter_result.filtered_stale
             # Combine all built-in eligibility filters into filtered_not_event
@@ -1400,27 +1422,40 @@ class EventGroupProcessor:
         result.completed_at = datetime.now()
         return result
 
-    def _fetch_streams(self, group: EventEPGGroup) -> list[dict]:
-        """Fetch M3U streams from Dispatcharr for the group.
+    def _fetch_streams(self, group: EventEPGGroup) -> tuple[list[dict], FilterResult]:
+        """Fetch M3U streams from Dispatcharr for the group and filter them.
 
-        Uses group's m3u_group_id to filter streams.
+        Uses group's m3u_group_id to filter streams. Pages are streamed from
+        Dispatcharr straight through the group's StreamFilter, so only streams
+        that survive filtering are converted to matcher dicts and kept.
+
+        Returns:
+            Tuple of (filtered stream dicts sorted by ID, filter_result).
+            filter_result.total_input is the number of streams fetched.
         """
         if not self._dispatcharr_client:
             logger.warning("[EVENT_EPG] Dispatcharr not configured - cannot fetch streams")
-            return []
+            return [], FilterResult()
 
         try:
             m3u_manager = self._dispatcharr_client.m3u
 
             # Fetch streams filtered by M3U group if configured
-            if group.m3u_group_id:
-                streams = m3u_manager.list_streams(group_id=group.m3u_group_id)
-            else:
-                # Fetch all streams if no group filter
-                streams = m3u_manager.list_streams()
+            # (no group filter fetches all streams)
+            pages = m3u_manager.iter_stream_pages(group_id=group.m3u_group_id or None)
+            raw_streams = (raw for page in pages for raw in page)
+
+            filter_result = self._build_stream_filter(group).filter(raw_streams)
 
-            # Convert to dicts for matcher (sorted by name for consistent order)
-            stream_dicts = [
+        except Exception as e:
+            logger.error("[EVENT_EPG] Failed to fetch streams: %s", e)
+            return [], FilterResult()
+
+        # Convert survivors to dicts for matcher
+        stream_dicts = []
+        for raw in filter_result.passed:
+            s = DispatcharrStream.from_api(raw)
+            stream_dicts.append(
                 {
                     "id": s.id,
                     "name": s.name,
@@ -1431,34 +1466,17 @@ class EventGroupProcessor:
                     "m3u_account_id": s.m3u_account_id,
                     "is_stale": s.is_stale,
                 }
-                for s in streams
-            ]
-            # Sort by stream ID ascending for consistent processing order
-            stream_dicts.sort(key=lambda s: s["id"])
-            return stream_dicts
-
-        except Exception as e:
-            logger.error("[EVENT_EPG] Failed to fetch streams: %s", e)
-            return []
-
-    def _filter_streams(
-        self,
-        streams: list[dict],
-        group: EventEPGGroup,
-    ) -> tuple[list[dict], FilterResult]:
-        """Filter streams using global settings and group's regex configuration.
-
-        Global settings apply first (event pattern filter), then group-specific.
+            )
+        # Sort by stream ID ascending for consistent processing order
+        stream_dicts.sort(key=lambda s: s["id"])
+        filter_result.passed = stream_dicts
 
-        Args:
-            streams: List of stream dicts from Dispatcharr
-            group: Event group with filter configuration
+        self._log_filter_result(group, filter_result)
+        return stream_dicts, filter_result
 
-        Returns:
-            Tuple of (filtered_streams, filter_result)
-        """
+    def _build_stream_filter(self, group: EventEPGGroup) -> StreamFilter:
+        """Build a StreamFilter from global settings and the group's regex config."""
         from teamarr.database.settings import get_stream_filter_settings
-        from teamarr.services.stream_filter import StreamFilter, StreamFilterConfig
 
         # Load global stream filter settings
         with self._db_factory() as conn:
@@ -1480,10 +1498,30 @@ class EventGroupProcessor:
             skip_builtin=group.skip_builtin_filter,
         )
 
-        stream_filter = StreamFilter(config)
-        result = stream_filter.filter(streams)
+        return StreamFilter(config)
 
-        # Log filtering results
+    def _filter_streams(
+        self,
+        streams: list[dict],
+        group: EventEPGGroup,
+    ) -> tuple[list[dict], FilterResult]:
+        """Filter streams using global settings and group's regex configuration.
+
+        Global settings apply first (event pattern filter), then group-specific.
+
+        Args:
+            streams: List of stream dicts from Dispatcharr
+            group: Event group with filter configuration
+
+        Returns:
+            Tuple of (filtered_streams, filter_result)
+        """
+        result = self._build_stream_filter(group).filter(streams)
+        self._log_filter_result(group, result)
+        return result.passed, result
+
+    def _log_filter_result(self, group: EventEPGGroup, result: FilterResult) -> None:
+        """Log a summary of what the stream filter removed."""
         filtered_total = (
             result.filtered_stale
             + result.filtered_placeholder
@@ -1508,8 +1546,6 @@ class EventGroupProcessor:
                 result.filtered_exclude,
             )
 
-        return result.passed, result
-
     def _get_all_known_leagues(self) -> list[str]:
         """Get all known leagues from the league cache.
 
@@ -1558,8 +1594,9 @@ class EventGroupProcessor:
         def fetch_league_events(league: str, fetch_date: date) -> tuple[str, date, list[Event]]:
             """Fetch events for a single league/date (for parallel execution)."""
             try:
-                # TSDB leagues: cache-only (don't hit API during EPG generation)
-                # TSDB cache builds organically from startup/scheduled refresh
+                # TSDB leagues: cache-only (don't hit API per league/day during
+                # EPG generation). Pre-warmed season schedules answer cache-only
+                # lookups for every in-season date.
                 is_tsdb = self._service.get_provider_name(league) == "tsdb"
                 events = self._service.get_events(league, fetch_date, cache_only=is_tsdb)
                 return (league, fetch_date, events)
@@ -1648,6 +1685,7 @@ class EventGroupProcessor:
             custom_regex_league=group.custom_regex_league,
             custom_regex_league_enabled=group.custom_regex_league_enabled,
             shared_events=self._shared_events,  # Reuse events across groups in same run
+            alias_index=self._alias_index,  # Reuse alias tables across groups in same run
         )
 
         result = matcher.match_all(
@@ -2728,6 +2766,7 @@ class EventGroupProcessor:
 # =============================================================================
 
 
+@event_cache_scope()
 def process_event_group(
     db_factory: Any,
     group_id: int,
@@ -2787,6 +2826,7 @@ def process_all_event_groups(
     )
 
 
+@event_cache_scope()
 def preview_event_group(
     db_factory: Any,
     group_id: int,
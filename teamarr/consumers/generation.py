@@ -8,6 +8,7 @@ import logging
 import threading
 import time
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -73,9 +74,9 @@ def run_full_generation(
     streaming API endpoint and the background scheduler call this function.
 
     Workflow:
-    1. Refresh M3U accounts (0-5%)
+    1. Refresh M3U accounts (background, runs alongside step 2)
     2. Process all teams (5-50%) - 45% budget
-    3. Process all event groups (50-95%) - 45% budget
+    3. Process all event groups (50-95%) - 45% budget, waits on step 1
     4. Merge and save XMLTV (95-96%)
     5. Dispatcharr EPG refresh + channel association (96-98%)
     6. Process scheduled deletions (98-99%)
@@ -89,6 +90,19 @@ def run_full_generation(
     Returns:
         GenerationResult with all stats and sub-task results
     """
+    from teamarr.templates.event_cache import event_cache_scope
+
+    # Event-derived template data is memoized for the duration of the run
+    with event_cache_scope():
+        return _run_full_generation(db_factory, dispatcharr_client, progress_callback)
+
+
+def _run_full_generation(
+    db_factory: Callable[[], Any],
+    dispatcharr_client: Any | None,
+    progress_callback: ProgressCallback | None,
+) -> GenerationResult:
+    """Body of run_full_generation (runs inside the event cache scope)."""
     global _generation_running
 
     # Prevent concurrent generation runs
@@ -126,6 +140,7 @@ def run_full_generation(
     from teamarr.database.stats import create_run, save_run
     from teamarr.dispatcharr import EPGManager
     from teamarr.services import create_default_service
+    from teamarr.utilities.dns_cache import PROVIDER_WARM_UP
     from teamarr.utilities.xmltv import merge_xmltv_content
 
     result = GenerationResult()
@@ -204,6 +219,8 @@ def run_full_generation(
         # This ensures the event cache stays warm throughout the entire run
         # (Previously each consumer created its own service with a cold cache)
         shared_service = create_default_service()
+        if PROVIDER_WARM_UP:  # opt-in: HEAD requests to provider hosts
+            shared_service.warm_up_providers()
 
         # Get settings
         with db_factory() as conn:
@@ -211,10 +228,14 @@ def run_full_generation(
             dispatcharr_settings = get_dispatcharr_settings(conn)
             display_settings = get_display_settings(conn)
 
-        # Step 1: Refresh M3U accounts (0-5%)
-        update_progress("init", 3, "Refreshing M3U accounts...")
+        # Step 1: Refresh M3U accounts in the background
+        # Team EPG doesn't read M3U streams, so only the group phase waits on it
+        m3u_executor: ThreadPoolExecutor | None = None
+        m3u_future: Future[dict] | None = None
         if dispatcharr_client:
-            result.m3u_refresh = _refresh_m3u_accounts(db_factory, dispatcharr_client)
+            update_progress("init", 3, "Refreshing M3U accounts...")
+            m3u_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="m3u-refresh")
+            m3u_future = m3u_executor.submit(_refresh_m3u_accounts, db_factory, dispatcharr_client)
 
         # Step 2: Process all teams (5-50%) - 45% budget
         update_progress("teams", 5, "Processing teams...")
@@ -236,10 +257,20 @@ def run_full_generation(
                 msg = f"{name} ({current}/{total}) [{elapsed:.1f}s]"
             update_progress("teams", pct, msg, current, total, name)
 
-        team_result = process_all_teams(db_factory=db_factory, progress_callback=team_progress)
+        try:
+            team_result = process_all_teams(db_factory=db_factory, progress_callback=team_progress)
+        finally:
+            # Don't join here - _collect_m3u_refresh blocks on the result so it
+            # can measure how long the group phase actually waited
+            if m3u_executor is not None:
+                m3u_executor.shutdown(wait=False)
         result.teams_processed = team_result.teams_processed
         result.teams_programmes = team_result.total_programmes
 
+        # Groups depend on refreshed streams - join the M3U branch here
+        if m3u_future is not None:
+            result.m3u_refresh = _collect_m3u_refresh(m3u_future)
+
         # Transition message - teams done, starting groups
         logger.info("[GENERATION] Sending transition message: teams -> groups")
         update_progress(
@@ -477,12 +508,14 @@ def run_full_generation(
                 else dispatcharr_client
             )
             epg_manager = EPGManager(raw_client)
+            refresh_start = time.time()
             # Increased timeout from 60s to 120s for large EPGs
             refresh_result = epg_manager.wait_for_refresh(dispatcharr_settings.epg_id, timeout=120)
             result.epg_refresh = {
                 "success": refresh_result.success,
                 "message": refresh_result.message,
                 "duration": refresh_result.duration,
+                "polls": refresh_result.polls,
             }
 
             update_progress("dispatcharr", 97, "Associating EPG with channels...")
@@ -490,6 +523,16 @@ def run_full_generation(
                 dispatcharr_settings.epg_id
             )
 
+            # Metric: wall time from triggering the refresh to channels being associated
+            time_to_association = round(time.time() - refresh_start, 2)
+            result.epg_refresh["time_to_association"] = time_to_association
+            stats_run.extra_metrics["epg_time_to_association"] = time_to_association
+            logger.info(
+                "[GENERATION] EPG refresh -> association took %.2fs (%d polls)",
+                time_to_association,
+                refresh_result.polls,
+            )
+
         # Step 6: Process scheduled deletions (98-99%)
         update_progress("lifecycle", 98, "Processing scheduled deletions...")
         channels_deleted_count = 0
@@ -627,6 +670,28 @@ def run_full_generation(
     return result
 
 
+def _collect_m3u_refresh(future: Future[dict]) -> dict:
+    """Wait for the background M3U refresh and return its result dict.
+
+    A failed refresh must not abort generation - groups fall back to
+    whatever streams Dispatcharr currently has. "waited" is how long the
+    group phase was held up, i.e. how much of the refresh the team phase
+    did not hide.
+    """
+    wait_start = time.time()
+    try:
+        m3u_result = future.result()
+    except Exception as e:
+        logger.warning("[M3U] Background refresh failed: %s", e)
+        return {"error": str(e)}
+
+    waited = time.time() - wait_start
+    if waited >= 0.1:
+        logger.info("[M3U] Event groups waited %.1fs for M3U refresh", waited)
+    m3u_result["waited"] = round(waited, 1)
+    return m3u_result
+
+
 def _refresh_m3u_accounts(db_factory: Callable[[], Any], dispatcharr_client: Any) -> dict:
     """Refresh M3U accounts for all event groups."""
     from teamarr.database.groups import get_all_groups
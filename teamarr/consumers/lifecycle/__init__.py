@@ -108,7 +108,7 @@ def create_lifecycle_service(
         )
 
         channel_manager = ChannelManager(raw_client)
-        logo_manager = LogoManager(raw_client)
+        logo_manager = LogoManager(raw_client, db_factory=db_factory)
         epg_manager = EPGManager(raw_client)
 
     return ChannelLifecycleService(
@@ -13,6 +13,8 @@ from typing import Any
 
 from teamarr.consumers.event_epg import POSTPONED_LABEL, is_event_postponed
 from teamarr.core import Event
+from teamarr.database.channel_numbers import ChannelNumberAllocator
+from teamarr.database.channels import GroupChannelIndex
 from teamarr.templates import ContextBuilder, TemplateResolver
 
 from .dynamic_resolver import DynamicResolver
@@ -128,6 +130,10 @@ class ChannelLifecycleService:
         # Dynamic group/profile resolver
         self._dynamic_resolver = DynamicResolver()
 
+        # Per-batch state (set for the duration of a process_matched_streams batch)
+        self._channel_allocator: ChannelNumberAllocator | None = None
+        self._channel_index: GroupChannelIndex | None = None
+
     @property
     def dispatcharr_enabled(self) -> bool:
         """Check if Dispatcharr integration is enabled."""
@@ -263,15 +269,14 @@ class ChannelLifecycleService:
         Returns:
             StreamProcessResult with created, existing, skipped, errors
         """
-        from teamarr.database.channels import (
-            find_existing_channel,
-            log_channel_history,
-        )
+        from teamarr.database.channels import log_channel_history
 
         result = StreamProcessResult()
 
         # Clear logo cache at start of batch to avoid stale references
-        # Logos may have been deleted/changed in Dispatcharr since last run
+        # Logos may have been deleted/changed in Dispatcharr since last run.
+        # Cheap: the cache reloads from the persisted map with one query, and
+        # entries past the verify/max age are re-checked against Dispatcharr
         if self._logo_manager:
             self._logo_manager.clear_cache()
 
@@ -282,6 +287,11 @@ class ChannelLifecycleService:
 
                 # Get group settings
                 group_id = group_config.get("id")
+
+                # Load channel ranges/used numbers and the group's channels once
+                # so per-stream lookups below run in memory
+                self._channel_allocator = ChannelNumberAllocator(conn)
+                self._channel_index = GroupChannelIndex.load(conn, group_id)
                 duplicate_mode = group_config.get("duplicate_event_handling", "consolidate")
 
                 # Channel group settings - now supports dynamic modes
@@ -386,9 +396,7 @@ class ChannelLifecycleService:
 
                     # Find existing channel based on mode
                     # Use effective_event_id for segment-aware lookup
-                    existing = find_existing_channel(
-                        conn=conn,
-                        group_id=group_id,
+                    existing = self._channel_index.find(
                         event_id=effective_event_id,
                         event_provider=event_provider,
                         exception_keyword=matched_keyword,
@@ -545,6 +553,9 @@ class ChannelLifecycleService:
                     "[LIFECYCLE] Failed to apply pending profile changes after error: %s",
                     profile_err,
                 )
+        finally:
+            self._channel_allocator = None
+            self._channel_index = None
 
         return result
 
@@ -755,6 +766,9 @@ class ChannelLifecycleService:
             stream_exists_on_channel,
         )
 
+        # Batch index answers stream lookups from memory when available
+        channel_index = self._channel_index
+
         result = StreamProcessResult()
         stream_name = stream.get("name", "")
         stream_id = stream.get("id")
@@ -776,6 +790,12 @@ class ChannelLifecycleService:
                         existing.id,
                         reason=f"Missing from Dispatcharr (ID {existing.dispatcharr_channel_id})",
                     )
+                    if self._channel_allocator:
+                        self._channel_allocator.release(
+                            existing.event_epg_group_id, existing.channel_number
+                        )
+                    if self._channel_index:
+                        self._channel_index.remove_channel(existing)
                     log_channel_history(
                         conn=conn,
                         managed_channel_id=existing.id,
@@ -810,7 +830,11 @@ class ChannelLifecycleService:
 
         if effective_mode == "consolidate":
             # Add stream to existing channel if not already present
-            if not stream_exists_on_channel(conn, existing.id, stream_id):
+            if channel_index:
+                stream_attached = channel_index.stream_exists(existing.id, stream_id)
+            else:
+                stream_attached = stream_exists_on_channel(conn, existing.id, stream_id)
+            if not stream_attached:
                 # Compute priority from ordering rules (or use sequential if no rules)
                 m3u_account_name = stream.get("m3u_account_name") or group_config.get(
                     "m3u_account_name"
@@ -820,7 +844,11 @@ class ChannelLifecycleService:
                     conn, stream_name, m3u_account_name, source_group_id
                 )
                 if priority is None:
-                    priority = get_next_stream_priority(conn, existing.id)
+                    priority = (
+                        channel_index.next_stream_priority(existing.id)
+                        if channel_index
+                        else get_next_stream_priority(conn, existing.id)
+                    )
 
                 # Add to DB
                 add_stream_to_channel(
@@ -834,12 +862,18 @@ class ChannelLifecycleService:
                     m3u_account_name=m3u_account_name,
                     source_group_id=source_group_id,
                 )
+                if channel_index:
+                    channel_index.add_stream(existing.id, stream_id, priority)
 
                 # Sync with Dispatcharr - use ordered stream list to respect rules
                 if self._channel_manager:
                     with self._dispatcharr_lock:
-                        # Get streams in priority order from DB
-                        ordered_streams = get_ordered_stream_ids(conn, existing.id)
+                        # Get streams in priority order
+                        ordered_streams = (
+                            channel_index.ordered_stream_ids(existing.id)
+                            if channel_index
+                            else get_ordered_stream_ids(conn, existing.id)
+                        )
                         self._channel_manager.update_channel(
                             existing.dispatcharr_channel_id,
                             {"streams": ordered_streams},
@@ -1057,6 +1091,11 @@ class ChannelLifecycleService:
 
             # Commit immediately so next channel number query sees this channel
             conn.commit()
+            if self._channel_allocator:
+                self._channel_allocator.claim(group_id, channel_number)
+            if self._channel_index:
+                self._channel_index.add_created_channel(conn, managed_channel_id)
+                self._channel_index.add_stream(managed_channel_id, stream_id, 0)
 
         except Exception as e:
             # DB insert failed - clean up the Dispatcharr channel to prevent orphans
@@ -1268,7 +1307,9 @@ class ChannelLifecycleService:
         """Get next available channel number for a group.
 
         Uses the channel_numbers module for AUTO/MANUAL mode support
-        with range validation and 10-block intervals.
+        with range validation and 10-block intervals. Inside a
+        process_matched_streams batch the preloaded allocator answers from
+        memory instead of re-querying ranges and used numbers.
 
         Args:
             conn: Database connection
@@ -1278,9 +1319,12 @@ class ChannelLifecycleService:
         Returns:
             Next available channel number as int, or None if range exhausted
         """
-        from teamarr.database.channel_numbers import get_next_channel_number
+        if self._channel_allocator:
+            next_num = self._channel_allocator.next_number(group_id, auto_assign=True)
+        else:
+            from teamarr.database.channel_numbers import get_next_channel_number
 
-        next_num = get_next_channel_number(conn, group_id, auto_assign=True)
+            next_num = get_next_channel_number(conn, group_id, auto_assign=True)
         if next_num is None:
             logger.warning("[LIFECYCLE] Could not allocate channel number for group %d", group_id)
             return None
@@ -1308,10 +1352,7 @@ class ChannelLifecycleService:
         | template            | logo_id             | Upload/update if different  |
         | event_id            | tvg_id              | Ensures EPG matching        |
         """
-        from teamarr.database.channels import (
-            log_channel_history,
-            update_managed_channel,
-        )
+        from teamarr.database.channels import log_channel_history
 
         result = StreamProcessResult()
 
@@ -1416,7 +1457,7 @@ class ChannelLifecycleService:
 
             # Apply DB updates
             if db_updates:
-                update_managed_channel(conn, existing.id, db_updates)
+                self._update_channel_record(conn, existing, db_updates)
 
             # 7. Sync channel_profile_ids (supports dynamic {sport}/{league} resolution)
             # Dispatcharr profile semantics (commit 6b873be):
@@ -1482,8 +1523,8 @@ class ChannelLifecycleService:
                         changes_made.append(f"queued add to profile {profile_id}")
 
                 # Update stored profile IDs in DB
-                update_managed_channel(
-                    conn, existing.id, {"channel_profile_ids": json.dumps(effective_profile_ids)}
+                self._update_channel_record(
+                    conn, existing, {"channel_profile_ids": json.dumps(effective_profile_ids)}
                 )
 
             # 8. Sync logo - handles both updates and removals
@@ -1519,9 +1560,9 @@ class ChannelLifecycleService:
                                 {"logo_id": new_logo_id},
                             )
                             # Update DB
-                            update_managed_channel(
+                            self._update_channel_record(
                                 conn,
-                                existing.id,
+                                existing,
                                 {
                                     "logo_url": logo_url,
                                     "dispatcharr_logo_id": new_logo_id,
@@ -1540,9 +1581,9 @@ class ChannelLifecycleService:
                         {"logo_id": None},
                     )
                     # Update DB
-                    update_managed_channel(
+                    self._update_channel_record(
                         conn,
-                        existing.id,
+                        existing,
                         {
                             "logo_url": None,
                             "dispatcharr_logo_id": None,
@@ -1578,6 +1619,21 @@ class ChannelLifecycleService:
 
         return result
 
+    def _update_channel_record(self, conn: Connection, existing: Any, data: dict) -> None:
+        """Update a managed channel row and the in-memory record.
+
+        The record may be shared with the batch channel index, so later
+        streams for the same channel see the synced values.
+        """
+        from teamarr.database.channels import update_managed_channel
+
+        update_managed_channel(conn, existing.id, data)
+        for key, value in data.items():
+            if key == "channel_profile_ids" and isinstance(value, str):
+                value = json.loads(value)
+            if hasattr(existing, key):
+                setattr(existing, key, value)
+
     def _remove_stream_from_dispatcharr_channel(
         self,
         dispatcharr_channel_id: int,
@@ -10,11 +10,14 @@ Main entry point:
     result = matcher.match_all(streams, target_date)
 """
 
+from teamarr.consumers.matching.alias_index import AliasIndex
 from teamarr.consumers.matching.classifier import (
     ClassifiedStream,
     StreamCategory,
     classify_stream,
     classify_streams,
+    clear_classification_cache,
+    get_classification_cache_stats,
 )
 from teamarr.consumers.matching.constants import (
     ACCEPT_WITH_DATE_THRESHOLD,
@@ -75,9 +78,12 @@ __all__ = [
     "ClassifiedStream",
     "classify_stream",
     "classify_streams",
+    "clear_classification_cache",
+    "get_classification_cache_stats",
     # TeamMatcher
     "TeamMatcher",
     "MatchContext",
+    "AliasIndex",
     # EventCardMatcher
     "EventCardMatcher",
     "EventMatchContext",
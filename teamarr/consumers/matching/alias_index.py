@@ -0,0 +1,145 @@
+"""Team alias tables shared by all matchers in a generation run.
+
+AliasIndex holds everything alias matching needs, built once:
+- Built-in aliases (TEAM_ALIASES) - league-agnostic
+- User-defined aliases (database), keyed by (alias, league)
+- Reverse lookup: alias -> [(canonical, league), ...]
+- Canonical team patterns (normalized full name, short name, abbreviation)
+  per team, computed on first use and reused for every stream and group
+
+EventGroupProcessor loads one index per run and passes it to every
+StreamMatcher; matchers created without one load their own.
+
+Usage:
+    index = AliasIndex.load(get_db)
+    index.resolve("man u", "eng.1")  # -> "manchester united"
+    index.team_patterns(event.home_team)  # -> ("manchester united", "man united", "mun")
+"""
+
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from teamarr.core.types import Team
+from teamarr.utilities.constants import TEAM_ALIASES
+from teamarr.utilities.fuzzy_match import get_matcher
+
+logger = logging.getLogger(__name__)
+
+# Type alias for user-defined aliases: (alias_text, league) -> team_name
+UserAliasCache = dict[tuple[str, str], str]
+
+
+class AliasIndex:
+    """Normalized built-in and user alias tables with per-team pattern cache."""
+
+    def __init__(self, user_aliases: UserAliasCache | None = None):
+        self._user_aliases: UserAliasCache = dict(user_aliases or {})
+        self._reverse: dict[str, list[tuple[str, str]]] = {}
+        for (alias, league), canonical in self._user_aliases.items():
+            self._reverse.setdefault(alias, []).append((canonical, league))
+
+        # (name, short_name, abbreviation) -> normalized patterns
+        self._patterns: dict[tuple[str, str, str], tuple[str, ...]] = {}
+        self._patterns_lock = threading.Lock()
+
+    @classmethod
+    def load(cls, db_factory: Callable[..., Any] | None) -> "AliasIndex":
+        """Build an index from the user aliases in the database.
+
+        Database errors are logged and yield an index with built-in aliases only.
+        """
+        if not db_factory:
+            return cls()
+
+        try:
+            from teamarr.database.aliases import list_aliases
+
+            with db_factory() as conn:
+                aliases = list_aliases(conn)
+        except Exception as e:
+            logger.warning("[ALIAS] Failed to load user aliases from database: %s", e)
+            return cls()
+
+        # Key by (normalized alias, normalized league)
+        index = cls(
+            {
+                (alias.alias.lower(), alias.league.lower()): alias.team_name.lower()
+                for alias in aliases
+            }
+        )
+        if index._user_aliases:
+            logger.debug(
+                "[ALIAS] Loaded %d user-defined aliases (%d unique)",
+                len(index._user_aliases),
+                len(index._reverse),
+            )
+        return index
+
+    # Pickle without the lock (snapshots are shipped to match workers)
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_patterns_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._patterns_lock = threading.Lock()
+
+    @property
+    def user_aliases(self) -> UserAliasCache:
+        """User-defined aliases: (alias, league) -> canonical."""
+        return self._user_aliases
+
+    @property
+    def reverse_aliases(self) -> dict[str, list[tuple[str, str]]]:
+        """User-defined aliases by alias: alias -> [(canonical, league), ...]."""
+        return self._reverse
+
+    def resolve(self, team_name: str, league: str | None) -> str | None:
+        """Resolve a team name to its canonical form.
+
+        Built-in aliases (league-agnostic) take priority over user-defined
+        aliases (league-specific).
+        """
+        normalized = team_name.lower()
+        canonical = TEAM_ALIASES.get(normalized)
+        if canonical:
+            return canonical
+        if league and self._user_aliases:
+            return self._user_aliases.get((normalized, league.lower()))
+        return None
+
+    def lookup_user_alias(self, team_name: str, league: str) -> str | None:
+        """Look up a team name in user-defined aliases for a league."""
+        if not self._user_aliases:
+            return None
+        return self._user_aliases.get((team_name.lower(), league.lower()))
+
+    def reverse_resolve(self, team_name: str) -> list[tuple[str, str | None]]:
+        """All canonical forms of a team name across leagues.
+
+        Returns:
+            (canonical_name, league) tuples; league is None for built-in aliases
+        """
+        if not team_name:
+            return []
+
+        normalized = team_name.lower()
+        results: list[tuple[str, str | None]] = []
+        canonical = TEAM_ALIASES.get(normalized)
+        if canonical:
+            results.append((canonical, None))
+        results.extend(self._reverse.get(normalized, []))
+        return results
+
+    def team_patterns(self, team: Team) -> tuple[str, ...]:
+        """Normalized name patterns for a team (computed once per team)."""
+        key = (team.name or "", team.short_name or "", team.abbreviation or "")
+        patterns = self._patterns.get(key)
+        if patterns is None:
+            patterns = tuple(tp.pattern for tp in get_matcher().generate_team_patterns(team))
+            with self._patterns_lock:
+                self._patterns[key] = patterns
+        return patterns
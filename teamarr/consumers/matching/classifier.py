@@ -5,12 +5,17 @@ strategy to use:
 - TEAM_VS_TEAM: Standard team sports (NFL, NBA, Soccer, etc.)
 - EVENT_CARD: Combat sports with event cards (UFC, Boxing)
 - PLACEHOLDER: Filler streams with no event info (skip)
+
+Classification results are memoized per process (see classify_stream):
+the same stream names recur across event groups and hourly runs.
 """
 
 import logging
 import re
-from dataclasses import dataclass
-from datetime import date, time
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import date, datetime, time
 from enum import Enum
 from re import Pattern
 
@@ -19,11 +24,14 @@ from teamarr.utilities.constants import (
     CARD_SEGMENT_PATTERNS,
     EVENT_CARD_KEYWORDS,
     GAME_SEPARATORS,
-    LEAGUE_HINT_PATTERNS,
-    PLACEHOLDER_PATTERNS,
-    SPORT_HINT_PATTERNS,
     UFC_EXCLUDE_PATTERNS,
 )
+from teamarr.utilities.pattern_scanner import (
+    LEAGUE_HINT_SCANNER,
+    NUMBERS_ONLY_PATTERN,
+    PLACEHOLDER_SCANNER,
+    SPORT_HINT_SCANNER,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -36,9 +44,12 @@ class StreamCategory(Enum):
     PLACEHOLDER = "placeholder"  # No event info, skip
 
 
-@dataclass
+@dataclass(frozen=True)
 class ClassifiedStream:
-    """Result of stream classification with extracted components."""
+    """Result of stream classification with extracted components.
+
+    Immutable: instances are shared through the classification cache.
+    """
 
     category: StreamCategory
     normalized: NormalizedStream
@@ -141,6 +152,15 @@ class CustomRegexConfig:
 
         return self._compiled_league
 
+    def cache_key(self) -> tuple:
+        """Hashable identity of the configured patterns (for result caching)."""
+        return (
+            self.teams_pattern if self.teams_enabled else None,
+            self.date_pattern if self.date_enabled else None,
+            self.time_pattern if self.time_enabled else None,
+            self.league_pattern if self.league_enabled else None,
+        )
+
 
 def extract_teams_with_custom_regex(
     text: str,
@@ -186,6 +206,7 @@ def extract_teams_with_custom_regex(
 def extract_date_with_custom_regex(
     text: str,
     config: CustomRegexConfig,
+    today: date | None = None,
 ) -> date | None:
     """Extract date using custom regex pattern.
 
@@ -194,15 +215,19 @@ def extract_date_with_custom_regex(
     - Named groups: (?P<month>...) (?P<day>...) (?P<year>...) - combines
     - Single capture group - returns raw string to parse
 
+    Dates without a year get the reference date's year.
+
     Args:
         text: Stream name (original, not normalized)
         config: Custom regex configuration
+        today: Reference date for dates without a year (default: today)
 
     Returns:
         Extracted date or None
     """
     from datetime import datetime
 
+    year_default = (today or datetime.now().date()).year
     pattern = config.get_date_pattern()
     if not pattern:
         return None
@@ -216,7 +241,7 @@ def extract_date_with_custom_regex(
         try:
             date_str = match.group("date")
             if date_str:
-                return _parse_date_string(date_str.strip())
+                return _parse_date_string(date_str.strip(), year_default)
         except (IndexError, re.error):
             pass
 
@@ -232,7 +257,7 @@ def extract_date_with_custom_regex(
                     if year < 100:
                         year += 2000 if year < 50 else 1900
                 except (IndexError, re.error, ValueError, AttributeError):
-                    year = datetime.now().year
+                    year = year_default
                 return date(year, month, day)
         except (IndexError, re.error, ValueError, AttributeError):
             pass
@@ -240,7 +265,7 @@ def extract_date_with_custom_regex(
         # Try first capture group as raw date string
         groups = match.groups()
         if groups and groups[0]:
-            return _parse_date_string(groups[0].strip())
+            return _parse_date_string(groups[0].strip(), year_default)
 
     except (ValueError, TypeError) as e:
         logger.debug("[CLASSIFY] Failed to parse custom date: %s", e)
@@ -282,8 +307,11 @@ def _parse_month(month_str: str) -> int:
     return int(month_str)
 
 
-def _parse_date_string(date_str: str) -> date | None:
-    """Parse various date string formats."""
+def _parse_date_string(date_str: str, year_default: int | None = None) -> date | None:
+    """Parse various date string formats.
+
+    Formats without a year use year_default (current year if None).
+    """
     from datetime import datetime
 
     # Common formats to try
@@ -308,7 +336,7 @@ def _parse_date_string(date_str: str) -> date | None:
             parsed = datetime.strptime(date_str, fmt)
             # If no year in format, use current year
             if "%Y" not in fmt and "%y" not in fmt:
-                parsed = parsed.replace(year=datetime.now().year)
+                parsed = parsed.replace(year=year_default or datetime.now().year)
             return parsed.date()
         except ValueError:
             continue
@@ -486,16 +514,12 @@ def is_placeholder(text: str) -> bool:
 
     text_lower = text.lower().strip()
 
-    # Check against placeholder patterns
-    for pattern in PLACEHOLDER_PATTERNS:
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            return True
-
-    # Additional check: very short names with just numbers
-    if re.match(r"^[\d\s\-:]+$", text_lower):
+    # Check against placeholder patterns (one compiled scan)
+    if PLACEHOLDER_SCANNER.matches(text_lower):
         return True
 
-    return False
+    # Additional check: very short names with just numbers
+    return NUMBERS_ONLY_PATTERN.match(text_lower) is not None
 
 
 # =============================================================================
@@ -742,11 +766,7 @@ def detect_league_hint(text: str) -> str | list[str] | None:
 
     text_lower = text.lower()
 
-    for pattern, league_code in LEAGUE_HINT_PATTERNS:
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            return league_code
-
-    return None
+    return LEAGUE_HINT_SCANNER.first(text_lower)
 
 
 def detect_sport_hint(text: str) -> str | None:
@@ -771,11 +791,7 @@ def detect_sport_hint(text: str) -> str | None:
 
     text_lower = text.lower()
 
-    for pattern, sport in SPORT_HINT_PATTERNS:
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            return sport
-
-    return None
+    return SPORT_HINT_SCANNER.first(text_lower)
 
 
 # =============================================================================
@@ -985,12 +1001,79 @@ def _clean_fighter_name(name: str) -> str | None:
 # =============================================================================
 
 
+# Bounded LRU of classification results, shared by all matchers in the process
+CLASSIFY_CACHE_SIZE = 20000
+
+_classify_cache: OrderedDict[tuple, ClassifiedStream] = OrderedDict()
+_classify_cache_lock = threading.Lock()
+_classify_cache_stats = {"hits": 0, "misses": 0}
+
+
 def classify_stream(
     stream_name: str,
     league_event_type: str | None = None,
     custom_regex: CustomRegexConfig | None = None,
+    today: date | None = None,
+) -> ClassifiedStream:
+    """Classify a stream for matching strategy selection (memoized).
+
+    Results are cached by (stream name, league event type, custom regex
+    patterns, reference date). The date is part of the key because year
+    inference for dates like "1/17" depends on it, so entries from
+    yesterday are never reused after midnight.
+
+    Args:
+        stream_name: Raw stream name to classify
+        league_event_type: Optional event_type from leagues table (e.g., "fight" for UFC)
+        custom_regex: Optional custom regex configuration for team/date/time extraction
+        today: Reference date for year inference (default: today)
+
+    Returns:
+        ClassifiedStream with category and extracted info
+    """
+    today = today or datetime.now().date()
+    key = (
+        stream_name,
+        league_event_type,
+        custom_regex.cache_key() if custom_regex else None,
+        today,
+    )
+    with _classify_cache_lock:
+        cached = _classify_cache.get(key)
+        if cached is not None:
+            _classify_cache.move_to_end(key)
+            _classify_cache_stats["hits"] += 1
+            return cached
+
+    result = _classify_stream(stream_name, league_event_type, custom_regex, today)
+
+    with _classify_cache_lock:
+        _classify_cache_stats["misses"] += 1
+        _classify_cache[key] = result
+        while len(_classify_cache) > CLASSIFY_CACHE_SIZE:
+            _classify_cache.popitem(last=False)
+    return result
+
+
+def clear_classification_cache() -> None:
+    """Drop all memoized classification results."""
+    with _classify_cache_lock:
+        _classify_cache.clear()
+
+
+def get_classification_cache_stats() -> dict:
+    """Classification cache size and hit/miss counts."""
+    with _classify_cache_lock:
+        return {"size": len(_classify_cache), **_classify_cache_stats}
+
+
+def _classify_stream(
+    stream_name: str,
+    league_event_type: str | None = None,
+    custom_regex: CustomRegexConfig | None = None,
+    today: date | None = None,
 ) -> ClassifiedStream:
-    """Classify a stream for matching strategy selection.
+    """Classify a stream for matching strategy selection (uncached).
 
     Classification order:
     1. Normalize stream name
@@ -1008,21 +1091,22 @@ def classify_stream(
         stream_name: Raw stream name to classify
         league_event_type: Optional event_type from leagues table (e.g., "fight" for UFC)
         custom_regex: Optional custom regex configuration for team/date/time extraction
+        today: Reference date for year inference (default: today)
 
     Returns:
         ClassifiedStream with category and extracted info
     """
     # Step 1: Normalize
-    normalized = normalize_stream(stream_name)
+    normalized = normalize_stream(stream_name, today)
     result: ClassifiedStream | None = None
 
     # Step 1b: Apply custom date/time regex to override built-in extraction
     # Uses ORIGINAL stream name (not normalized) for more flexible matching
     if custom_regex:
         if custom_regex.date_enabled:
-            custom_date = extract_date_with_custom_regex(stream_name, custom_regex)
+            custom_date = extract_date_with_custom_regex(stream_name, custom_regex, today)
             if custom_date:
-                normalized.extracted_date = custom_date
+                normalized = replace(normalized, extracted_date=custom_date)
                 logger.debug(
                     "[CLASSIFY] Custom date regex extracted: %s from '%s'",
                     custom_date,
@@ -1032,7 +1116,7 @@ def classify_stream(
         if custom_regex.time_enabled:
             custom_time = extract_time_with_custom_regex(stream_name, custom_regex)
             if custom_time:
-                normalized.extracted_time = custom_time
+                normalized = replace(normalized, extracted_time=custom_time)
                 logger.debug(
                     "[CLASSIFY] Custom time regex extracted: %s from '%s'",
                     custom_time,
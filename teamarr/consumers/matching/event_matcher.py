@@ -5,11 +5,17 @@ These don't have team-vs-team format but instead match by:
 - Event number (UFC 315)
 - Event keywords (Main Card, Prelims)
 - Fighter names (fallback)
+
+Segment streams (early prelims, prelims, main card, per-language feeds) all
+target the same few events, so each matcher keeps, per run:
+- A date index: league events bucketed by local date, with precomputed
+  name tokens and fighter last names
+- A memo of (league, date, event number) -> event for event-number hints
 """
 
 import logging
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 from zoneinfo import ZoneInfo
 
@@ -41,6 +47,45 @@ class EventMatchContext:
     classified: ClassifiedStream
 
 
+@dataclass
+class EventCardCandidate:
+    """An event with the name data event card matching compares against."""
+
+    event: Event
+    name_lower: str
+    name_tokens: frozenset[str]
+    fighter_last_names: tuple[str, ...]  # home then away, 4+ characters
+
+    @classmethod
+    def from_event(cls, event: Event) -> "EventCardCandidate":
+        name_lower = event.name.lower()
+        last_names = []
+        for team in (event.home_team, event.away_team):
+            parts = team.name.lower().split() if team else []
+            if parts and len(parts[-1]) >= 4:
+                last_names.append(parts[-1])
+        return cls(event, name_lower, frozenset(name_lower.split()), tuple(last_names))
+
+
+@dataclass
+class EventCardDateBucket:
+    """Events of one league on one local date."""
+
+    league_has_events: bool  # False: provider returned nothing for the date
+    candidates: list[EventCardCandidate] = field(default_factory=list)
+    # token -> positions in candidates (ascending)
+    token_index: dict[str, list[int]] = field(default_factory=dict)
+
+    def first_with_overlap(self, stream_tokens: set[str], min_overlap: int) -> Event | None:
+        """First event (in provider order) sharing min_overlap name tokens."""
+        counts: dict[int, int] = {}
+        for token in stream_tokens:
+            for pos in self.token_index.get(token, ()):
+                counts[pos] = counts.get(pos, 0) + 1
+        matching = [pos for pos, count in counts.items() if count >= min_overlap]
+        return self.candidates[min(matching)].event if matching else None
+
+
 class EventCardMatcher:
     """Matches event card streams (UFC, Boxing) to provider events.
 
@@ -66,6 +111,10 @@ class EventCardMatcher:
         """
         self._service = service
         self._cache = cache
+        # (league, local date, tz) -> bucket, built once per matcher
+        self._date_index: dict[tuple[str, date, ZoneInfo], EventCardDateBucket] = {}
+        # (league, local date, tz, event number) -> event (or None)
+        self._hint_memo: dict[tuple[str, date, ZoneInfo, str], Event | None] = {}
 
     def match(
         self,
@@ -119,10 +168,9 @@ class EventCardMatcher:
             )
             return cache_result
 
-        # Get events for this league (TSDB leagues use cache-only)
-        is_tsdb = self._service.get_provider_name(league) == "tsdb"
-        events = self._service.get_events(league, target_date, cache_only=is_tsdb)
-        if not events:
+        # Events on target date (fetched and indexed once per league/date)
+        bucket = self._date_bucket(league, target_date, user_tz)
+        if not bucket.league_has_events:
             return MatchOutcome.failed(
                 FailedReason.NO_EVENT_CARD_MATCH,
                 stream_name=ctx.stream_name,
@@ -130,10 +178,7 @@ class EventCardMatcher:
                 detail=f"No {league} events for {target_date}",
             )
 
-        # Filter to events on target date
-        date_events = [e for e in events if e.start_time.astimezone(user_tz).date() == target_date]
-
-        if not date_events:
+        if not bucket.candidates:
             return MatchOutcome.failed(
                 FailedReason.NO_EVENT_CARD_MATCH,
                 stream_name=ctx.stream_name,
@@ -142,7 +187,7 @@ class EventCardMatcher:
             )
 
         # Try to match
-        result = self._match_to_event_card(ctx, date_events, league)
+        result = self._match_to_event_card(ctx, bucket, league)
 
         # Cache successful matches
         if result.is_matched and result.event:
@@ -154,6 +199,31 @@ class EventCardMatcher:
     # PRIVATE METHODS
     # =========================================================================
 
+    def _date_bucket(
+        self, league: str, target_date: date, user_tz: ZoneInfo
+    ) -> EventCardDateBucket:
+        """Get the indexed events of a league on a local date."""
+        key = (league, target_date, user_tz)
+        bucket = self._date_index.get(key)
+        if bucket is not None:
+            return bucket
+
+        # Get events for this league (TSDB leagues use cache-only)
+        is_tsdb = self._service.get_provider_name(league) == "tsdb"
+        events = self._service.get_events(league, target_date, cache_only=is_tsdb)
+
+        bucket = EventCardDateBucket(league_has_events=bool(events))
+        for event in events:
+            if event.start_time.astimezone(user_tz).date() != target_date:
+                continue
+            candidate = EventCardCandidate.from_event(event)
+            for token in candidate.name_tokens:
+                bucket.token_index.setdefault(token, []).append(len(bucket.candidates))
+            bucket.candidates.append(candidate)
+
+        self._date_index[key] = bucket
+        return bucket
+
     def _check_cache(self, ctx: EventMatchContext) -> MatchOutcome | None:
         """Check cache for existing match."""
         entry = self._cache.get(ctx.group_id, ctx.stream_id, ctx.stream_name)
@@ -192,32 +262,38 @@ class EventCardMatcher:
     def _match_to_event_card(
         self,
         ctx: EventMatchContext,
-        events: list[Event],
+        bucket: EventCardDateBucket,
         league: str,
     ) -> MatchOutcome:
         """Match stream to an event card."""
         stream_lower = ctx.stream_name.lower()
         event_hint = ctx.classified.event_hint
+        candidates = bucket.candidates
 
-        # Strategy 1: Match by event number (UFC 315)
+        # Strategy 1: Match by event number (UFC 315) - resolved once per hint
         if event_hint:
             event_num = self._extract_event_number(event_hint)
             if event_num:
-                for event in events:
-                    if event_num.lower() in event.name.lower():
-                        logger.debug(
-                            "[MATCHED] event_card stream=%s -> %s (method=event_number)",
-                            ctx.stream_name[:40],
-                            event.name,
-                        )
-                        return MatchOutcome.matched(
-                            MatchMethod.KEYWORD,
-                            event,
-                            detected_league=league,
-                            confidence=1.0,
-                            stream_name=ctx.stream_name,
-                            stream_id=ctx.stream_id,
-                        )
+                memo_key = (league, ctx.target_date, ctx.user_tz, event_num.lower())
+                if memo_key not in self._hint_memo:
+                    self._hint_memo[memo_key] = next(
+                        (c.event for c in candidates if memo_key[3] in c.name_lower), None
+                    )
+                event = self._hint_memo[memo_key]
+                if event:
+                    logger.debug(
+                        "[MATCHED] event_card stream=%s -> %s (method=event_number)",
+                        ctx.stream_name[:40],
+                        event.name,
+                    )
+                    return MatchOutcome.matched(
+                        MatchMethod.KEYWORD,
+                        event,
+                        detected_league=league,
+                        confidence=1.0,
+                        stream_name=ctx.stream_name,
+                        stream_id=ctx.stream_id,
+                    )
 
         # Strategy 2: Keyword matching
         keywords = EVENT_CARD_KEYWORDS.get(league, [])
@@ -230,15 +306,15 @@ class EventCardMatcher:
         # If we have event-specific keywords, we're confident
         if keyword_matches:
             # For single events on the date, just return it
-            if len(events) == 1:
+            if len(candidates) == 1:
                 logger.debug(
                     "[MATCHED] event_card stream=%s -> %s (method=keyword, single event)",
                     ctx.stream_name[:40],
-                    events[0].name,
+                    candidates[0].event.name,
                 )
                 return MatchOutcome.matched(
                     MatchMethod.KEYWORD,
-                    events[0],
+                    candidates[0].event,
                     detected_league=league,
                     confidence=0.9,
                     stream_name=ctx.stream_name,
@@ -246,63 +322,48 @@ class EventCardMatcher:
                 )
 
             # Multiple events - try to narrow down
-            # Check if any event name matches stream content
-            for event in events:
-                event_name_lower = event.name.lower()
-                # Check if event name words appear in stream
-                event_words = set(event_name_lower.split())
-                stream_words = set(stream_lower.split())
-                overlap = event_words & stream_words
-                if len(overlap) >= 2:  # At least 2 matching words
+            # Check if event name words appear in stream (at least 2 matching words)
+            event = bucket.first_with_overlap(set(stream_lower.split()), min_overlap=2)
+            if event:
+                logger.debug(
+                    "[MATCHED] event_card stream=%s -> %s (method=keyword, word overlap)",
+                    ctx.stream_name[:40],
+                    event.name,
+                )
+                return MatchOutcome.matched(
+                    MatchMethod.KEYWORD,
+                    event,
+                    detected_league=league,
+                    confidence=0.85,
+                    stream_name=ctx.stream_name,
+                    stream_id=ctx.stream_id,
+                )
+
+        # Strategy 3: Fighter name matching (fallback)
+        # Last names are more reliable than full names
+        for candidate in candidates:
+            for last_name in candidate.fighter_last_names:
+                if last_name in stream_lower:
                     logger.debug(
-                        "[MATCHED] event_card stream=%s -> %s (method=keyword, word overlap)",
+                        "[MATCHED] event_card stream=%s -> %s (method=fighter_name, '%s')",
                         ctx.stream_name[:40],
-                        event.name,
+                        candidate.event.name,
+                        last_name,
                     )
                     return MatchOutcome.matched(
-                        MatchMethod.KEYWORD,
-                        event,
+                        MatchMethod.FUZZY,
+                        candidate.event,
                         detected_league=league,
-                        confidence=0.85,
+                        confidence=0.75,
                         stream_name=ctx.stream_name,
                         stream_id=ctx.stream_id,
                     )
 
-        # Strategy 3: Fighter name matching (fallback)
-        # Try to find fighter names in stream
-        for event in events:
-            home_name = event.home_team.name.lower() if event.home_team else ""
-            away_name = event.away_team.name.lower() if event.away_team else ""
-
-            # Check for last names (more reliable)
-            home_parts = home_name.split()
-            away_parts = away_name.split()
-
-            # Try last name first, then full name
-            for parts in [home_parts, away_parts]:
-                if len(parts) >= 1:
-                    last_name = parts[-1]
-                    if len(last_name) >= 4 and last_name in stream_lower:
-                        logger.debug(
-                            "[MATCHED] event_card stream=%s -> %s (method=fighter_name, '%s')",
-                            ctx.stream_name[:40],
-                            event.name,
-                            last_name,
-                        )
-                        return MatchOutcome.matched(
-                            MatchMethod.FUZZY,
-                            event,
-                            detected_league=league,
-                            confidence=0.75,
-                            stream_name=ctx.stream_name,
-                            stream_id=ctx.stream_id,
-                        )
-
         # No match found
         logger.debug(
             "[FAILED] event_card stream=%s: no match in %d events for %s",
             ctx.stream_name[:40],
-            len(events),
+            len(candidates),
             league,
         )
         return MatchOutcome.failed(
@@ -27,6 +27,7 @@ from datetime import date, timedelta
 from zoneinfo import ZoneInfo
 
 from teamarr.config import get_user_timezone
+from teamarr.consumers.matching.alias_index import AliasIndex
 from teamarr.consumers.matching.classifier import (
     ClassifiedStream,
     CustomRegexConfig,
@@ -35,6 +36,12 @@ from teamarr.consumers.matching.classifier import (
 )
 from teamarr.consumers.matching.constants import MATCH_WINDOW_DAYS
 from teamarr.consumers.matching.event_matcher import EventCardMatcher
+from teamarr.consumers.matching.parallel import (
+    MATCH_WORKERS,
+    MatchSnapshot,
+    match_streams_parallel,
+    match_workers_for,
+)
 from teamarr.consumers.matching.result import (
     FilteredReason,
     MatchMethod,
@@ -42,6 +49,7 @@ from teamarr.consumers.matching.result import (
     ResultAggregator,
 )
 from teamarr.consumers.matching.team_matcher import TeamMatcher
+from teamarr.consumers.stream_manifest import StreamManifest, compute_config_hash
 from teamarr.consumers.stream_match_cache import (
     StreamMatchCache,
     get_generation_counter,
@@ -104,6 +112,7 @@ class BatchMatchResult:
     # Cache stats
     cache_hits: int = 0
     cache_misses: int = 0
+    manifest_reused: int = 0  # Unchanged streams served from the stream manifest
 
     # Aggregated stats
     aggregator: ResultAggregator = field(default_factory=ResultAggregator)
@@ -168,6 +177,8 @@ class StreamMatcher:
         custom_regex_league_enabled: bool = False,
         days_ahead: int | None = None,
         shared_events: dict[str, tuple[list[Event], bool]] | None = None,
+        match_workers: int | None = None,
+        alias_index: AliasIndex | None = None,
     ):
         """Initialize the matcher.
 
@@ -194,6 +205,9 @@ class StreamMatcher:
                            across multiple matchers in a single generation run.
                            Values are (events, was_cache_only) tuples where was_cache_only
                            indicates if the result came from a cache-only lookup.
+            match_workers: Worker processes for multi-league team matching
+                           (None = MATCH_WORKERS env var, 0/1 = serial)
+            alias_index: Shared team alias tables (loaded per matcher if None)
         """
         self._service = service
         self._db_factory = db_factory
@@ -245,7 +259,11 @@ class StreamMatcher:
 
         # Initialize sub-matchers
         self._team_matcher = TeamMatcher(
-            service, self._cache, days_ahead=self._days_ahead, db_factory=db_factory
+            service,
+            self._cache,
+            days_ahead=self._days_ahead,
+            db_factory=db_factory,
+            alias_index=alias_index,
         )
         self._event_matcher = EventCardMatcher(service, self._cache)
 
@@ -255,6 +273,7 @@ class StreamMatcher:
         # Shared events cache (cross-matcher in a single generation run)
         # Keys are "league:date" strings, values are (events, was_cache_only) tuples
         self._shared_events = shared_events
+        self._match_workers = MATCH_WORKERS if match_workers is None else match_workers
 
         # Prefetched events (populated in match_all for multi-league matching)
         self._prefetched_events: dict[str, list[Event]] | None = None
@@ -305,35 +324,78 @@ class StreamMatcher:
             include_leagues=list(self._include_leagues),
         )
 
+        # Delta sync: diff against last run's manifest so unchanged streams
+        # with name-only outcomes skip classification and matching
+        manifest = StreamManifest.load(self._db_factory, self._group_id, self._config_hash())
+        diff = manifest.diff(streams)
+        logger.debug(
+            "[MANIFEST] Group %d: %d added, %d renamed, %d removed, %d unchanged",
+            self._group_id,
+            len(diff.added),
+            len(diff.renamed),
+            len(diff.removed),
+            len(diff.unchanged),
+        )
+        manifest_rows: list[dict] = []
+
+        # Parallel mode: match all non-manifest streams up front (multi-league only).
+        # Workers have no service, so they need prefetched events to match against.
+        precomputed: dict[int, MatchedStreamResult] = {}
+        if self._prefetched_events:
+            pending = [
+                (idx, stream.get("id", 0), stream.get("name", ""))
+                for idx, stream in enumerate(streams, 1)
+                if manifest.reusable_result(stream.get("id", 0), stream.get("name", "")) is None
+            ]
+            workers = match_workers_for(len(pending), self._match_workers)
+            if workers:
+                precomputed = self._match_parallel(pending, target_date, workers)
+
         total_streams = len(streams)
         for idx, stream in enumerate(streams, 1):
             stream_id = stream.get("id", 0)
             stream_name = stream.get("name", "")
 
-            match_result = self._match_single(
-                stream_id=stream_id,
-                stream_name=stream_name,
-                target_date=target_date,
-            )
-
-            # Track cache stats
-            if match_result.from_cache:
-                result.cache_hits += 1
+            reusable = manifest.reusable_result(stream_id, stream_name)
+            if reusable is not None:
+                match_result = self._result_from_manifest(stream_id, stream_name, reusable)
+                result.manifest_reused += 1
             else:
-                result.cache_misses += 1
+                match_result = precomputed.get(idx) or self._match_single(
+                    stream_id=stream_id,
+                    stream_name=stream_name,
+                    target_date=target_date,
+                )
+
+                # Track cache stats
+                if match_result.from_cache:
+                    result.cache_hits += 1
+                else:
+                    result.cache_misses += 1
 
             result.results.append(match_result)
+            manifest_rows.append(
+                {
+                    "stream_id": stream_id,
+                    "stream_name": stream_name,
+                    "result": self._manifest_summary(match_result),
+                }
+            )
 
             # Report per-stream progress
             if progress_callback:
                 progress_callback(idx, total_streams, stream_name, match_result.matched)
 
+        manifest.save(manifest_rows, self._generation)
+
         logger.info(
-            "[COMPLETED] Stream matching: %d/%d matched (%d included), cache_hit_rate=%.1f%%",
+            "[COMPLETED] Stream matching: %d/%d matched (%d included), cache_hit_rate=%.1f%%, "
+            "manifest_reused=%d",
             result.matched_count,
             result.total,
             result.included_count,
             result.cache_hit_rate * 100,
+            result.manifest_reused,
         )
 
         return result
@@ -383,7 +445,7 @@ class StreamMatcher:
                 shared_key = f"{league}:{fetch_date.isoformat()}"
 
                 # Cache-only rules:
-                # - TSDB: always cache-only
+                # - TSDB: always cache-only (served from pre-warmed season schedules)
                 # - Past days: always cache-only
                 # - Future days: only fetch from API for group's configured leagues
                 # - Today: fetch from API for group's leagues, cache for others
@@ -451,8 +513,19 @@ class StreamMatcher:
         # Determine event type from configured leagues
         league_event_type = self._get_dominant_event_type()
 
-        classified = classify_stream(stream_name, league_event_type, self._custom_regex)
+        classified = classify_stream(
+            stream_name, league_event_type, self._custom_regex, target_date
+        )
+        return self._match_classified(stream_id, stream_name, classified, target_date)
 
+    def _match_classified(
+        self,
+        stream_id: int,
+        stream_name: str,
+        classified: ClassifiedStream,
+        target_date: date,
+    ) -> MatchedStreamResult:
+        """Match an already classified stream."""
         # Step 2: Handle placeholders (streams that couldn't be classified)
         # Note: Placeholder pattern detection and unsupported sports filtering
         # is now handled by StreamFilter before streams reach the matcher.
@@ -490,6 +563,86 @@ class StreamMatcher:
             classified=classified,
         )
 
+    def _match_parallel(
+        self,
+        pending: list[tuple[int, int, str]],
+        target_date: date,
+        workers: int,
+    ) -> dict[int, MatchedStreamResult]:
+        """Match streams with team-vs-team fuzzy matching in worker processes.
+
+        Classification, cache lookups, event card matching and cache writes
+        stay in this process; only uncached team-vs-team streams are sent
+        to workers, which match against a snapshot of the prefetched events.
+
+        Args:
+            pending: (position, stream_id, stream_name) for streams to match
+            target_date: Target date for event matching
+            workers: Number of worker processes
+
+        Returns:
+            Results keyed by stream position
+        """
+        league_event_type = self._get_dominant_event_type()
+        results: dict[int, MatchedStreamResult] = {}
+        to_match: list[tuple[int, int, str, ClassifiedStream]] = []
+
+        for idx, stream_id, stream_name in pending:
+            classified = classify_stream(
+                stream_name, league_event_type, self._custom_regex, target_date
+            )
+            if classified.category != StreamCategory.TEAM_VS_TEAM:
+                results[idx] = self._match_classified(
+                    stream_id, stream_name, classified, target_date
+                )
+                continue
+
+            cached = self._team_matcher.cached_outcome(
+                classified, self._group_id, stream_id, target_date, self._generation, self._user_tz
+            )
+            if cached:
+                results[idx] = self._outcome_to_result(cached, stream_id, stream_name, classified)
+            else:
+                to_match.append((idx, stream_id, stream_name, classified))
+
+        if not to_match:
+            return results
+
+        snapshot = MatchSnapshot(
+            enabled_leagues=self._search_leagues,
+            target_date=target_date,
+            group_id=self._group_id,
+            generation=self._generation,
+            user_tz=self._user_tz,
+            days_ahead=self._days_ahead,
+            prefetched_events=self._prefetched_events,
+            alias_index=self._team_matcher.alias_index,
+            sport_durations=self._sport_durations,
+        )
+        outcomes = match_streams_parallel(
+            snapshot,
+            [(stream_id, classified) for _, stream_id, _, classified in to_match],
+            workers,
+        )
+        if outcomes is None:
+            # Pool failed - match_all falls back to serial for missing positions
+            return results
+
+        for (idx, stream_id, stream_name, classified), outcome in zip(
+            to_match, outcomes, strict=True
+        ):
+            self._team_matcher.store_outcome(
+                classified,
+                self._group_id,
+                stream_id,
+                target_date,
+                self._generation,
+                self._user_tz,
+                outcome,
+            )
+            results[idx] = self._outcome_to_result(outcome, stream_id, stream_name, classified)
+        return results
+
     def _match_team_vs_team(
         self,
         classified: ClassifiedStream,
@@ -619,6 +772,58 @@ class StreamMatcher:
             card_segment=classified.card_segment,  # UFC segment from stream name
         )
 
+    def _config_hash(self) -> str:
+        """Hash the config that name-only match outcomes depend on."""
+        return compute_config_hash(
+            {
+                "search_leagues": sorted(self._search_leagues),
+                "include_leagues": sorted(self._include_leagues),
+                "league_event_types": self._league_event_types,
+                "custom_regex": (
+                    {
+                        name: getattr(self._custom_regex, name)
+                        for name in vars(self._custom_regex)
+                        if not name.startswith("_")
+                    }
+                    if self._custom_regex
+                    else None
+                ),
+            }
+        )
+
+    def _manifest_summary(self, match_result: MatchedStreamResult) -> dict:
+        """Summarize a result for the stream manifest (name-derived fields only)."""
+        return {
+            "matched": match_result.matched,
+            "exclusion_reason": match_result.exclusion_reason,
+            "category": match_result.category.value if match_result.category else None,
+            "parsed_team1": match_result.parsed_team1,
+            "parsed_team2": match_result.parsed_team2,
+            "detected_league": match_result.detected_league,
+            "card_segment": match_result.card_segment,
+        }
+
+    def _result_from_manifest(
+        self,
+        stream_id: int,
+        stream_name: str,
+        summary: dict,
+    ) -> MatchedStreamResult:
+        """Rebuild an unmatched result from its stream manifest summary."""
+        category = summary.get("category")
+        return MatchedStreamResult(
+            stream_name=stream_name,
+            stream_id=stream_id,
+            matched=False,
+            included=False,
+            exclusion_reason=summary.get("exclusion_reason"),
+            category=StreamCategory(category) if category else None,
+            parsed_team1=summary.get("parsed_team1"),
+            parsed_team2=summary.get("parsed_team2"),
+            detected_league=summary.get("detected_league"),
+            card_segment=summary.get("card_segment"),
+        )
+
     def _get_dominant_event_type(self) -> str | None:
         """Get the dominant event type from configured leagues."""
         if not self._league_event_types:
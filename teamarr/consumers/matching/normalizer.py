@@ -12,6 +12,7 @@ import logging
 import re
 from dataclasses import dataclass
 from datetime import date, time
+from functools import lru_cache
 
 from unidecode import unidecode
 
@@ -20,7 +21,7 @@ from teamarr.utilities.constants import BROADCAST_NETWORKS, CITY_TRANSLATIONS, P
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class NormalizedStream:
     """Result of stream normalization with extracted metadata."""
 
@@ -121,11 +122,26 @@ def strip_provider_prefix(text: str) -> tuple[str, str | None]:
 # =============================================================================
 
 
+# All translations in one alternation, longest variant first so a variant
+# that contains another (e.g. "sankt peterburg") wins at the same position
+_CITY_PATTERN = re.compile(
+    "|".join(re.escape(v) for v in sorted(CITY_TRANSLATIONS, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
+
+def _translate_city(match: re.Match) -> str:
+    return CITY_TRANSLATIONS[match.group(0).lower()]
+
+
+@lru_cache(maxsize=8192)
 def apply_city_translations(text: str) -> str:
     """Apply city name translations.
 
     First normalizes with unidecode (München → Munchen),
-    then applies manual translations (munchen → munich).
+    then applies manual translations (munchen → munich) in a single
+    regex pass. Results are memoized: the same stream and team names
+    are translated on every group and every run.
 
     Args:
         text: Text containing city names
@@ -140,18 +156,8 @@ def apply_city_translations(text: str) -> str:
     # This converts München → Munchen
     text = unidecode(text)
 
-    # Second pass: apply manual translations
-    # Work on lowercased version for matching, preserve original case pattern
-    result = text
-    text_lower = text.lower()
-
-    for variant, english in CITY_TRANSLATIONS.items():
-        if variant in text_lower:
-            # Find the position and replace preserving some case
-            pattern = re.compile(re.escape(variant), re.IGNORECASE)
-            result = pattern.sub(english, result)
-
-    return result
+    # Second pass: apply manual translations (case-insensitive match)
+    return _CITY_PATTERN.sub(_translate_city, text)
 
 
 # =============================================================================
@@ -183,7 +189,9 @@ TIME_PATTERNS = [
 ]
 
 
-def extract_and_mask_datetime(text: str) -> tuple[str, date | None, time | None]:
+def extract_and_mask_datetime(
+    text: str, today: date | None = None
+) -> tuple[str, date | None, time | None]:
     """Extract date/time from stream name and mask for separator detection.
 
     Masking prevents date components like "12/31" from being mistaken
@@ -191,6 +199,7 @@ def extract_and_mask_datetime(text: str) -> tuple[str, date | None, time | None]
 
     Args:
         text: Stream name
+        today: Reference date for year inference (default: today)
 
     Returns:
         Tuple of (masked text, extracted date, extracted time)
@@ -212,7 +221,7 @@ def extract_and_mask_datetime(text: str) -> tuple[str, date | None, time | None]
         if match:
             is_iso = mask == "DATE_MASK_ISO"
             no_year = mask == "DATE_MASK_NO_YEAR"
-            extracted_date = _parse_date_match(match, is_iso=is_iso, no_year=no_year)
+            extracted_date = _parse_date_match(match, is_iso=is_iso, no_year=no_year, today=today)
             result = re.sub(pattern, " DATE_MASK ", result, count=1, flags=re.IGNORECASE)
             break
 
@@ -230,13 +239,16 @@ def extract_and_mask_datetime(text: str) -> tuple[str, date | None, time | None]
     return result, extracted_date, extracted_time
 
 
-def _parse_date_match(match: re.Match, is_iso: bool = False, no_year: bool = False) -> date | None:
+def _parse_date_match(
+    match: re.Match, is_iso: bool = False, no_year: bool = False, today: date | None = None
+) -> date | None:
     """Parse a date from regex match.
 
     Args:
         match: Regex match object
         is_iso: True if pattern matched ISO format (YYYY-MM-DD)
         no_year: True if pattern matched MM/DD without year (infer year)
+        today: Reference date for year inference (default: today)
     """
     try:
         groups = match.groups()
@@ -264,14 +276,14 @@ def _parse_date_match(match: re.Match, is_iso: bool = False, no_year: bool = Fal
                 day_match = re.search(r"(\d{1,2})", text)
                 if day_match:
                     day = int(day_match.group(1))
-                    return _infer_year_for_date(month_num, day)
+                    return _infer_year_for_date(month_num, day, today)
                 return None
 
         # MM/DD without year - infer year based on proximity to today
         if no_year and len(groups) >= 2:
             month = int(groups[0])
             day = int(groups[1])
-            return _infer_year_for_date(month, day)
+            return _infer_year_for_date(month, day, today)
 
         # Numeric date patterns with year
         if len(groups) >= 3:
@@ -298,7 +310,7 @@ def _parse_date_match(match: re.Match, is_iso: bool = False, no_year: bool = Fal
     return None
 
 
-def _infer_year_for_date(month: int, day: int) -> date | None:
+def _infer_year_for_date(month: int, day: int, today: date | None = None) -> date | None:
     """Infer the year for a MM/DD date based on proximity to today.
 
     For sports streams, prefer dates in the near future over past.
@@ -306,7 +318,7 @@ def _infer_year_for_date(month: int, day: int) -> date | None:
     """
     from datetime import datetime
 
-    today = datetime.now().date()
+    today = today or datetime.now().date()
     current_year = today.year
 
     try:
@@ -365,7 +377,7 @@ def _parse_time_match(match: re.Match) -> time | None:
 # =============================================================================
 
 
-def normalize_stream(stream_name: str) -> NormalizedStream:
+def normalize_stream(stream_name: str, today: date | None = None) -> NormalizedStream:
     """Full normalization pipeline for stream names.
 
     Applies all normalization steps in order:
@@ -377,6 +389,8 @@ def normalize_stream(stream_name: str) -> NormalizedStream:
 
     Args:
         stream_name: Raw stream name from M3U
+        today: Reference date for inferring years of dates like "1/17"
+            (default: today)
 
     Returns:
         NormalizedStream with cleaned text and extracted metadata
@@ -402,7 +416,7 @@ def normalize_stream(stream_name: str) -> NormalizedStream:
     text = apply_city_translations(text)
 
     # Step 4: Extract and mask datetime
-    text, extracted_date, extracted_time = extract_and_mask_datetime(text)
+    text, extracted_date, extracted_time = extract_and_mask_datetime(text, today)
 
     # Step 5: Clean whitespace and normalize
     text = " ".join(text.split())
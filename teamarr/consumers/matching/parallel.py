@@ -0,0 +1,149 @@
+"""Process-pool team matching for large multi-league groups.
+
+Fuzzy scoring a stream against every prefetched event is CPU-bound and
+holds the GIL, so threads don't help. For large multi-league groups
+StreamMatcher can shard team-vs-team streams across worker processes:
+
+- Each worker is initialized once with a read-only MatchSnapshot
+  (prefetched events, alias index, matching parameters)
+- Workers only match (TeamMatcher.match_multi_league with use_cache=False);
+  they never touch the database or providers
+- The parent does cache lookups before and cache writes after, and builds
+  results in stream order, so output is identical to serial matching
+
+Opt-in via the MATCH_WORKERS environment variable (default 0 = serial).
+Groups smaller than PARALLEL_MIN_STREAMS pending streams stay serial since
+worker startup would dominate.
+"""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from datetime import date
+from pickle import PicklingError
+from zoneinfo import ZoneInfo
+
+from teamarr.consumers.matching.alias_index import AliasIndex
+from teamarr.consumers.matching.classifier import ClassifiedStream
+from teamarr.consumers.matching.result import MatchOutcome
+from teamarr.consumers.matching.team_matcher import TeamMatcher
+from teamarr.core import Event
+
+logger = logging.getLogger(__name__)
+
+MATCH_WORKERS = int(os.environ.get("MATCH_WORKERS", 0) or 0)
+PARALLEL_MIN_STREAMS = 200
+
+# Batches per worker: small enough to balance uneven streams, large enough
+# to amortize pickling
+BATCHES_PER_WORKER = 4
+
+
+@dataclass
+class MatchSnapshot:
+    """Read-only matching state shipped to each worker process."""
+
+    enabled_leagues: list[str]
+    target_date: date
+    group_id: int
+    generation: int
+    user_tz: ZoneInfo
+    days_ahead: int
+    prefetched_events: dict[str, list[Event]]
+    alias_index: AliasIndex = field(default_factory=AliasIndex)
+    sport_durations: dict[str, float] = field(default_factory=dict)
+
+
+# Worker process state (set by _init_worker)
+_worker_snapshot: MatchSnapshot | None = None
+_worker_matcher: TeamMatcher | None = None
+
+
+def _init_worker(snapshot: MatchSnapshot) -> None:
+    global _worker_snapshot, _worker_matcher
+    _worker_snapshot = snapshot
+    _worker_matcher = TeamMatcher.from_index(snapshot.alias_index, snapshot.days_ahead)
+
+
+def _match_batch(batch: list[tuple[int, ClassifiedStream]]) -> list[MatchOutcome]:
+    snapshot = _worker_snapshot
+    return [
+        _worker_matcher.match_multi_league(
+            classified=classified,
+            enabled_leagues=snapshot.enabled_leagues,
+            target_date=snapshot.target_date,
+            group_id=snapshot.group_id,
+            stream_id=stream_id,
+            generation=snapshot.generation,
+            user_tz=snapshot.user_tz,
+            sport_durations=snapshot.sport_durations,
+            prefetched_events=snapshot.prefetched_events,
+            use_cache=False,
+        )
+        for stream_id, classified in batch
+    ]
+
+
+def match_workers_for(pending_streams: int, workers: int = MATCH_WORKERS) -> int:
+    """Number of worker processes to use (0 = match serially)."""
+    if workers <= 1 or pending_streams < PARALLEL_MIN_STREAMS:
+        return 0
+    return min(workers, os.cpu_count() or 1)
+
+
+def match_streams_parallel(
+    snapshot: MatchSnapshot,
+    streams: list[tuple[int, ClassifiedStream]],
+    workers: int,
+) -> list[MatchOutcome] | None:
+    """Match classified team-vs-team streams across worker processes.
+
+    Args:
+        snapshot: Matching state for the workers
+        streams: (stream_id, classified) pairs, uncached team-vs-team streams
+        workers: Number of worker processes
+
+    Returns:
+        Outcomes in input order, or None if there are no prefetched events
+        or the pool failed (caller falls back to serial matching)
+    """
+    # Workers have no SportsDataService; without prefetched events
+    # match_multi_league would try to fetch through it
+    if not snapshot.prefetched_events:
+        logger.debug("[PARALLEL] No prefetched events, matching serially")
+        return None
+
+    batch_size = max(1, -(-len(streams) // (workers * BATCHES_PER_WORKER)))
+    batches = [streams[i : i + batch_size] for i in range(0, len(streams), batch_size)]
+
+    # spawn, not fork: the parent runs threads (API server, provider pools)
+    # whose held locks would be copied into forked children
+    context = multiprocessing.get_context("spawn")
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(snapshot,),
+        ) as pool:
+            outcomes: list[MatchOutcome] = []
+            for batch_outcomes in pool.map(_match_batch, batches):
+                outcomes.extend(batch_outcomes)
+    except (BrokenProcessPool, OSError, PicklingError) as e:
+        logger.warning("[PARALLEL] Process pool failed, matching serially: %s", e)
+        return None
+    except Exception as e:
+        # Exceptions raised inside a worker are re-raised here by pool.map
+        logger.warning("[PARALLEL] Worker matching failed, matching serially: %s", e)
+        return None
+
+    logger.debug(
+        "[PARALLEL] Matched %d streams with %d workers (%d batches)",
+        len(streams),
+        workers,
+        len(batches),
+    )
+    return outcomes
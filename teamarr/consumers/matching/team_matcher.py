@@ -15,6 +15,7 @@ from zoneinfo import ZoneInfo
 from rapidfuzz import fuzz
 
 from teamarr.consumers.matching import MATCH_WINDOW_DAYS
+from teamarr.consumers.matching.alias_index import AliasIndex
 from teamarr.consumers.matching.classifier import ClassifiedStream, StreamCategory
 from teamarr.consumers.matching.constants import (
     BOTH_TEAMS_THRESHOLD,
@@ -30,14 +31,10 @@ from teamarr.consumers.matching.result import (
 from teamarr.consumers.stream_match_cache import StreamMatchCache, event_to_cache_data
 from teamarr.core.types import Event, Team
 from teamarr.services.sports_data import SportsDataService
-from teamarr.utilities.constants import TEAM_ALIASES
-from teamarr.utilities.fuzzy_match import get_matcher, normalize_text
+from teamarr.utilities.fuzzy_match import normalize_text
 
 logger = logging.getLogger(__name__)
 
-# Type alias for user-defined aliases: (alias_text, league) -> team_name
-UserAliasCache = dict[tuple[str, str], str]
-
 
 @dataclass
 class MatchContext:
@@ -94,6 +91,7 @@ class TeamMatcher:
         cache: StreamMatchCache,
         db_factory: Any = None,
         days_ahead: int = 3,
+        alias_index: AliasIndex | None = None,
     ):
         """Initialize matcher.
 
@@ -102,32 +100,40 @@ class TeamMatcher:
             cache: Stream match cache
             db_factory: Optional database factory for alias lookups
             days_ahead: Days to look ahead for events (default 3)
+            alias_index: Shared alias tables (loaded from db_factory if None)
         """
         self._service = service
         self._cache = cache
         self._db = db_factory
-        self._fuzzy = get_matcher()
         self._days_ahead = days_ahead
-        # Load user-defined aliases from database
-        # Forward cache: (alias, league) -> canonical
-        self._user_aliases: UserAliasCache = self._load_user_aliases()
-        # Reverse cache: alias -> [(canonical, league), ...]
-        # Enables finding canonical name without knowing league first
-        self._reverse_aliases: dict[str, list[tuple[str, str]]] = self._build_reverse_cache()
+        # Built-in + user-defined aliases with reverse lookup and team patterns
+        self._aliases = alias_index or AliasIndex.load(db_factory)
+
+    @classmethod
+    def from_index(cls, alias_index: AliasIndex, days_ahead: int = 3) -> "TeamMatcher":
+        """Create a cache-less matcher from an alias index snapshot.
+
+        Used by parallel match workers, which only match against prefetched
+        events (match_multi_league with use_cache=False) and have no service,
+        cache or database access.
+        """
+        return cls(service=None, cache=None, days_ahead=days_ahead, alias_index=alias_index)
+
+    @property
+    def alias_index(self) -> AliasIndex:
+        """Alias tables used by this matcher."""
+        return self._aliases
 
     def reload_aliases(self) -> None:
         """Reload aliases from database.
 
         Call this after alias CRUD operations to update the in-memory caches.
-        Rebuilds both the forward cache (alias, league) -> canonical and
-        the reverse cache alias -> [(canonical, league), ...].
         """
-        self._user_aliases = self._load_user_aliases()
-        self._reverse_aliases = self._build_reverse_cache()
+        self._aliases = AliasIndex.load(self._db)
         logger.info(
             "[ALIAS] Reloaded aliases: %d forward, %d reverse entries",
-            len(self._user_aliases),
-            len(self._reverse_aliases),
+            len(self._aliases.user_aliases),
+            len(self._aliases.reverse_aliases),
         )
 
     def match_single_league(
@@ -225,6 +231,7 @@ class TeamMatcher:
         user_tz: ZoneInfo,
         sport_durations: dict[str, float] | None = None,
         prefetched_events: dict[str, list["Event"]] | None = None,
+        use_cache: bool = True,
     ) -> MatchOutcome:
         """Multi-league matching with league hint detection.
 
@@ -248,6 +255,8 @@ class TeamMatcher:
             user_tz: User timezone for date validation
             sport_durations: Sport duration settings for ongoing event detection
             prefetched_events: Optional pre-fetched events by league (for performance)
+            use_cache: Read and write the match cache (False: match only; the
+                caller handles caching, see cached_outcome/store_outcome)
 
         Returns:
             MatchOutcome with result
@@ -259,23 +268,15 @@ class TeamMatcher:
                 stream_id=stream_id,
             )
 
-        ctx = MatchContext(
-            stream_name=classified.normalized.original,
-            stream_id=stream_id,
-            group_id=group_id,
-            target_date=target_date,
-            generation=generation,
-            user_tz=user_tz,
-            classified=classified,
-            team1=classified.team1,
-            team2=classified.team2,
-            sport_durations=sport_durations or {},
+        ctx = self._context(
+            classified, stream_id, group_id, target_date, generation, user_tz, sport_durations
         )
 
         # Check cache first
-        cache_result = self._check_cache(ctx)
-        if cache_result:
-            return cache_result
+        if use_cache:
+            cache_result = self._check_cache(ctx)
+            if cache_result:
+                return cache_result
 
         # Detect league hint (can be single league or list for umbrella brands like EFL)
         league_hint = classified.league_hint
@@ -345,15 +346,67 @@ class TeamMatcher:
                 result = retry_result
 
         # Cache successful matches
-        if result.is_matched and result.event:
+        if use_cache and result.is_matched and result.event:
             self._cache_result(ctx, result)
 
         return result
 
+    def cached_outcome(
+        self,
+        classified: ClassifiedStream,
+        group_id: int,
+        stream_id: int,
+        target_date: date,
+        generation: int,
+        user_tz: ZoneInfo,
+    ) -> MatchOutcome | None:
+        """Cache lookup half of match_multi_league (for matching done elsewhere)."""
+        ctx = self._context(classified, stream_id, group_id, target_date, generation, user_tz)
+        return self._check_cache(ctx)
+
+    def store_outcome(
+        self,
+        classified: ClassifiedStream,
+        group_id: int,
+        stream_id: int,
+        target_date: date,
+        generation: int,
+        user_tz: ZoneInfo,
+        result: MatchOutcome,
+    ) -> None:
+        """Cache write half of match_multi_league (for matching done elsewhere)."""
+        if result.is_matched and result.event:
+            ctx = self._context(classified, stream_id, group_id, target_date, generation, user_tz)
+            self._cache_result(ctx, result)
+
     # =========================================================================
     # PRIVATE METHODS
     # =========================================================================
 
+    def _context(
+        self,
+        classified: ClassifiedStream,
+        stream_id: int,
+        group_id: int,
+        target_date: date,
+        generation: int,
+        user_tz: ZoneInfo,
+        sport_durations: dict[str, float] | None = None,
+    ) -> MatchContext:
+        """Build the matching context for a classified stream."""
+        return MatchContext(
+            stream_name=classified.normalized.original,
+            stream_id=stream_id,
+            group_id=group_id,
+            target_date=target_date,
+            generation=generation,
+            user_tz=user_tz,
+            classified=classified,
+            team1=classified.team1,
+            team2=classified.team2,
+            sport_durations=sport_durations or {},
+        )
+
     def _check_cache(self, ctx: MatchContext) -> MatchOutcome | None:
         """Check cache for existing match.
 
@@ -812,20 +865,7 @@ class TeamMatcher:
         Returns:
             Canonical team name if alias found, None otherwise
         """
-        normalized = team_name.lower()
-
-        # First check built-in aliases (league-agnostic)
-        canonical = TEAM_ALIASES.get(normalized)
-        if canonical:
-            return canonical
-
-        # Then check user-defined aliases (league-specific)
-        if league and self._user_aliases:
-            user_canonical = self._lookup_user_alias(normalized, league)
-            if user_canonical:
-                return user_canonical
-
-        return None
+        return self._aliases.resolve(team_name, league)
 
     def _check_alias_match(
         self,
@@ -852,9 +892,9 @@ class TeamMatcher:
         if not team1 and not team2:
             return None
 
-        # Generate patterns for alias checking
-        home_patterns = self._fuzzy.generate_team_patterns(event.home_team)
-        away_patterns = self._fuzzy.generate_team_patterns(event.away_team)
+        # Patterns for alias checking (computed once per team, shared across streams)
+        home_patterns = self._aliases.team_patterns(event.home_team)
+        away_patterns = self._aliases.team_patterns(event.away_team)
 
         # Get event league for user-defined alias lookup
         event_league = event.league
@@ -866,18 +906,18 @@ class TeamMatcher:
         if team1:
             canonical = self._resolve_alias(team1, event_league)
             if canonical:
-                if any(canonical in tp.pattern for tp in home_patterns):
+                if any(canonical in pattern for pattern in home_patterns):
                     team1_match = True
-                elif any(canonical in tp.pattern for tp in away_patterns):
+                elif any(canonical in pattern for pattern in away_patterns):
                     team1_match = True
 
         # Check team2 against aliases (built-in first, then user-defined)
         if team2:
             canonical = self._resolve_alias(team2, event_league)
             if canonical:
-                if any(canonical in tp.pattern for tp in home_patterns):
+                if any(canonical in pattern for pattern in home_patterns):
                     team2_match = True
-                elif any(canonical in tp.pattern for tp in away_patterns):
+                elif any(canonical in pattern for pattern in away_patterns):
                     team2_match = True
 
         # Need both teams to match via alias (if both were extracted)
@@ -891,61 +931,6 @@ class TeamMatcher:
 
         return None
 
-    def _load_user_aliases(self) -> UserAliasCache:
-        """Load user-defined aliases from database into memory cache.
-
-        Aliases are keyed by (alias_text, league) for efficient lookup.
-        Called once at matcher initialization.
-
-        Returns:
-            Dict mapping (alias, league) -> team_name
-        """
-        if not self._db:
-            return {}
-
-        try:
-            from teamarr.database.aliases import list_aliases
-
-            with self._db() as conn:
-                aliases = list_aliases(conn)
-
-            cache: UserAliasCache = {}
-            for alias in aliases:
-                # Key by (normalized alias, normalized league)
-                key = (alias.alias.lower(), alias.league.lower())
-                cache[key] = alias.team_name.lower()
-
-            if cache:
-                logger.debug("[ALIAS] Loaded %d user-defined aliases from database", len(cache))
-            return cache
-
-        except Exception as e:
-            logger.warning("[ALIAS] Failed to load user aliases from database: %s", e)
-            return {}
-
-    def _build_reverse_cache(self) -> dict[str, list[tuple[str, str]]]:
-        """Build reverse alias lookup: alias_text -> [(canonical, league), ...]
-
-        Enables finding canonical name without knowing league first.
-        This is critical for multi-league groups where the classifier can't
-        detect the league from the stream name.
-
-        Returns:
-            Dict mapping normalized alias to list of (canonical_name, league) tuples
-        """
-        reverse: dict[str, list[tuple[str, str]]] = {}
-        for (alias, league), canonical in self._user_aliases.items():
-            if alias not in reverse:
-                reverse[alias] = []
-            reverse[alias].append((canonical, league))
-
-        if reverse:
-            logger.debug(
-                "[ALIAS] Built reverse cache with %d unique aliases",
-                len(reverse),
-            )
-        return reverse
-
     def _reverse_resolve_alias(self, team_name: str) -> list[tuple[str, str | None]]:
         """Resolve team name to ALL canonical forms via reverse lookup.
 
@@ -960,23 +945,7 @@ class TeamMatcher:
             List of (canonical_name, league) tuples. League is None for built-in aliases.
             Empty list if no alias found.
         """
-        if not team_name:
-            return []
-
-        results: list[tuple[str, str | None]] = []
-        normalized = team_name.lower()
-
-        # Check built-in aliases first (already league-agnostic)
-        canonical = TEAM_ALIASES.get(normalized)
-        if canonical:
-            results.append((canonical, None))
-
-        # Check reverse cache - returns ALL leagues where this alias exists
-        if self._reverse_aliases:
-            matches = self._reverse_aliases.get(normalized, [])
-            results.extend(matches)
-
-        return results
+        return self._aliases.reverse_resolve(team_name)
 
     def _try_reverse_alias_match(
         self,
@@ -1086,11 +1055,7 @@ class TeamMatcher:
         Returns:
             Canonical team name if alias found, None otherwise
         """
-        if not self._user_aliases:
-            return None
-
-        key = (team_name.lower(), league.lower())
-        return self._user_aliases.get(key)
+        return self._aliases.lookup_user_alias(team_name, league)
 
     def _disambiguate_by_time(
         self,
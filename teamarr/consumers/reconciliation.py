@@ -105,6 +105,37 @@ class ReconciliationResult:
         }
 
 
+@dataclass
+class _ReconciliationSnapshot:
+    """Point-in-time view of both sides, indexed for O(1) lookups.
+
+    Built once per reconcile() so detectors never go back to the API or DB.
+    """
+
+    dispatcharr_channels: list = field(default_factory=list)
+    managed_all: list = field(default_factory=list)
+    managed_in_scope: list = field(default_factory=list)
+    duplicate_modes: dict[int, str | None] = field(default_factory=dict)
+    # False if the Dispatcharr listing failed part-way: absent channels may
+    # still exist, so Teamarr orphans can't be detected
+    dispatcharr_complete: bool = True
+
+    # Indexes (built in __post_init__)
+    dispatcharr_by_id: dict[int, Any] = field(default_factory=dict)
+    managed_dispatcharr_ids: set[int] = field(default_factory=set)
+    managed_uuids: set[str] = field(default_factory=set)
+
+    def __post_init__(self) -> None:
+        for ch in self.dispatcharr_channels:
+            self.dispatcharr_by_id[ch.id] = ch
+
+        for mc in self.managed_all:
+            if mc.dispatcharr_channel_id:
+                self.managed_dispatcharr_ids.add(mc.dispatcharr_channel_id)
+            if mc.dispatcharr_uuid:
+                self.managed_uuids.add(mc.dispatcharr_uuid)
+
+
 # =============================================================================
 # RECONCILER
 # =============================================================================
@@ -178,20 +209,30 @@ class ChannelReconciler:
 
         try:
             with self._db_factory() as conn:
+                # One bulk read from each side, then pure in-memory detection
+                snapshot = self._take_snapshot(conn, group_ids)
+
+                if not snapshot.dispatcharr_complete:
+                    result.errors.append(
+                        "Dispatcharr channel listing incomplete - orphan detection skipped"
+                    )
+
+                # Steps 1, 3, 4: orphans (Teamarr), duplicates and drift in one pass
+                teamarr_orphans, duplicates, drift_issues = self._scan_managed_channels(
+                    conn, snapshot
+                )
+
                 # Step 1: Detect orphans (Teamarr records without Dispatcharr channels)
-                teamarr_orphans = self._detect_orphan_teamarr(conn, group_ids)
                 result.issues_found.extend(teamarr_orphans)
 
                 # Step 2: Detect orphans (Dispatcharr channels without Teamarr records)
-                dispatcharr_orphans = self._detect_orphan_dispatcharr(conn, group_ids)
+                dispatcharr_orphans = self._detect_orphan_dispatcharr(snapshot)
                 result.issues_found.extend(dispatcharr_orphans)
 
                 # Step 3: Detect duplicates
-                duplicates = self._detect_duplicates(conn, group_ids)
                 result.issues_found.extend(duplicates)
 
                 # Step 4: Detect drift (setting mismatches)
-                drift_issues = self._detect_drift(conn, group_ids)
                 result.issues_found.extend(drift_issues)
 
                 # Step 5: Apply fixes if auto_fix is enabled
@@ -211,44 +252,89 @@ class ChannelReconciler:
         result.completed_at = datetime.now()
         return result
 
-    def _detect_orphan_teamarr(
+    def _take_snapshot(
         self,
         conn: Connection,
         group_ids: list[int] | None = None,
-    ) -> list[ReconciliationIssue]:
-        """Detect Teamarr records that have no corresponding Dispatcharr channel.
+    ) -> _ReconciliationSnapshot:
+        """Load Dispatcharr channels and managed_channels once and index them."""
+        from teamarr.database.channels import get_all_managed_channels
 
-        These are channels that were created but may have been deleted externally,
-        or where creation partially failed.
-        """
-        from teamarr.database.channels import (
-            get_all_managed_channels,
-            get_managed_channels_for_group,
-            update_managed_channel,
-        )
+        with self._dispatcharr_lock:
+            dispatcharr_channels = self._channel_manager.get_all_channels_strict()
+        complete = dispatcharr_channels is not None
+        if not complete:
+            logger.warning(
+                "[RECONCILE] Dispatcharr channel listing failed part-way, skipping orphan checks"
+            )
+            dispatcharr_channels = []
 
-        issues = []
+        managed = get_all_managed_channels(conn, include_deleted=False)
+
+        duplicate_modes = {
+            row["id"]: row["duplicate_event_handling"]
+            for row in conn.execute("SELECT id, duplicate_event_handling FROM event_epg_groups")
+        }
 
-        # Get managed channels
+        snapshot = _ReconciliationSnapshot(
+            dispatcharr_channels=dispatcharr_channels,
+            managed_all=managed,
+            duplicate_modes=duplicate_modes,
+            dispatcharr_complete=complete,
+        )
         if group_ids:
-            channels = []
-            for gid in group_ids:
-                channels.extend(get_managed_channels_for_group(conn, gid))
+            scope = set(group_ids)
+            snapshot.managed_in_scope = [c for c in managed if c.event_epg_group_id in scope]
         else:
-            channels = get_all_managed_channels(conn, include_deleted=False)
+            snapshot.managed_in_scope = managed
+
+        logger.debug(
+            "[RECONCILE] Snapshot: %d Dispatcharr channels, %d managed (%d in scope)",
+            len(dispatcharr_channels),
+            len(managed),
+            len(snapshot.managed_in_scope),
+        )
+        return snapshot
+
+    def _scan_managed_channels(
+        self,
+        conn: Connection,
+        snapshot: _ReconciliationSnapshot,
+    ) -> tuple[list[ReconciliationIssue], list[ReconciliationIssue], list[ReconciliationIssue]]:
+        """Single pass over in-scope managed channels.
+
+        Detects:
+        - Orphans (Teamarr): record points at a channel missing from Dispatcharr.
+          These may have been deleted externally, or creation partially failed.
+        - Duplicates: multiple channels for the same event within a group.
+          Can happen if duplicate_event_handling changed from 'separate' to
+          'consolidate', a creation bug, or manual channel creation.
+        - Drift: tvg_id or channel group differs from Dispatcharr's state.
+
+        Returns:
+            Tuple of (orphan issues, duplicate issues, drift issues)
+        """
+        from teamarr.database.channels import update_managed_channel
+
+        orphans: list[ReconciliationIssue] = []
+        drift: list[ReconciliationIssue] = []
+        by_event: dict[tuple[str, int], list] = {}
+
+        for channel in snapshot.managed_in_scope:
+            if channel.event_id:
+                by_event.setdefault((channel.event_id, channel.event_epg_group_id), []).append(
+                    channel
+                )
 
-        for channel in channels:
             if not channel.dispatcharr_channel_id:
                 continue
 
-            # Check if channel exists in Dispatcharr
-            with self._dispatcharr_lock:
-                dispatcharr_channel = self._channel_manager.get_channel(
-                    channel.dispatcharr_channel_id
-                )
+            dispatcharr_channel = snapshot.dispatcharr_by_id.get(channel.dispatcharr_channel_id)
 
             if not dispatcharr_channel:
-                issues.append(
+                if not snapshot.dispatcharr_complete:
+                    continue
+                orphans.append(
                     ReconciliationIssue(
                         issue_type="orphan_teamarr",
                         severity="warning",
@@ -266,205 +352,21 @@ class ChannelReconciler:
                         auto_fixable=self._settings.get("auto_fix_orphan_teamarr", True),
                     )
                 )
-            else:
-                # Channel exists - backfill UUID if we don't have it
-                if not channel.dispatcharr_uuid and dispatcharr_channel.uuid:
-                    update_managed_channel(
-                        conn,
-                        channel.id,
-                        {"dispatcharr_uuid": dispatcharr_channel.uuid},
-                    )
-                    logger.debug(
-                        "[RECONCILE] Backfilled UUID for channel '%s': %s",
-                        channel.channel_name,
-                        dispatcharr_channel.uuid,
-                    )
-
-        if issues:
-            logger.info("[ORPHAN_TEAMARR] Found %d orphan(s)", len(issues))
-
-        return issues
-
-    def _detect_orphan_dispatcharr(
-        self,
-        conn: Connection,
-        group_ids: list[int] | None = None,
-    ) -> list[ReconciliationIssue]:
-        """Detect Dispatcharr channels with teamarr-* tvg_id that aren't tracked.
-
-        These are channels that may have been created manually or where
-        Teamarr's database record was lost.
-        """
-        issues = []
-
-        # Get all channels from Dispatcharr
-        with self._dispatcharr_lock:
-            all_channels = self._channel_manager.get_channels()
-
-        # Build sets of known identifiers from managed_channels
-        cursor = conn.execute(
-            """SELECT dispatcharr_channel_id, dispatcharr_uuid
-               FROM managed_channels WHERE deleted_at IS NULL"""
-        )
-        rows = cursor.fetchall()
-        known_channel_ids = {row[0] for row in rows if row[0]}
-        known_uuids = {row[1] for row in rows if row[1]}
-
-        for channel in all_channels:
-            channel_id = channel.id
-            channel_uuid = channel.uuid
-            tvg_id = channel.tvg_id or ""
-
-            # Check if this is a Teamarr channel
-            is_ours_by_uuid = channel_uuid and channel_uuid in known_uuids
-            is_ours_by_id = channel_id in known_channel_ids
-            has_teamarr_tvg_id = tvg_id.startswith("teamarr-event-")
-
-            # If we know this channel, it's not orphaned
-            if is_ours_by_uuid or is_ours_by_id:
                 continue
 
-            # If it has our tvg_id pattern but we don't have a record, it's orphaned
-            if has_teamarr_tvg_id:
-                event_id = tvg_id.replace("teamarr-event-", "")
-
-                issues.append(
-                    ReconciliationIssue(
-                        issue_type="orphan_dispatcharr",
-                        severity="warning",
-                        dispatcharr_channel_id=channel_id,
-                        dispatcharr_uuid=channel_uuid,
-                        channel_name=channel.name,
-                        event_id=event_id,
-                        details={
-                            "channel_number": channel.channel_number,
-                            "tvg_id": tvg_id,
-                            "streams": list(channel.streams),  # Already int IDs
-                        },
-                        suggested_action="delete_or_adopt",
-                        auto_fixable=self._settings.get("auto_fix_orphan_dispatcharr", False),
-                    )
+            # Channel exists - backfill UUID if we don't have it
+            if not channel.dispatcharr_uuid and dispatcharr_channel.uuid:
+                update_managed_channel(
+                    conn,
+                    channel.id,
+                    {"dispatcharr_uuid": dispatcharr_channel.uuid},
                 )
-
-        if issues:
-            logger.info("[ORPHAN_DISPATCHARR] Found %d orphan(s)", len(issues))
-
-        return issues
-
-    def _detect_duplicates(
-        self,
-        conn: Connection,
-        group_ids: list[int] | None = None,
-    ) -> list[ReconciliationIssue]:
-        """Detect multiple channels for the same event within a group.
-
-        This can happen if:
-        - duplicate_event_handling changed from 'separate' to 'consolidate'
-        - Bug in channel creation
-        - Manual channel creation
-        """
-        issues = []
-
-        # Find events with multiple channels (excluding 'separate' mode groups)
-        query = """
-            SELECT mc.event_id, mc.event_epg_group_id,
-                   eg.duplicate_event_handling,
-                   COUNT(*) as channel_count,
-                   GROUP_CONCAT(mc.id) as channel_ids,
-                   GROUP_CONCAT(mc.channel_name) as channel_names
-            FROM managed_channels mc
-            LEFT JOIN event_epg_groups eg ON mc.event_epg_group_id = eg.id
-            WHERE mc.deleted_at IS NULL
-              AND mc.event_id IS NOT NULL
-        """
-        params: list = []
-        if group_ids:
-            placeholders = ",".join("?" * len(group_ids))
-            query += f" AND mc.event_epg_group_id IN ({placeholders})"
-            params.extend(group_ids)
-
-        query += """
-            GROUP BY mc.event_id, mc.event_epg_group_id
-            HAVING channel_count > 1
-        """
-
-        cursor = conn.execute(query, params)
-        duplicates = [dict(row) for row in cursor.fetchall()]
-
-        for dup in duplicates:
-            # Skip if group is in 'separate' mode (duplicates are expected)
-            if dup.get("duplicate_event_handling") == "separate":
-                continue
-
-            issues.append(
-                ReconciliationIssue(
-                    issue_type="duplicate",
-                    severity="warning",
-                    event_id=dup["event_id"],
-                    details={
-                        "group_id": dup.get("event_epg_group_id"),
-                        "channel_count": dup["channel_count"],
-                        "channel_ids": (
-                            dup.get("channel_ids", "").split(",") if dup.get("channel_ids") else []
-                        ),
-                        "channel_names": (
-                            dup.get("channel_names", "").split(",")
-                            if dup.get("channel_names")
-                            else []
-                        ),
-                        "duplicate_mode": dup.get("duplicate_event_handling"),
-                    },
-                    suggested_action="merge",
-                    auto_fixable=self._settings.get("auto_fix_duplicates", False),
-                )
-            )
-
-        if issues:
-            logger.info("[DUPLICATE] Found %d duplicate event(s)", len(issues))
-
-        return issues
-
-    def _detect_drift(
-        self,
-        conn: Connection,
-        group_ids: list[int] | None = None,
-    ) -> list[ReconciliationIssue]:
-        """Detect channels where Teamarr's expected state differs from Dispatcharr.
-
-        Checks:
-        - Channel number mismatch
-        - tvg_id mismatch
-        - Channel group mismatch
-        - Stream profile mismatch
-        """
-        from teamarr.database.channels import (
-            get_all_managed_channels,
-            get_managed_channels_for_group,
-        )
-
-        issues = []
-
-        # Get managed channels with group config
-        if group_ids:
-            channels = []
-            for gid in group_ids:
-                channels.extend(get_managed_channels_for_group(conn, gid))
-        else:
-            channels = get_all_managed_channels(conn, include_deleted=False)
-
-        for channel in channels:
-            if not channel.dispatcharr_channel_id:
-                continue
-
-            # Get current state from Dispatcharr
-            with self._dispatcharr_lock:
-                dispatcharr_channel = self._channel_manager.get_channel(
-                    channel.dispatcharr_channel_id
+                logger.debug(
+                    "[RECONCILE] Backfilled UUID for channel '%s': %s",
+                    channel.channel_name,
+                    dispatcharr_channel.uuid,
                 )
 
-            if not dispatcharr_channel:
-                continue  # Will be caught by orphan detection
-
             drift_fields = []
 
             # Note: channel_number drift is not checked here because it's
@@ -493,7 +395,7 @@ class ChannelReconciler:
                 )
 
             if drift_fields:
-                issues.append(
+                drift.append(
                     ReconciliationIssue(
                         issue_type="drift",
                         severity="info",
@@ -510,8 +412,90 @@ class ChannelReconciler:
                     )
                 )
 
+        duplicates: list[ReconciliationIssue] = []
+        for (event_id, group_id), event_channels in by_event.items():
+            if len(event_channels) < 2:
+                continue
+
+            # Skip if group is in 'separate' mode (duplicates are expected)
+            duplicate_mode = snapshot.duplicate_modes.get(group_id)
+            if duplicate_mode == "separate":
+                continue
+
+            event_channels = sorted(event_channels, key=lambda c: c.id)
+            duplicates.append(
+                ReconciliationIssue(
+                    issue_type="duplicate",
+                    severity="warning",
+                    event_id=event_id,
+                    details={
+                        "group_id": group_id,
+                        "channel_count": len(event_channels),
+                        "channel_ids": [str(c.id) for c in event_channels],
+                        "channel_names": [c.channel_name for c in event_channels],
+                        "duplicate_mode": duplicate_mode,
+                    },
+                    suggested_action="merge",
+                    auto_fixable=self._settings.get("auto_fix_duplicates", False),
+                )
+            )
+
+        if orphans:
+            logger.info("[ORPHAN_TEAMARR] Found %d orphan(s)", len(orphans))
+        if duplicates:
+            logger.info("[DUPLICATE] Found %d duplicate event(s)", len(duplicates))
+        if drift:
+            logger.info("[DRIFT] Found %d channel(s) with drift", len(drift))
+
+        return orphans, duplicates, drift
+
+    def _detect_orphan_dispatcharr(
+        self,
+        snapshot: _ReconciliationSnapshot,
+    ) -> list[ReconciliationIssue]:
+        """Detect Dispatcharr channels with teamarr-* tvg_id that aren't tracked.
+
+        These are channels that may have been created manually or where
+        Teamarr's database record was lost. Known channels are matched against
+        every active managed channel (not just the requested groups).
+        """
+        issues = []
+        known_channel_ids = snapshot.managed_dispatcharr_ids
+        known_uuids = snapshot.managed_uuids
+
+        for channel in snapshot.dispatcharr_channels:
+            tvg_id = channel.tvg_id or ""
+
+            # Only channels with our tvg_id pattern are candidates
+            if not tvg_id.startswith("teamarr-event-"):
+                continue
+
+            # If we know this channel, it's not orphaned
+            if channel.id in known_channel_ids or (channel.uuid and channel.uuid in known_uuids):
+                continue
+
+            event_id = tvg_id.replace("teamarr-event-", "")
+
+            issues.append(
+                ReconciliationIssue(
+                    issue_type="orphan_dispatcharr",
+                    severity="warning",
+                    dispatcharr_channel_id=channel.id,
+                    dispatcharr_uuid=channel.uuid,
+                    channel_name=channel.name,
+                    event_id=event_id,
+                    details={
+                        "channel_number": channel.channel_number,
+                        "tvg_id": tvg_id,
+                        "streams": list(channel.streams),  # Already int IDs
+                    },
+                    suggested_action="delete_or_adopt",
+                    auto_fixable=self._settings.get("auto_fix_orphan_dispatcharr", False),
+                )
+            )
+
         if issues:
-            logger.info("[DRIFT] Found %d channel(s) with drift", len(issues))
+            logger.info("[ORPHAN_DISPATCHARR] Found %d orphan(s)", len(issues))
 
         return issues
 
@@ -0,0 +1,245 @@
+"""Per-group stream manifest for delta stream sync.
+
+Records which streams a group saw on its last run (id, name, fingerprint)
+together with a summary of the result they produced. Each run diffs the
+freshly fetched stream list against the manifest:
+
+    added     - stream_id not in manifest
+    renamed   - stream_id present, fingerprint changed (name changed)
+    removed   - in manifest, not in fetched list
+    unchanged - same stream_id and fingerprint, same matcher config
+
+Unchanged streams whose last result is a pure function of the stream name
+and the group's matcher config (unclassifiable, not an event, league not
+enabled) reuse that result without classification or matching. Streams
+that matched or failed always go through the matcher: their outcome
+depends on provider event data, and matched streams are already served
+by the stream_match_cache fingerprint lookup.
+
+Usage:
+    manifest = StreamManifest.load(get_db, group_id, config_hash)
+    diff = manifest.diff(streams)
+    for stream in streams:
+        reusable = manifest.reusable_result(stream["id"], stream["name"])
+        ...
+    manifest.save(results, generation)
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from teamarr.consumers.stream_match_cache import compute_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Bump when classification/matching rules change in a way that would alter
+# reusable results for an unchanged stream name
+MANIFEST_VERSION = 1
+
+# Exclusion reasons that depend only on the stream name and matcher config
+REUSABLE_EXCLUSIONS = frozenset({"unclassifiable", "not_event", "league_not_included"})
+
+
+def compute_config_hash(config: dict[str, Any]) -> str:
+    """Hash the matcher config that reusable results depend on.
+
+    Args:
+        config: JSON-serializable dict (leagues, event types, custom regex)
+
+    Returns:
+        16-character hex hash
+    """
+    payload = json.dumps({"v": MANIFEST_VERSION, **config}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+@dataclass
+class ManifestEntry:
+    """A stream as recorded on the group's previous run."""
+
+    stream_id: int
+    stream_name: str
+    fingerprint: str
+    config_hash: str
+    result: dict[str, Any] | None = None
+
+
+@dataclass
+class ManifestDiff:
+    """Difference between the fetched stream list and the manifest."""
+
+    added: list[int] = field(default_factory=list)
+    renamed: list[int] = field(default_factory=list)
+    removed: list[int] = field(default_factory=list)
+    unchanged: list[int] = field(default_factory=list)
+
+    @property
+    def changed_count(self) -> int:
+        return len(self.added) + len(self.renamed) + len(self.removed)
+
+
+class StreamManifest:
+    """Persisted per-group stream manifest."""
+
+    def __init__(
+        self,
+        get_connection: Callable,
+        group_id: int,
+        config_hash: str,
+        entries: dict[int, ManifestEntry] | None = None,
+    ):
+        """Initialize manifest.
+
+        Args:
+            get_connection: Function that returns a database connection
+            group_id: Event group ID
+            config_hash: Hash of the current matcher config
+            entries: Previously recorded streams keyed by stream_id
+        """
+        self._get_connection = get_connection
+        self._group_id = group_id
+        self._config_hash = config_hash
+        self._entries = entries or {}
+        self._diff: ManifestDiff | None = None
+
+    @classmethod
+    def load(
+        cls,
+        get_connection: Callable,
+        group_id: int,
+        config_hash: str,
+    ) -> "StreamManifest":
+        """Load the group's manifest with a single query."""
+        entries: dict[int, ManifestEntry] = {}
+        try:
+            with get_connection() as conn:
+                cursor = conn.execute(
+                    """
+                    SELECT stream_id, stream_name, fingerprint, config_hash, result
+                    FROM stream_manifest
+                    WHERE group_id = ?
+                    """,
+                    (group_id,),
+                )
+                for row in cursor.fetchall():
+                    result = None
+                    if row["result"]:
+                        try:
+                            result = json.loads(row["result"])
+                        except json.JSONDecodeError:
+                            result = None
+                    entries[row["stream_id"]] = ManifestEntry(
+                        stream_id=row["stream_id"],
+                        stream_name=row["stream_name"],
+                        fingerprint=row["fingerprint"],
+                        config_hash=row["config_hash"],
+                        result=result,
+                    )
+        except sqlite3.Error as e:
+            logger.warning("[MANIFEST] Load failed for group %d: %s", group_id, e)
+
+        return cls(get_connection, group_id, config_hash, entries)
+
+    def diff(self, streams: list[dict]) -> ManifestDiff:
+        """Diff fetched streams against the manifest.
+
+        Args:
+            streams: Stream dicts with 'id' and 'name' keys
+
+        Returns:
+            ManifestDiff with stream IDs in each bucket
+        """
+        diff = ManifestDiff()
+        seen: set[int] = set()
+
+        for stream in streams:
+            stream_id = stream.get("id", 0)
+            seen.add(stream_id)
+            entry = self._entries.get(stream_id)
+            if entry is None:
+                diff.added.append(stream_id)
+            elif entry.fingerprint != self._fingerprint(stream_id, stream.get("name", "")):
+                diff.renamed.append(stream_id)
+            else:
+                diff.unchanged.append(stream_id)
+
+        diff.removed = [sid for sid in self._entries if sid not in seen]
+        self._diff = diff
+        return diff
+
+    def reusable_result(self, stream_id: int, stream_name: str) -> dict[str, Any] | None:
+        """Get the stored result for an unchanged stream if it can be reused.
+
+        Returns:
+            Stored result dict, or None if the stream must be re-matched
+        """
+        entry = self._entries.get(stream_id)
+        if (
+            entry is None
+            or entry.result is None
+            or entry.config_hash != self._config_hash
+            or entry.fingerprint != self._fingerprint(stream_id, stream_name)
+        ):
+            return None
+
+        if entry.result.get("exclusion_reason") not in REUSABLE_EXCLUSIONS:
+            return None
+        return entry.result
+
+    def save(self, results: list[dict[str, Any]], generation: int) -> None:
+        """Replace the manifest with this run's streams.
+
+        Args:
+            results: Dicts with 'stream_id', 'stream_name' and 'result' keys
+            generation: Current EPG generation counter
+        """
+        rows = [
+            (
+                self._group_id,
+                r["stream_id"],
+                r["stream_name"],
+                self._fingerprint(r["stream_id"], r["stream_name"]),
+                self._config_hash,
+                json.dumps(r["result"]) if r.get("result") is not None else None,
+                generation,
+            )
+            for r in results
+        ]
+        current_ids = {r["stream_id"] for r in results}
+        removed = [(self._group_id, sid) for sid in self._entries if sid not in current_ids]
+
+        try:
+            with self._get_connection() as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO stream_manifest
+                        (group_id, stream_id, stream_name, fingerprint, config_hash,
+                         result, last_seen_generation, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                    ON CONFLICT (group_id, stream_id)
+                    DO UPDATE SET
+                        stream_name = excluded.stream_name,
+                        fingerprint = excluded.fingerprint,
+                        config_hash = excluded.config_hash,
+                        result = excluded.result,
+                        last_seen_generation = excluded.last_seen_generation,
+                        updated_at = CURRENT_TIMESTAMP
+                    """,
+                    rows,
+                )
+                if removed:
+                    conn.executemany(
+                        "DELETE FROM stream_manifest WHERE group_id = ? AND stream_id = ?",
+                        removed,
+                    )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("[MANIFEST] Save failed for group %d: %s", self._group_id, e)
+
+    def _fingerprint(self, stream_id: int, stream_name: str) -> str:
+        return compute_fingerprint(self._group_id, stream_id, stream_name)
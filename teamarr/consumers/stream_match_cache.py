@@ -370,6 +370,11 @@ class StreamMatchCache:
                         cached_json,
                     ),
                 )
+                # Force a re-match on the next run instead of a manifest reuse
+                conn.execute(
+                    "DELETE FROM stream_manifest WHERE group_id = ? AND stream_id = ?",
+                    (group_id, stream_id),
+                )
                 conn.commit()
                 self._stats["user_corrections"] += 1
                 logger.info(
@@ -564,6 +569,8 @@ class StreamMatchCache:
                     (group_id,),
                 )
                 cleared = cursor.rowcount
+                # Drop the delta-sync manifest too so no stored result is reused
+                conn.execute("DELETE FROM stream_manifest WHERE group_id = ?", (group_id,))
                 conn.commit()
                 logger.info("[STREAM_CACHE_CLEAR] group=%d entries=%d", group_id, cleared)
                 return cleared
@@ -581,6 +588,7 @@ class StreamMatchCache:
             with self._get_connection() as conn:
                 cursor = conn.execute("DELETE FROM stream_match_cache")
                 cleared = cursor.rowcount
+                conn.execute("DELETE FROM stream_manifest")
                 conn.commit()
                 logger.info("[STREAM_CACHE_CLEAR] All entries cleared: %d", cleared)
                 return cleared
@@ -253,35 +253,20 @@ class TeamEPGGenerator:
         # EPG end: output_days_ahead from today
         output_cutoff_date = today + timedelta(days=options.output_days_ahead)
 
+        # V1 Parity: Use template custom duration if set
+        template_dict = {
+            "game_duration_mode": options.template.game_duration_mode,
+            "game_duration_override": options.template.game_duration_override,
+        }
+
         programmes = []
         included_events = []  # Track events that generated programmes (for filler)
 
         for i, event in enumerate(sorted_events):
-            # Determine next/last events for suffix resolution
-            # (uses full schedule for accurate .next vars)
-            next_event = sorted_events[i + 1] if i + 1 < len(sorted_events) else None
-            last_event = sorted_events[i - 1] if i > 0 else None
-
-            # Build template context (always build for .next/.last vars)
-            context = self._context_builder.build_for_event(
-                event=event,
-                team_id=team_id,
-                league=league,
-                team_stats=team_stats,
-                next_event=next_event,
-                last_event=last_event,
-            )
-
+            # Filter on window and finality before building any context: the schedule
+            # spans past games and schedule_days_ahead (+7 day buffer), mostly outside
+            # the output window.
             # Calculate when this event's programme would end
-            # V1 Parity: Use template custom duration if set
-            template_dict = (
-                {
-                    "game_duration_mode": options.template.game_duration_mode,
-                    "game_duration_override": options.template.game_duration_override,
-                }
-                if options.template
-                else None
-            )
             duration = get_effective_duration(
                 event.sport,
                 options.sport_durations,
@@ -315,6 +300,21 @@ class TeamEPGGenerator:
             if event_date > output_cutoff_date:
                 continue
 
+            # Determine next/last events for suffix resolution
+            # (uses full schedule for accurate .next vars)
+            next_event = sorted_events[i + 1] if i + 1 < len(sorted_events) else None
+            last_event = sorted_events[i - 1] if i > 0 else None
+
+            # Build template context only for events that become programmes
+            context = self._context_builder.build_for_event(
+                event=event,
+                team_id=team_id,
+                league=league,
+                team_stats=team_stats,
+                next_event=next_event,
+                last_event=last_event,
+            )
+
             # Generate programme with template resolution
             programme = self._event_to_programme(
                 event=event,
@@ -350,9 +350,10 @@ class TeamEPGGenerator:
         programmes.sort(key=lambda p: p.start)
 
         logger.debug(
-            "[COMPLETED] Team EPG: team=%s events=%d programmes=%d filler=%s",
+            "[COMPLETED] Team EPG: team=%s events=%d/%d programmes=%d filler=%s",
             team_id,
             len(included_events),
+            len(sorted_events),
             len(programmes),
             options.filler_enabled,
         )
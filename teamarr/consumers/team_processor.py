@@ -321,7 +321,7 @@ class TeamProcessor:
                     f"Warming TSDB cache ({len(tsdb_leagues)} leagues)...",
                 )
 
-            # Pre-warm TSDB cache for all leagues (2 API calls per league)
+            # Pre-warm TSDB cache for all leagues (season schedules first)
             # This ensures cache hits when processing individual teams
             self._service.prewarm_tsdb_leagues(list(tsdb_leagues))
 
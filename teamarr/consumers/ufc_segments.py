@@ -210,6 +210,7 @@ def disambiguate_prelims_by_time(
     detected_segment: str,
     stream_time: time | None,
     event: Event,
+    local_start_times: dict[str, time] | None = None,
 ) -> str:
     """Disambiguate "prelims" segment based on stream time.
 
@@ -223,12 +224,11 @@ def disambiguate_prelims_by_time(
         detected_segment: Segment detected from stream name ("prelims")
         stream_time: Time extracted from stream name (in local timezone)
         event: UFC Event with segment_times from ESPN (UTC)
+        local_start_times: Precomputed segment_local_start_times(event), if any
 
     Returns:
         Disambiguated segment code
     """
-    from teamarr.utilities.tz import to_user_tz
-
     # Only disambiguate "prelims" - other segments are unambiguous
     if detected_segment != "prelims":
         return detected_segment
@@ -238,16 +238,14 @@ def disambiguate_prelims_by_time(
         return detected_segment
 
     # Need both early_prelims and prelims times for comparison
-    early_prelims_dt = event.segment_times.get("early_prelims")
-    prelims_dt = event.segment_times.get("prelims")
+    if local_start_times is None:
+        local_start_times = segment_local_start_times(event)
+    early_time = local_start_times.get("early_prelims")
+    prelims_time = local_start_times.get("prelims")
 
-    if not early_prelims_dt or not prelims_dt:
+    if not early_time or not prelims_time:
         return detected_segment
 
-    # Convert ESPN datetime (UTC) to user timezone, then extract time
-    early_time = to_user_tz(early_prelims_dt).time()
-    prelims_time = to_user_tz(prelims_dt).time()
-
     # Calculate time differences (in seconds from midnight)
     def time_to_seconds(t: time) -> int:
         return t.hour * 3600 + t.minute * 60 + t.second
@@ -280,6 +278,17 @@ def disambiguate_prelims_by_time(
     return detected_segment
 
 
+def segment_local_start_times(event: Event) -> dict[str, time]:
+    """ESPN segment start times (UTC) as user-timezone times of day."""
+    from teamarr.utilities.tz import to_user_tz
+
+    return {
+        segment: to_user_tz(start).time()
+        for segment, start in (event.segment_times or {}).items()
+        if start
+    }
+
+
 def get_segment_times(
     event: Event,
     segment: str,
@@ -370,6 +379,9 @@ def expand_ufc_segments(
     Groups UFC streams by detected segment and creates separate channel
     entries for each segment. Non-UFC streams pass through unchanged.
 
+    Per-event segment data (local start times, segment windows, validated
+    segments) is computed once and reused for every stream of the event.
+
     Args:
         matched_streams: List of {'stream': ..., 'event': ...} dicts
         sport_durations: Optional sport duration settings
@@ -383,6 +395,10 @@ def expand_ufc_segments(
     # {event_id: {segment: [streams]}}
     ufc_by_segment: dict[str, dict[str, list[dict]]] = {}
 
+    # Per-event memos: local segment start times and (detected -> canonical) segments
+    local_times_by_event: dict[str, dict[str, time]] = {}
+    canonical_by_event: dict[tuple[str, str], str] = {}
+
     for match in matched_streams:
         event = match.get("event")
         stream = match.get("stream", {})
@@ -417,10 +433,17 @@ def expand_ufc_segments(
             stream_name = stream.get("name", "")
             stream_time = extract_time_from_stream(stream_name)
             if stream_time:
-                segment = disambiguate_prelims_by_time(segment, stream_time, event)
+                if event.id not in local_times_by_event:
+                    local_times_by_event[event.id] = segment_local_start_times(event)
+                segment = disambiguate_prelims_by_time(
+                    segment, stream_time, event, local_times_by_event[event.id]
+                )
 
         # Validate against ESPN's segment data - ensures segment exists
-        segment = canonicalize_segment(segment, event)
+        canonical_key = (event.id, segment)
+        if canonical_key not in canonical_by_event:
+            canonical_by_event[canonical_key] = canonicalize_segment(segment, event)
+        segment = canonical_by_event[canonical_key]
 
         event_id = event.id
         if event_id not in ufc_by_segment:
@@ -18,6 +18,7 @@ Features:
 """
 
 import logging
+from bisect import bisect_right
 from sqlite3 import Connection
 
 logger = logging.getLogger(__name__)
@@ -266,6 +267,304 @@ def get_next_compact_channel_number(conn: Connection) -> int | None:
     return next_num
 
 
+class _NumberRuns:
+    """Set of used channel numbers stored as sorted, merged runs.
+
+    Free numbers are the gaps between runs, so the first free number at or
+    after any start is found with one bisect instead of a linear probe.
+    """
+
+    def __init__(self, numbers: list[int] | None = None):
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        for num in sorted(set(numbers or [])):
+            if self._ends and num == self._ends[-1] + 1:
+                self._ends[-1] = num
+            else:
+                self._starts.append(num)
+                self._ends.append(num)
+
+    def first_free(self, start: int) -> int:
+        """Return the lowest unused number >= start."""
+        i = bisect_right(self._starts, start) - 1
+        if i >= 0 and self._ends[i] >= start:
+            return self._ends[i] + 1
+        return start
+
+    def min(self) -> int | None:
+        return self._starts[0] if self._starts else None
+
+    def add(self, num: int) -> None:
+        i = bisect_right(self._starts, num) - 1
+        if i >= 0 and self._ends[i] >= num:
+            return  # Already used
+        joins_prev = i >= 0 and self._ends[i] == num - 1
+        joins_next = i + 1 < len(self._starts) and self._starts[i + 1] == num + 1
+        if joins_prev and joins_next:
+            self._ends[i] = self._ends[i + 1]
+            del self._starts[i + 1]
+            del self._ends[i + 1]
+        elif joins_prev:
+            self._ends[i] = num
+        elif joins_next:
+            self._starts[i + 1] = num
+        else:
+            self._starts.insert(i + 1, num)
+            self._ends.insert(i + 1, num)
+
+    def remove(self, num: int) -> None:
+        i = bisect_right(self._starts, num) - 1
+        if i < 0 or self._ends[i] < num:
+            return  # Not used
+        start, end = self._starts[i], self._ends[i]
+        if start == end:
+            del self._starts[i]
+            del self._ends[i]
+        elif num == start:
+            self._starts[i] = num + 1
+        elif num == end:
+            self._ends[i] = num - 1
+        else:
+            self._ends[i] = num - 1
+            self._starts.insert(i + 1, num + 1)
+            self._ends.insert(i + 1, end)
+
+
+class ChannelNumberAllocator:
+    """Per-run channel number allocator.
+
+    get_next_channel_number() re-reads the group, recomputes the AUTO block
+    layout and reloads every used number on each call. When a run creates
+    many channels, create one allocator instead: it loads settings, groups
+    and used numbers once and answers each request from memory, applying the
+    same MANUAL/AUTO and numbering-mode rules.
+
+    Callers must report numbers that actually get stored (claim) and numbers
+    freed by deletions (release) so later lookups stay correct. The allocator
+    does not see changes made by other connections after it loads, so keep
+    it scoped to a single batch of channel creation.
+
+    Usage:
+        allocator = ChannelNumberAllocator(conn)
+        number = allocator.next_number(group_id)
+        ... create channel with number ...
+        allocator.claim(group_id, number)
+    """
+
+    def __init__(self, conn: Connection):
+        self._conn = conn
+        self._range_start, range_end = get_global_channel_range(conn)
+        self._effective_end = range_end if range_end else MAX_CHANNEL
+        self._numbering_mode = get_channel_numbering_mode(conn)
+
+        self._groups: dict[int, dict] = {
+            row["id"]: dict(row)
+            for row in conn.execute(
+                """SELECT id, channel_start_number, channel_assignment_mode, sort_order,
+                          total_stream_count, enabled, parent_group_id
+                   FROM event_epg_groups
+                   ORDER BY sort_order ASC"""
+            ).fetchall()
+        }
+        # Top-level enabled AUTO groups in block order (dict preserves sort_order)
+        self._block_order = [
+            gid
+            for gid, grp in self._groups.items()
+            if grp["channel_assignment_mode"] == "auto"
+            and grp["parent_group_id"] is None
+            and grp["enabled"]
+        ]
+
+        used_by_group: dict[int, list[int]] = {}
+        self._channel_counts: dict[int, int] = {}
+        for row in conn.execute(
+            """SELECT event_epg_group_id, channel_number FROM managed_channels
+               WHERE deleted_at IS NULL"""
+        ).fetchall():
+            gid = row["event_epg_group_id"]
+            self._channel_counts[gid] = self._channel_counts.get(gid, 0) + 1
+            if row["channel_number"]:
+                try:
+                    used_by_group.setdefault(gid, []).append(int(float(row["channel_number"])))
+                except (ValueError, TypeError):
+                    pass  # Skip invalid channel numbers
+
+        self._used: dict[int, _NumberRuns] = {
+            gid: _NumberRuns(nums) for gid, nums in used_by_group.items()
+        }
+        # strict_compact pool: every channel in an enabled AUTO group
+        self._compact_used = _NumberRuns(
+            [
+                num
+                for gid, nums in used_by_group.items()
+                if self._is_compact_member(gid)
+                for num in nums
+            ]
+        )
+
+    def next_number(self, group_id: int, auto_assign: bool = True) -> int | None:
+        """Get the next available channel number for a group.
+
+        Same rules and return values as get_next_channel_number().
+
+        Args:
+            group_id: The event group ID
+            auto_assign: If True, auto-assign channel_start when missing (MANUAL mode only)
+
+        Returns:
+            Next available channel number, or None if disabled/would exceed max
+        """
+        group = self._groups.get(group_id)
+        if not group:
+            return None
+
+        channel_start = group["channel_start_number"]
+        assignment_mode = group["channel_assignment_mode"] or "manual"
+
+        block_end = None
+        if assignment_mode == "auto":
+            if self._numbering_mode == "strict_compact":
+                return self._next_compact_number()
+
+            channel_start = self._auto_channel_start(group_id)
+            if not channel_start:
+                logger.warning(
+                    "[CHANNEL_NUM] Could not calculate auto channel_start for group %d (mode=%s)",
+                    group_id,
+                    self._numbering_mode,
+                )
+                return None
+            block_end = self._auto_block_end(group_id)
+
+        elif not channel_start and auto_assign:
+            channel_start = _get_next_available_range_start(self._conn)
+            if channel_start:
+                self._conn.execute(
+                    "UPDATE event_epg_groups SET channel_start_number = ? WHERE id = ?",
+                    (channel_start, group_id),
+                )
+                self._conn.commit()
+                group["channel_start_number"] = channel_start
+                logger.info(
+                    "[CHANNEL_NUM] Auto-assigned channel_start %d to MANUAL group %d",
+                    channel_start,
+                    group_id,
+                )
+            else:
+                logger.warning(
+                    "[CHANNEL_NUM] Could not auto-assign channel_start for group %d", group_id
+                )
+
+        if not channel_start:
+            return None
+
+        used = self._used.get(group_id)
+        next_num = used.first_free(channel_start) if used else channel_start
+
+        if block_end and next_num > block_end:
+            logger.warning(
+                "[CHANNEL_NUM] Group %d AUTO range exhausted (%d-%d, mode=%s)",
+                group_id,
+                channel_start,
+                block_end,
+                self._numbering_mode,
+            )
+            return None
+
+        if next_num > MAX_CHANNEL:
+            logger.warning("[CHANNEL_NUM] Channel number %d exceeds max %d", next_num, MAX_CHANNEL)
+            return None
+
+        return next_num
+
+    def claim(self, group_id: int, channel_number: int) -> None:
+        """Record a channel number as stored for a group."""
+        self._used.setdefault(group_id, _NumberRuns()).add(channel_number)
+        self._channel_counts[group_id] = self._channel_counts.get(group_id, 0) + 1
+        if self._is_compact_member(group_id):
+            self._compact_used.add(channel_number)
+
+    def release(self, group_id: int, channel_number: int | str | None) -> None:
+        """Record a group's channel as deleted, freeing its number."""
+        self._channel_counts[group_id] = max(self._channel_counts.get(group_id, 0) - 1, 0)
+        if not channel_number:
+            return
+        try:
+            num = int(float(channel_number))
+        except (ValueError, TypeError):
+            return
+        if group_id in self._used:
+            self._used[group_id].remove(num)
+        if self._is_compact_member(group_id):
+            # Another AUTO group may legitimately hold the same number
+            if not any(
+                gid != group_id and self._is_compact_member(gid) and runs.first_free(num) != num
+                for gid, runs in self._used.items()
+            ):
+                self._compact_used.remove(num)
+
+    def _is_compact_member(self, group_id: int) -> bool:
+        group = self._groups.get(group_id)
+        return bool(group and group["channel_assignment_mode"] == "auto" and group["enabled"])
+
+    def _next_compact_number(self) -> int | None:
+        next_num = self._compact_used.first_free(self._range_start)
+        if next_num > self._effective_end:
+            logger.warning(
+                "[CHANNEL_NUM] strict_compact: No available channels (range %d-%d exhausted)",
+                self._range_start,
+                self._effective_end,
+            )
+            return None
+        if next_num > MAX_CHANNEL:
+            logger.warning("[CHANNEL_NUM] Channel number %d exceeds max %d", next_num, MAX_CHANNEL)
+            return None
+        return next_num
+
+    def _min_channel(self, group_id: int) -> int | None:
+        used = self._used.get(group_id)
+        return used.min() if used else None
+
+    def _auto_channel_start(self, group_id: int) -> int | None:
+        """In-memory equivalent of _calculate_auto_channel_start()."""
+        current_start = self._range_start
+        for gid in self._block_order:
+            if gid == group_id:
+                min_existing = self._min_channel(group_id)
+                if min_existing and min_existing < current_start:
+                    current_start = min_existing
+                if current_start > self._effective_end:
+                    logger.warning(
+                        "[CHANNEL_NUM] AUTO group %d would start at %d, exceeds range end %d",
+                        group_id,
+                        current_start,
+                        self._effective_end,
+                    )
+                    return None
+                return current_start
+
+            if self._numbering_mode == "rational_block":
+                count = self._channel_counts.get(gid, 0)
+            else:
+                count = self._groups[gid]["total_stream_count"] or 0
+            current_start += _calculate_blocks_needed(count) * 10
+
+        return None
+
+    def _auto_block_end(self, group_id: int) -> int:
+        """In-memory equivalent of _calculate_auto_block_end()."""
+        found_self = False
+        for gid in self._block_order:
+            if gid == group_id:
+                found_self = True
+                continue
+            if found_self:
+                next_min = self._min_channel(gid)
+                if next_min:
+                    return next_min - 1
+        return self._effective_end
+
+
 def _get_actual_channel_count(conn: Connection, group_id: int) -> int:
     """Get the actual count of active (non-deleted) channels for a group."""
     cursor = conn.execute(
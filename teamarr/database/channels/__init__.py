@@ -29,6 +29,9 @@ from .history import (
     log_channel_history,
 )
 
+# Batch lookup index
+from .index import GroupChannelIndex
+
 # Keywords operations
 from .keywords import (
     check_exception_keyword,
@@ -74,6 +77,8 @@ __all__ = [
     "find_existing_channel",
     "find_parent_channel_for_event",
     "find_any_channel_for_event",
+    # Batch lookup index
+    "GroupChannelIndex",
     # Streams
     "add_stream_to_channel",
     "compute_stream_priority_from_rules",
@@ -0,0 +1,139 @@
+"""In-memory index of a group's active managed channels.
+
+Lifecycle processing looks up an existing channel (and its attached
+streams) for every matched stream. GroupChannelIndex loads the group's
+active channels and their streams with two queries and answers those
+lookups from dicts. Callers keep it coherent by reporting channels they
+create or delete and streams they attach during the batch.
+"""
+
+from sqlite3 import Connection
+
+from .crud import get_managed_channel
+from .types import ManagedChannel
+
+
+class GroupChannelIndex:
+    """Active managed channels and streams for one event group."""
+
+    def __init__(self, group_id: int):
+        self.group_id = group_id
+        self._channels: dict[int, ManagedChannel] = {}
+        # (event_id, provider, exception_keyword) -> channel (consolidate)
+        self._by_keyword: dict[tuple[str, str, str | None], ManagedChannel] = {}
+        # (event_id, provider) -> first channel (ignore)
+        self._by_event: dict[tuple[str, str], ManagedChannel] = {}
+        # (event_id, provider, primary_stream_id) -> channel (separate)
+        self._by_primary_stream: dict[tuple[str, str, int], ManagedChannel] = {}
+        # channel_id -> {dispatcharr_stream_id: priority}, in (priority, added_at) order
+        self._streams: dict[int, dict[int, int]] = {}
+
+    @classmethod
+    def load(cls, conn: Connection, group_id: int) -> "GroupChannelIndex":
+        """Load a group's active channels and their streams.
+
+        Args:
+            conn: Database connection
+            group_id: Event EPG group ID
+
+        Returns:
+            Populated GroupChannelIndex
+        """
+        index = cls(group_id)
+
+        cursor = conn.execute(
+            # Same order the per-event lookups get from idx_mc_unique_event
+            """SELECT * FROM managed_channels
+               WHERE event_epg_group_id = ? AND deleted_at IS NULL
+               ORDER BY COALESCE(exception_keyword, ''), primary_stream_id, id""",
+            (group_id,),
+        )
+        for row in cursor.fetchall():
+            index.add_channel(ManagedChannel.from_row(dict(row)))
+
+        cursor = conn.execute(
+            """SELECT mcs.managed_channel_id, mcs.dispatcharr_stream_id, mcs.priority
+               FROM managed_channel_streams mcs
+               JOIN managed_channels mc ON mcs.managed_channel_id = mc.id
+               WHERE mc.event_epg_group_id = ?
+                 AND mc.deleted_at IS NULL
+                 AND mcs.removed_at IS NULL
+               ORDER BY mcs.priority, mcs.added_at""",
+            (group_id,),
+        )
+        for row in cursor.fetchall():
+            index._streams.setdefault(row["managed_channel_id"], {})[
+                row["dispatcharr_stream_id"]
+            ] = row["priority"]
+
+        return index
+
+    def find(
+        self,
+        event_id: str,
+        event_provider: str,
+        exception_keyword: str | None = None,
+        stream_id: int | None = None,
+        mode: str = "consolidate",
+    ) -> ManagedChannel | None:
+        """Find existing channel based on duplicate handling mode.
+
+        Same semantics as find_existing_channel().
+        """
+        if mode == "separate":
+            if stream_id:
+                return self._by_primary_stream.get((event_id, event_provider, stream_id))
+            return None
+        if mode == "ignore":
+            return self._by_event.get((event_id, event_provider))
+        keyword = exception_keyword if exception_keyword else None
+        return self._by_keyword.get((event_id, event_provider, keyword))
+
+    def add_channel(self, channel: ManagedChannel) -> None:
+        """Index a channel (first channel per key wins, matching DB lookup order)."""
+        self._channels[channel.id] = channel
+        self._index_channel(channel)
+        self._streams.setdefault(channel.id, {})
+
+    def add_created_channel(self, conn: Connection, channel_id: int) -> None:
+        """Load and index a channel created during the batch."""
+        channel = get_managed_channel(conn, channel_id)
+        if channel:
+            self.add_channel(channel)
+
+    def remove_channel(self, channel: ManagedChannel) -> None:
+        """Drop a channel that was marked deleted during the batch."""
+        if self._channels.pop(channel.id, None) is None:
+            return
+        self._streams.pop(channel.id, None)
+        # Rare - rebuild so a duplicate channel for the same key takes over
+        self._by_keyword.clear()
+        self._by_event.clear()
+        self._by_primary_stream.clear()
+        for remaining in self._channels.values():
+            self._index_channel(remaining)
+
+    def stream_exists(self, channel_id: int, stream_id: int) -> bool:
+        """Check if stream is attached to channel."""
+        return stream_id in self._streams.get(channel_id, {})
+
+    def next_stream_priority(self, channel_id: int) -> int:
+        """Next available stream priority for a channel (max + 1, or 0 if no streams)."""
+        priorities = self._streams.get(channel_id)
+        return max(priorities.values()) + 1 if priorities else 0
+
+    def add_stream(self, channel_id: int, stream_id: int, priority: int) -> None:
+        """Record a stream attached to a channel."""
+        self._streams.setdefault(channel_id, {})[stream_id] = priority
+
+    def ordered_stream_ids(self, channel_id: int) -> list[int]:
+        """Stream IDs for a channel in priority order (ties keep attach order)."""
+        streams = self._streams.get(channel_id, {})
+        return sorted(streams, key=streams.__getitem__)
+
+    def _index_channel(self, channel: ManagedChannel) -> None:
+        key = (channel.event_id, channel.event_provider)
+        self._by_keyword.setdefault((*key, channel.exception_keyword), channel)
+        self._by_event.setdefault(key, channel)
+        if channel.primary_stream_id:
+            self._by_primary_stream.setdefault((*key, channel.primary_stream_id), channel)
@@ -1078,6 +1078,83 @@ def _run_migrations(conn: sqlite3.Connection) -> None:
         logger.info("[MIGRATE] Schema upgraded to version 46 (stream profile support)")
         current_version = 46
 
+    # ==========================================================================
+    # v47: Stream Manifest (delta stream sync)
+    # ==========================================================================
+    # Adds stream_manifest table - per-group record of last-run streams so
+    # unchanged streams can reuse name-only results (table created by schema.sql)
+    if current_version < 47:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS stream_manifest (
+                group_id INTEGER NOT NULL,
+                stream_id INTEGER NOT NULL,
+                stream_name TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                config_hash TEXT NOT NULL,
+                result TEXT,
+                last_seen_generation INTEGER NOT NULL DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (group_id, stream_id)
+            )
+        """)
+        conn.execute("UPDATE settings SET schema_version = 47 WHERE id = 1")
+        logger.info("[MIGRATE] Schema upgraded to version 47 (stream manifest)")
+        current_version = 47
+
+    # ==========================================================================
+    # v48: Persistent Dispatcharr logo map
+    # ==========================================================================
+    # Adds dispatcharr_logo_map table - URL -> logo ID map so LogoManager
+    # doesn't re-list all logos every batch (table created by schema.sql)
+    if current_version < 48:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS dispatcharr_logo_map (
+                base_url TEXT NOT NULL,
+                url TEXT NOT NULL,
+                logo_id INTEGER NOT NULL,
+                name TEXT,
+                verified_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (base_url, url)
+            )
+        """)
+        conn.execute("UPDATE settings SET schema_version = 48 WHERE id = 1")
+        logger.info("[MIGRATE] Schema upgraded to version 48 (dispatcharr logo map)")
+        current_version = 48
+
+    # ==========================================================================
+    # v49: Shared rate limit buckets
+    # ==========================================================================
+    # Adds rate_limit_buckets table - token bucket state shared by all
+    # threads/processes calling TSDB (table created by schema.sql)
+    if current_version < 49:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+                name TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        conn.execute("UPDATE settings SET schema_version = 49 WHERE id = 1")
+        logger.info("[MIGRATE] Schema upgraded to version 49 (rate limit buckets)")
+        current_version = 49
+
+    # ==========================================================================
+    # v50: Dispatcharr logo listing timestamps
+    # ==========================================================================
+    # Adds dispatcharr_logo_listings table - when LogoManager last listed all
+    # logos, so map freshness doesn't depend on per-entry verification
+    # (table created by schema.sql)
+    if current_version < 50:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS dispatcharr_logo_listings (
+                base_url TEXT PRIMARY KEY,
+                listed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.execute("UPDATE settings SET schema_version = 50 WHERE id = 1")
+        logger.info("[MIGRATE] Schema upgraded to version 50 (dispatcharr logo listings)")
+        current_version = 50
+
 
 # =============================================================================
 # LEGACY MIGRATION HELPER FUNCTIONS
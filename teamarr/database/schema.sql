@@ -298,7 +298,7 @@ CREATE TABLE IF NOT EXISTS settings (
     update_auto_detect_branch BOOLEAN DEFAULT 1,         -- Auto-detect branch from version string
 
     -- Schema Version
-    schema_version INTEGER DEFAULT 46
+    schema_version INTEGER DEFAULT 50
 );
 
 -- Insert default settings
@@ -849,6 +849,80 @@ CREATE INDEX IF NOT EXISTS idx_smc_user_corrected ON stream_match_cache(user_cor
 CREATE INDEX IF NOT EXISTS idx_smc_method ON stream_match_cache(match_method);
 
 
+-- =============================================================================
+-- STREAM_MANIFEST TABLE
+-- Per-group record of the streams seen on the last run (delta stream sync).
+--
+-- Each run diffs fetched streams against this table. Unchanged streams
+-- (same stream_id + fingerprint, same matcher config_hash) whose stored
+-- result depends only on the name (unclassifiable, not_event,
+-- league_not_included) skip classification and matching.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS stream_manifest (
+    group_id INTEGER NOT NULL,
+    stream_id INTEGER NOT NULL,
+    stream_name TEXT NOT NULL,
+
+    -- Same fingerprint as stream_match_cache (group_id + stream_id + stream_name)
+    fingerprint TEXT NOT NULL,
+
+    -- Hash of matcher config (leagues, event types, custom regex) at last run
+    config_hash TEXT NOT NULL,
+
+    -- JSON summary of the last match result (NULL if not recorded)
+    result TEXT,
+
+    last_seen_generation INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (group_id, stream_id)
+);
+
+
+-- =============================================================================
+-- DISPATCHARR_LOGO_MAP TABLE
+-- Persistent logo URL -> Dispatcharr logo ID map (per Dispatcharr instance).
+--
+-- Lets LogoManager resolve logos without re-listing every logo from
+-- Dispatcharr. Entries are re-verified with a single-logo GET when old;
+-- the full listing runs only when the map is empty or stale.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS dispatcharr_logo_map (
+    base_url TEXT NOT NULL,             -- Dispatcharr instance URL
+    url TEXT NOT NULL,                  -- Logo image URL
+    logo_id INTEGER NOT NULL,           -- Dispatcharr logo ID
+    name TEXT,
+    verified_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (base_url, url)
+);
+
+-- When the map was last rebuilt from a full Dispatcharr listing. Map
+-- freshness is judged on this, not on per-entry verified_at, so logos
+-- created outside Teamarr are picked up by the periodic re-listing.
+CREATE TABLE IF NOT EXISTS dispatcharr_logo_listings (
+    base_url TEXT PRIMARY KEY,          -- Dispatcharr instance URL
+    listed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+
+-- =============================================================================
+-- RATE_LIMIT_BUCKETS TABLE
+-- Shared token buckets for rate-limited APIs (one row per API, e.g. 'tsdb').
+--
+-- Every thread and process takes tokens from the same row inside an
+-- IMMEDIATE transaction, so concurrent generations share one request budget.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+    name TEXT PRIMARY KEY,              -- Bucket name ('tsdb')
+    tokens REAL NOT NULL,               -- Tokens left as of updated_at
+    updated_at REAL NOT NULL            -- Unix timestamp of last refill
+);
+
+
 -- =============================================================================
 -- MATCH_CORRECTIONS TABLE
 -- Audit log of user corrections to stream-event matches.
@@ -18,6 +18,7 @@ from urllib.parse import urlparse
 import httpx
 
 from teamarr.dispatcharr.auth import TokenManager
+from teamarr.utilities.dns_cache import CachingDNSTransport, proxy_mounts
 
 logger = logging.getLogger(__name__)
 
@@ -101,12 +102,15 @@ class DispatcharrClient:
     def _get_client(self) -> httpx.Client:
         """Get or create HTTP client with connection pooling."""
         if self._client is None:
+            limits = httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+            )
             self._client = httpx.Client(
                 timeout=self._timeout,
-                limits=httpx.Limits(
-                    max_connections=100,
-                    max_keepalive_connections=20,
-                ),
+                limits=limits,
+                transport=CachingDNSTransport(limits=limits),
+                mounts=proxy_mounts(limits),
             )
         return self._client
 
@@ -241,7 +245,8 @@ class DispatcharrClient:
         self,
         initial_endpoint: str,
         error_context: str = "items",
-    ) -> list[dict]:
+        strict: bool = False,
+    ) -> list[dict] | None:
         """Fetch all items from a paginated API endpoint.
 
         Handles both paginated dict responses (with 'results' and 'next')
@@ -251,9 +256,11 @@ class DispatcharrClient:
             initial_endpoint: Starting endpoint with page_size
                 (e.g., "/api/channels/channels/?page_size=1000")
             error_context: Context for error logging (e.g., "channels")
+            strict: Return None instead of the items fetched so far if a
+                page fails (for callers that treat the listing as complete)
 
         Returns:
-            List of all items from all pages
+            List of all items from all pages (None if strict and a page failed)
         """
         all_items: list[dict] = []
         next_page: str | None = initial_endpoint
@@ -263,6 +270,8 @@ class DispatcharrClient:
             if response is None or response.status_code != 200:
                 status = response.status_code if response else "No response"
                 logger.error("[DISPATCHARR] Failed to get %s: %s", error_context, status)
+                if strict:
+                    return None
                 break
 
             data = response.json()
@@ -289,7 +289,7 @@ class DispatcharrFactory:
                 channels=ChannelManager(client),
                 epg=EPGManager(client),
                 m3u=M3UManager(client),
-                logos=LogoManager(client),
+                logos=LogoManager(client, db_factory=self._db_factory),
             )
 
             logger.info("[DISPATCHARR] Connected at %s", settings.url)
@@ -179,6 +179,22 @@ class ChannelManager:
             )
             return [DispatcharrChannel.from_api(c) for c in raw_channels]
 
+    def get_all_channels_strict(self) -> list[DispatcharrChannel] | None:
+        """Get all channels fresh from Dispatcharr, or None if any page fails.
+
+        For callers that treat a missing channel as deleted: a partial
+        listing must not be mistaken for the full set. Bypasses the cache.
+        """
+        with self._lock:
+            raw_channels = self._client.paginated_get(
+                "/api/channels/channels/?page_size=1000",
+                error_context="channels",
+                strict=True,
+            )
+        if raw_channels is None:
+            return None
+        return [DispatcharrChannel.from_api(c) for c in raw_channels]
+
     def get_channel(
         self,
         channel_id: int,
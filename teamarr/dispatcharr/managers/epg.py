@@ -7,6 +7,7 @@ import logging
 import time
 
 from teamarr.dispatcharr.client import DispatcharrClient
+from teamarr.dispatcharr.polling import DEFAULT_INITIAL_INTERVAL, poll_delays
 from teamarr.dispatcharr.types import DispatcharrEPGSource, RefreshResult
 
 logger = logging.getLogger(__name__)
@@ -127,19 +128,23 @@ class EPGManager:
         self,
         epg_id: int,
         timeout: int = 60,
-        poll_interval: int = 2,
+        poll_interval: float = 2,
+        initial_poll_interval: float = DEFAULT_INITIAL_INTERVAL,
     ) -> RefreshResult:
         """Trigger EPG refresh and wait for completion.
 
         Dispatcharr's EPG import is async (returns 202). This method triggers
         the refresh and polls until completion by monitoring status and updated_at.
+        Polling starts fast and backs off exponentially, so small sources that
+        finish almost instantly aren't held for a full interval.
 
         EPG status values: idle, fetching, parsing, error, success, disabled
 
         Args:
             epg_id: EPG source ID to refresh
             timeout: Maximum seconds to wait (default: 60)
-            poll_interval: Seconds between status checks (default: 2)
+            poll_interval: Maximum seconds between status checks (default: 2)
+            initial_poll_interval: Seconds before the first status check
 
         Returns:
             RefreshResult with success status, duration, and final source state
@@ -150,6 +155,9 @@ class EPGManager:
             return RefreshResult(success=False, message=f"EPG source {epg_id} not found")
 
         before_updated = before.updated_at
+        # An error left over from the previous import doesn't count until the
+        # source has moved on (status left "error" or updated_at changed)
+        stale_error = before.status == "error"
 
         # Trigger refresh
         trigger_result = self.refresh(epg_id)
@@ -161,9 +169,12 @@ class EPGManager:
         last_logged_status: str | None = None
         last_status: str | None = None
         last_message: str | None = None
+        delays = poll_delays(initial=initial_poll_interval, maximum=poll_interval)
+        polls = 0
 
         while time.time() - start_time < timeout:
-            time.sleep(poll_interval)
+            time.sleep(next(delays))
+            polls += 1
 
             current = self.get_source(epg_id)
             if not current:
@@ -175,6 +186,8 @@ class EPGManager:
             current_message = current.last_message
             last_status = current_status
             last_message = current_message
+            if current_status != "error" or current_updated != before_updated:
+                stale_error = False
 
             # Log status changes
             if current_status != last_logged_status:
@@ -190,11 +203,13 @@ class EPGManager:
             # Check if refresh completed (status is success and updated_at changed)
             if current_status == "success" and current_updated != before_updated:
                 duration = time.time() - start_time
+                logger.debug("[EPG] Refresh completed in %.1fs (%d polls)", duration, polls)
                 return RefreshResult(
                     success=True,
                     message=current.last_message or "EPG refresh completed",
                     duration=duration,
                     source={"id": current.id, "status": current.status},
+                    polls=polls,
                 )
             # Quick exit: no channels mapped - Dispatcharr returns success instantly
             # but updated_at doesn't change, so we'd wait full timeout otherwise
@@ -206,14 +221,16 @@ class EPGManager:
                     message=current_message or "EPG refresh completed (no channels mapped)",
                     duration=duration,
                     source={"id": current.id, "status": current.status},
+                    polls=polls,
                 )
-            elif current_status == "error":
+            elif current_status == "error" and not stale_error:
                 duration = time.time() - start_time
                 return RefreshResult(
                     success=False,
                     message=current.last_message or "EPG refresh failed",
                     duration=duration,
                     source={"id": current.id, "status": current.status},
+                    polls=polls,
                 )
 
         # Timeout - but check if status is actually success
@@ -225,6 +242,7 @@ class EPGManager:
                 duration=float(timeout),
                 last_status=last_status,
                 last_message=last_message,
+                polls=polls,
             )
 
         return RefreshResult(
@@ -233,6 +251,7 @@ class EPGManager:
             duration=float(timeout),
             last_status=last_status,
             last_message=last_message,
+            polls=polls,
         )
 
     def refresh_by_name(self, name: str) -> RefreshResult:
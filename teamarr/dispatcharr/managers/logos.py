@@ -1,9 +1,22 @@
 """Logo management for Dispatcharr.
 
 Handles logo upload, lookup, and deletion operations.
+
+URL lookups are served from an in-memory map, cleared at the start of each
+channel batch (ChannelLifecycleService.process_matched_streams) so the ages
+below apply per run, not per process. When a db_factory is given,
+the map is also persisted (dispatcharr_logo_map table) so a fresh process
+or a cleared cache reloads it with one query instead of re-listing every
+logo from Dispatcharr. Entries older than MAP_VERIFY_AGE_SECONDS are
+re-checked with a single-logo GET when first used. The full listing runs
+when the last one (dispatcharr_logo_listings) is older than
+MAP_MAX_AGE_SECONDS, so logos created outside Teamarr are still learned,
+and again when an upload is rejected (e.g. the URL already exists).
 """
 
 import logging
+import sqlite3
+from typing import Any
 
 from teamarr.dispatcharr.client import DispatcharrClient
 from teamarr.dispatcharr.types import DispatcharrLogo, OperationResult
@@ -24,21 +37,33 @@ class LogoManager:
             logo_id = result.logo["id"]
     """
 
+    # Persisted entries older than this are verified with a single GET before use
+    MAP_VERIFY_AGE_SECONDS = 6 * 3600
+
+    # Re-list all logos when the last full listing is older than this
+    MAP_MAX_AGE_SECONDS = 24 * 3600
+
     # Class-level cache shared across instances (keyed by base URL)
     _caches: dict[str, dict[str, DispatcharrLogo]] = {}
 
-    def __init__(self, client: DispatcharrClient):
+    # URLs loaded from the persisted map that still need verification (keyed by base URL)
+    _unverified: dict[str, set[str]] = {}
+
+    def __init__(self, client: DispatcharrClient, db_factory: Any = None):
         """Initialize logo manager.
 
         Args:
             client: Authenticated DispatcharrClient instance
+            db_factory: Optional database factory for the persistent URL -> ID map
         """
         self._client = client
         self._url = client._base_url
+        self._db_factory = db_factory
 
         # Initialize cache for this URL if not exists
         if self._url not in self._caches:
             self._caches[self._url] = {}
+            self._unverified[self._url] = set()
 
     @property
     def _cache(self) -> dict[str, DispatcharrLogo]:
@@ -46,22 +71,36 @@ class LogoManager:
         return self._caches[self._url]
 
     def clear_cache(self) -> None:
-        """Clear logo cache."""
+        """Clear in-memory logo cache.
+
+        The persistent map is kept; the next lookup reloads from it when fresh.
+        """
         self._cache.clear()
+        self._unverified[self._url].clear()
         logger.debug("[LOGO_CACHE] Cleared")
 
     def _ensure_cache(self) -> None:
-        """Ensure cache is populated."""
-        if not self._cache:
-            logos = self._client.paginated_get(
-                "/api/channels/logos/?page_size=500",
-                error_context="logos",
-            )
-            for logo_data in logos:
-                logo = DispatcharrLogo.from_api(logo_data)
-                if logo.url:
-                    self._cache[logo.url] = logo
-            logger.debug("[LOGO_CACHE] Populated %d logos", len(self._cache))
+        """Ensure cache is populated (persistent map first, full listing if stale)."""
+        if self._cache:
+            return
+        if self._load_map():
+            return
+        self._relist()
+
+    def _relist(self) -> None:
+        """Rebuild the cache and persistent map from a full Dispatcharr listing."""
+        logos = self._client.paginated_get(
+            "/api/channels/logos/?page_size=500",
+            error_context="logos",
+        )
+        self._cache.clear()
+        self._unverified[self._url].clear()
+        for logo_data in logos:
+            logo = DispatcharrLogo.from_api(logo_data)
+            if logo.url:
+                self._cache[logo.url] = logo
+        logger.debug("[LOGO_CACHE] Populated %d logos", len(self._cache))
+        self._replace_map()
 
     def list_logos(self) -> list[DispatcharrLogo]:
         """List all logos in Dispatcharr.
@@ -101,7 +140,10 @@ class LogoManager:
             DispatcharrLogo or None if not found
         """
         self._ensure_cache()
-        return self._cache.get(url)
+        logo = self._cache.get(url)
+        if logo and url in self._unverified[self._url]:
+            logo = self._verify(logo)
+        return logo
 
     def upload(self, name: str, url: str) -> OperationResult:
         """Upload a logo or find existing by URL.
@@ -142,16 +184,30 @@ class LogoManager:
             logo = DispatcharrLogo.from_api(logo_data)
             # Update cache
             self._cache[url] = logo
+            self._unverified[self._url].discard(url)
+            self._save_map_entry(logo)
             return OperationResult(
                 success=True,
                 logo=logo_data,
                 data=logo_data,
             )
 
-        return OperationResult(
-            success=False,
-            error=self._client.parse_api_error(response),
-        )
+        # Rejected - most likely the URL exists in Dispatcharr but not in our
+        # map (created outside Teamarr). Re-list and look it up before failing.
+        error = self._client.parse_api_error(response)
+        if not 400 <= response.status_code < 500:
+            return OperationResult(success=False, error=error)
+        self._relist()
+        existing = self._cache.get(url)
+        if existing:
+            logger.debug("[LOGO] Upload of %s rejected, found existing logo %d", url, existing.id)
+            return OperationResult(
+                success=True,
+                logo={"id": existing.id, "name": existing.name, "url": existing.url},
+                message="Logo already exists",
+            )
+
+        return OperationResult(success=False, error=error)
 
     def delete(self, logo_id: int) -> OperationResult:
         """Delete a logo from Dispatcharr.
@@ -177,8 +233,8 @@ class LogoManager:
 
         if response.status_code in (200, 204):
             # Remove from cache
-            if logo and logo.url and logo.url in self._cache:
-                del self._cache[logo.url]
+            if logo and logo.url:
+                self._forget(logo.url)
             return OperationResult(success=True)
 
         if response.status_code == 404:
@@ -226,8 +282,9 @@ class LogoManager:
             )
 
         if response.status_code in (200, 204):
-            # Clear our cache since logos may have been deleted
+            # Clear our cache and map since logos may have been deleted
             self.clear_cache()
+            self._clear_map()
             data = response.json() if response.text else {}
             deleted_count = data.get("deleted_count", 0)
             logger.info("[LOGO] Cleaned up %d unused logos", deleted_count)
@@ -240,3 +297,135 @@ class LogoManager:
             success=False,
             error=self._client.parse_api_error(response),
         )
+
+    # =========================================================================
+    # Persistent URL -> logo ID map
+    # =========================================================================
+
+    def _verify(self, logo: DispatcharrLogo) -> DispatcharrLogo | None:
+        """Check a persisted entry against Dispatcharr with a single GET."""
+        response = self._client.get(f"/api/channels/logos/{logo.id}/")
+        if response is None or response.status_code >= 500:
+            # Dispatcharr unreachable - keep the entry rather than re-upload
+            return logo
+
+        current = DispatcharrLogo.from_api(response.json()) if response.status_code == 200 else None
+        if current and current.url == logo.url:
+            self._cache[logo.url] = current
+            self._unverified[self._url].discard(logo.url)
+            self._save_map_entry(current)
+            return current
+
+        logger.debug("[LOGO_CACHE] Logo %d for %s no longer valid", logo.id, logo.url)
+        self._forget(logo.url)
+        return None
+
+    def _forget(self, url: str) -> None:
+        """Drop a URL from the cache and the persistent map."""
+        self._cache.pop(url, None)
+        self._unverified[self._url].discard(url)
+        if not self._db_factory:
+            return
+        try:
+            with self._db_factory() as conn:
+                conn.execute(
+                    "DELETE FROM dispatcharr_logo_map WHERE base_url = ? AND url = ?",
+                    (self._url, url),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("[LOGO_CACHE] Failed to remove map entry: %s", e)
+
+    def _load_map(self) -> bool:
+        """Populate the cache from the persistent map if it is fresh.
+
+        Returns:
+            True if the cache was loaded, False if a full listing is needed
+        """
+        if not self._db_factory:
+            return False
+        try:
+            with self._db_factory() as conn:
+                row = conn.execute(
+                    """SELECT 1 FROM dispatcharr_logo_listings
+                       WHERE base_url = ? AND listed_at >= datetime('now', ?)""",
+                    (self._url, f"-{self.MAP_MAX_AGE_SECONDS} seconds"),
+                ).fetchone()
+                if not row:
+                    return False
+                rows = conn.execute(
+                    """SELECT url, logo_id, name,
+                              verified_at >= datetime('now', ?) AS fresh
+                       FROM dispatcharr_logo_map WHERE base_url = ?""",
+                    (f"-{self.MAP_VERIFY_AGE_SECONDS} seconds", self._url),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning("[LOGO_CACHE] Failed to load logo map: %s", e)
+            return False
+
+        unverified = self._unverified[self._url]
+        for r in rows:
+            self._cache[r["url"]] = DispatcharrLogo(
+                id=r["logo_id"], name=r["name"] or "", url=r["url"]
+            )
+            if not r["fresh"]:
+                unverified.add(r["url"])
+        logger.debug(
+            "[LOGO_CACHE] Loaded %d logos from map (%d to verify)", len(rows), len(unverified)
+        )
+        return True
+
+    def _replace_map(self) -> None:
+        """Replace the persistent map with the current (fully listed) cache."""
+        if not self._db_factory:
+            return
+        try:
+            with self._db_factory() as conn:
+                conn.execute("DELETE FROM dispatcharr_logo_map WHERE base_url = ?", (self._url,))
+                conn.executemany(
+                    """INSERT INTO dispatcharr_logo_map (base_url, url, logo_id, name, verified_at)
+                       VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)""",
+                    [(self._url, logo.url, logo.id, logo.name) for logo in self._cache.values()],
+                )
+                conn.execute(
+                    """INSERT INTO dispatcharr_logo_listings (base_url, listed_at)
+                       VALUES (?, CURRENT_TIMESTAMP)
+                       ON CONFLICT (base_url) DO UPDATE SET listed_at = CURRENT_TIMESTAMP""",
+                    (self._url,),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("[LOGO_CACHE] Failed to save logo map: %s", e)
+
+    def _save_map_entry(self, logo: DispatcharrLogo) -> None:
+        """Insert or re-verify a single map entry."""
+        if not self._db_factory:
+            return
+        try:
+            with self._db_factory() as conn:
+                conn.execute(
+                    """INSERT INTO dispatcharr_logo_map (base_url, url, logo_id, name, verified_at)
+                       VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                       ON CONFLICT (base_url, url) DO UPDATE SET
+                           logo_id = excluded.logo_id,
+                           name = excluded.name,
+                           verified_at = CURRENT_TIMESTAMP""",
+                    (self._url, logo.url, logo.id, logo.name),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("[LOGO_CACHE] Failed to save map entry: %s", e)
+
+    def _clear_map(self) -> None:
+        """Drop all persisted entries for this Dispatcharr instance."""
+        if not self._db_factory:
+            return
+        try:
+            with self._db_factory() as conn:
+                conn.execute("DELETE FROM dispatcharr_logo_map WHERE base_url = ?", (self._url,))
+                conn.execute(
+                    "DELETE FROM dispatcharr_logo_listings WHERE base_url = ?", (self._url,)
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("[LOGO_CACHE] Failed to clear logo map: %s", e)
@@ -6,9 +6,11 @@ Handles M3U account listing, stream discovery, and refresh operations.
 import logging
 import time
 import urllib.parse
+from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from teamarr.dispatcharr.client import DispatcharrClient
+from teamarr.dispatcharr.polling import DEFAULT_INITIAL_INTERVAL, poll_delays
 from teamarr.dispatcharr.types import (
     BatchRefreshResult,
     DispatcharrChannelGroup,
@@ -21,6 +23,10 @@ from teamarr.dispatcharr.types import (
 logger = logging.getLogger(__name__)
 
 
+class StreamFetchError(Exception):
+    """Raised when a page of streams can't be fetched from Dispatcharr."""
+
+
 def _fix_double_encoded_utf8(text: str) -> str:
     """Fix double-encoded UTF-8 strings.
 
@@ -205,84 +211,123 @@ class M3UManager:
         Returns:
             List of DispatcharrStream objects
         """
+        streams: list[DispatcharrStream] = []
+        try:
+            for page in self.iter_stream_pages(
+                group_name=group_name, group_id=group_id, account_id=account_id
+            ):
+                streams.extend(DispatcharrStream.from_api(raw) for raw in page)
+                if limit and len(streams) >= limit:
+                    break
+        except StreamFetchError:
+            return []
+
+        if limit:
+            streams = streams[:limit]
+
+        # Log stale stream count for debugging
+        stale_count = sum(1 for s in streams if s.is_stale)
+        if stale_count > 0:
+            logger.info(
+                "[M3U] Fetched %d streams (%d marked stale) from Dispatcharr",
+                len(streams),
+                stale_count,
+            )
+        elif streams:
+            # Check if API even returns is_stale field by looking at raw data
+            logger.debug(
+                "[M3U] Fetched %d streams (0 stale - verify Dispatcharr version >= 0.6.0)",
+                len(streams),
+            )
+
+        return streams
+
+    def iter_stream_pages(
+        self,
+        group_name: str | None = None,
+        group_id: int | None = None,
+        account_id: int | None = None,
+        page_size: int = 1000,
+    ) -> Iterator[list[dict]]:
+        """Iterate raw stream dicts one API page at a time.
+
+        The next page is fetched on a background thread while the caller works
+        on the current one, so filtering overlaps network I/O and only one or
+        two pages of raw JSON are alive at once. Stream names are already
+        fixed for double-encoded UTF-8.
+
+        Args:
+            group_name: Exact group name (e.g., "NFL Game Pass")
+            group_id: Group ID (will lookup name if group_name not provided)
+            account_id: Filter by M3U account ID
+            page_size: Streams per API page
+
+        Yields:
+            Lists of raw stream dicts as returned by the API
+
+        Raises:
+            StreamFetchError: If any page request fails. Pages already yielded
+                are incomplete, so callers should discard partial results.
+        """
         # Resolve group_name from group_id if needed
         if group_name is None and group_id is not None:
             group_name = self.get_group_name(group_id)
             if group_name is None:
                 # Group ID was provided but group no longer exists (deleted/renamed)
-                # Return empty list instead of silently fetching ALL streams
+                # Return nothing instead of silently fetching ALL streams
                 logger.warning(
                     "[M3U] Group ID %d no longer exists in Dispatcharr - "
                     "group may have been deleted or renamed. Returning empty stream list.",
                     group_id,
                 )
-                return []
+                return
 
         # Build query params
-        params = ["page_size=1000"]
+        params = [f"page_size={page_size}"]
         if group_name:
             params.append(f"channel_group_name={urllib.parse.quote(group_name)}")
         if account_id is not None:
             params.append(f"m3u_account={account_id}")
 
-        # Fetch all pages
-        raw_streams: list[dict] = []
         url: str | None = f"/api/channels/streams/?{'&'.join(params)}"
 
-        while url:
-            response = self._client.get(url)
-            if response is None or response.status_code != 200:
-                status = response.status_code if response else "No response"
-                logger.error("[M3U] Failed to list streams: %s", status)
-                return []
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="m3u-page") as executor:
+            pending = executor.submit(self._fetch_stream_page, url)
+            while pending is not None:
+                page, next_url = pending.result()
+                # Prefetch the next page before handing this one to the caller
+                pending = executor.submit(self._fetch_stream_page, next_url) if next_url else None
 
-            data = response.json()
-            if isinstance(data, dict):
-                raw_streams.extend(data.get("results", []))
-                # Get next page URL (Dispatcharr returns full URL or None)
-                next_url = data.get("next")
-                if next_url:
-                    # Extract path from full URL if needed
-                    if next_url.startswith("http"):
-                        from urllib.parse import urlparse
-
-                        parsed = urlparse(next_url)
-                        url = f"{parsed.path}?{parsed.query}" if parsed.query else parsed.path
-                    else:
-                        url = next_url
-                else:
-                    url = None
-            else:
-                # Non-paginated response (legacy?)
-                raw_streams.extend(data)
-                url = None
-
-        # Fix double-encoded UTF-8 in stream names
-        streams = []
-        for raw in raw_streams:
-            if "name" in raw:
-                raw["name"] = _fix_double_encoded_utf8(raw["name"])
-            streams.append(DispatcharrStream.from_api(raw))
+                for raw in page:
+                    if "name" in raw:
+                        raw["name"] = _fix_double_encoded_utf8(raw["name"])
+                yield page
 
-        if limit:
-            streams = streams[:limit]
+    def _fetch_stream_page(self, url: str) -> tuple[list[dict], str | None]:
+        """Fetch one page of streams.
 
-        # Log stale stream count for debugging
-        stale_count = sum(1 for s in streams if s.is_stale)
-        if stale_count > 0:
-            logger.info(
-                "[M3U] Fetched %d streams (%d marked stale) from Dispatcharr",
-                len(streams),
-                stale_count,
-            )
-        elif streams:
-            # Check if API even returns is_stale field by looking at raw data
-            logger.debug(
-                "[M3U] Fetched %d streams (0 stale - verify Dispatcharr version >= 0.6.0)",
-                len(streams),
-            )
+        Returns:
+            Tuple of (raw stream dicts, next page path or None)
+        """
+        response = self._client.get(url)
+        if response is None or response.status_code != 200:
+            status = response.status_code if response else "No response"
+            logger.error("[M3U] Failed to list streams: %s", status)
+            raise StreamFetchError(f"Failed to list streams: {status}")
 
-        return streams
+        data = response.json()
+        if not isinstance(data, dict):
+            # Non-paginated response (legacy?)
+            return data, None
+
+        # Get next page URL (Dispatcharr returns full URL or None)
+        next_url = data.get("next")
+        if next_url and next_url.startswith("http"):
+            # Extract path from full URL if needed
+            parsed = urllib.parse.urlparse(next_url)
+            next_url = f"{parsed.path}?{parsed.query}" if parsed.query else parsed.path
+
+        return data.get("results", []), next_url or None
 
     def get_group_with_streams(
         self,
@@ -338,16 +383,21 @@ class M3UManager:
         self,
         account_id: int,
         timeout: int = 120,
-        poll_interval: int = 2,
+        poll_interval: float = 2,
         skip_if_recent_minutes: int = 60,
+        initial_poll_interval: float = DEFAULT_INITIAL_INTERVAL,
     ) -> RefreshResult:
         """Trigger M3U refresh and wait for completion.
 
+        Polls with exponential backoff (fast first check, capped at
+        poll_interval) until updated_at changes or status flips to error.
+
         Args:
             account_id: M3U account ID
             timeout: Maximum seconds to wait (default: 120)
-            poll_interval: Seconds between status checks (default: 2)
+            poll_interval: Maximum seconds between status checks (default: 2)
             skip_if_recent_minutes: Skip refresh if updated within this many minutes
+            initial_poll_interval: Seconds before the first status check
 
         Returns:
             RefreshResult with success status and duration
@@ -376,6 +426,9 @@ class M3UManager:
                 pass  # If parsing fails, proceed with refresh
 
         before_updated = account.updated_at
+        # An error left over from the previous refresh doesn't count until the
+        # account has moved on (status left "error")
+        stale_error = account.status == "error"
 
         # Trigger refresh
         trigger_result = self.refresh_account(account_id)
@@ -384,9 +437,12 @@ class M3UManager:
 
         # Poll until status changes
         start_time = time.time()
+        delays = poll_delays(initial=initial_poll_interval, maximum=poll_interval)
+        polls = 0
 
         while time.time() - start_time < timeout:
-            time.sleep(poll_interval)
+            time.sleep(next(delays))
+            polls += 1
 
             current = self.get_account(account_id)
             if not current:
@@ -395,25 +451,36 @@ class M3UManager:
             # Check if refresh completed (updated_at changed)
             if current.updated_at != before_updated:
                 duration = time.time() - start_time
+                logger.debug(
+                    "[M3U] Account %d refresh completed in %.1fs (%d polls)",
+                    account_id,
+                    duration,
+                    polls,
+                )
                 return RefreshResult(
                     success=True,
                     message="M3U refresh completed",
                     duration=duration,
+                    polls=polls,
                 )
 
             # Check for error status
-            if current.status == "error":
+            if current.status != "error":
+                stale_error = False
+            elif not stale_error:
                 duration = time.time() - start_time
                 return RefreshResult(
                     success=False,
                     message="M3U refresh failed",
                     duration=duration,
+                    polls=polls,
                 )
 
         return RefreshResult(
             success=False,
             message=f"M3U refresh timed out after {timeout} seconds",
             duration=float(timeout),
+            polls=polls,
         )
 
     def refresh_multiple(
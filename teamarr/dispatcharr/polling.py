@@ -0,0 +1,42 @@
+"""Adaptive polling for Dispatcharr async operations.
+
+M3U and EPG refreshes are fire-and-forget on the Dispatcharr side (202),
+so completion has to be observed by polling. Small sources finish in well
+under a second while large ones take a minute or more, so a fixed interval
+either wastes most of an interval on fast refreshes or hammers the API on
+slow ones.
+
+Schedule: a fast first poll, then exponential backoff up to a cap.
+    0.25s, 0.5s, 1s, 2s, 2s, 2s, ... (with defaults)
+"""
+
+from collections.abc import Iterator
+
+# Defaults tuned for Dispatcharr refreshes - most no-op refreshes finish
+# within the first second, real imports settle into the capped interval
+DEFAULT_INITIAL_INTERVAL = 0.25
+DEFAULT_MAX_INTERVAL = 2.0
+DEFAULT_BACKOFF_FACTOR = 2.0
+
+
+def poll_delays(
+    initial: float = DEFAULT_INITIAL_INTERVAL,
+    maximum: float = DEFAULT_MAX_INTERVAL,
+    factor: float = DEFAULT_BACKOFF_FACTOR,
+) -> Iterator[float]:
+    """Yield sleep durations for an adaptive poll loop.
+
+    Infinite - callers bound the loop with their own timeout check.
+
+    Args:
+        initial: First delay in seconds
+        maximum: Cap for any single delay
+        factor: Multiplier applied after each poll
+
+    Yields:
+        Seconds to sleep before the next poll
+    """
+    delay = min(initial, maximum)
+    while True:
+        yield delay
+        delay = min(delay * factor, maximum)
@@ -256,6 +256,7 @@ class RefreshResult:
     skipped: bool = False  # True if refresh was skipped (recently refreshed)
     last_status: str | None = None  # Last status before timeout
     last_message: str | None = None  # Last message before timeout
+    polls: int = 0  # Status checks made while waiting for completion
 
 
 @dataclass
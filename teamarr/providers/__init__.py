@@ -74,9 +74,16 @@ def _create_tsdb_team_name_resolver() -> callable:
 
 def _create_tsdb_provider() -> TSDBProvider:
     """Factory for TSDB provider with injected dependencies."""
+    from teamarr.database import get_db
+
+    league_mapping_source = ProviderRegistry.get_league_mapping_source()
     return TSDBProvider(
-        league_mapping_source=ProviderRegistry.get_league_mapping_source(),
-        api_key=_get_tsdb_api_key(),
+        league_mapping_source=league_mapping_source,
+        client=TSDBClient(
+            league_mapping_source=league_mapping_source,
+            api_key=_get_tsdb_api_key(),
+            db_factory=get_db,  # Shared rate limit bucket
+        ),
         team_name_resolver=_create_tsdb_team_name_resolver(),
     )
 
@@ -15,6 +15,8 @@ IMPORTANT: Site structure may change. If data stops flowing, check:
 3. The actual site HTML to see if JSON structure changed
 """
 
+import hashlib
+import json
 import logging
 import re
 import threading
@@ -24,6 +26,7 @@ from datetime import datetime
 import httpx
 
 from teamarr.core.interfaces import LeagueMappingSource
+from teamarr.providers.recording import provider_transports
 from teamarr.utilities.cache import TTLCache, make_cache_key
 
 logger = logging.getLogger(__name__)
@@ -35,6 +38,10 @@ CACHE_TTL_LIVE = 5 * 60  # 5 minutes - live scores
 CACHE_TTL_SCHEDULE = 4 * 60 * 60  # 4 hours - series schedule
 CACHE_TTL_TEAMS = 24 * 60 * 60  # 24 hours - team list
 
+# Next.js flight data: self.__next_f.push([1, "<JSON-escaped payload>"])
+NEXT_F_PUSH = "self.__next_f.push("
+_JSON_DECODER = json.JSONDecoder()
+
 
 # Expected fields for structure validation
 REQUIRED_MATCH_FIELDS = {"matchId", "seriesId", "startDate", "team1", "team2", "state"}
@@ -86,9 +93,11 @@ class CricbuzzClient:
         if self._client is None:
             with self._client_lock:
                 if self._client is None:
+                    limits = httpx.Limits(max_connections=20, max_keepalive_connections=10)
                     self._client = httpx.Client(
                         timeout=self._timeout,
-                        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                        limits=limits,
+                        **provider_transports(limits),
                         headers={
                             "User-Agent": (
                                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -224,65 +233,83 @@ class CricbuzzClient:
         """Extract embedded JSON data from Cricbuzz HTML.
 
         Cricbuzz uses React/Next.js with JSON data embedded in
-        self.__next_f.push() calls. Data is JSON-escaped with \\".
+        self.__next_f.push() calls. Each push argument is decoded with the
+        JSON decoder (which also unescapes it) and the payloads are joined
+        into the page's data stream. Parsed results are cached by page hash,
+        so an unchanged page is never parsed twice.
         """
+        digest = hashlib.blake2b(html.encode(), digest_size=16).hexdigest()
+        cache_key = make_cache_key("cricbuzz", "page", digest)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            # Find the escaped JSON data blocks
-            # The JSON is escaped with \" instead of " in the HTML
-            escaped_matches_list = '\\"matchesList\\"'
-            escaped_series_matches = '\\"seriesMatches\\"'
+            stream = self._extract_flight_stream(html)
 
-            # Try matchesList first (live scores page)
-            idx = html.find(escaped_matches_list)
+            # Try matchesList first (live scores page), then seriesMatches
+            # (schedule pages)
+            idx = stream.find('"matchesList"')
             if idx == -1:
-                # Try seriesMatches (schedule pages)
-                idx = html.find(escaped_series_matches)
+                idx = stream.find('"seriesMatches"')
 
             if idx == -1:
                 self._record_parse_error("No match data found in HTML")
                 return None
 
-            # Extract a large chunk and unescape
-            # Large series like SA20 have 77+ matches, pages can be 250KB+
-            chunk_size = 500000  # 500KB to capture full series schedules
-            end_idx = min(len(html), idx + chunk_size)
-            chunk = html[idx:end_idx]
-
-            # Unescape JSON - convert \" to " and \\ to \
-            unescaped = chunk.replace('\\"', '"').replace("\\\\", "\\")
-
-            # Parse the match data
-            return self._parse_match_data(unescaped)
-
+            data = self._parse_match_data(stream, idx)
         except Exception as e:
             self._record_parse_error(f"JSON extraction failed: {e}")
             return None
 
-    def _parse_match_data(self, data: str) -> dict | None:
-        """Parse match data from unescaped JSON string."""
-        matches = []
+        if data:
+            self._cache.set(cache_key, data, CACHE_TTL_SCHEDULE)
+        return data
 
-        # Use manual extraction which is more reliable for nested JSON
-        # Find all matchId occurrences and extract surrounding data
-        match_id_pattern = r'"matchId":(\d+)'
+    def _extract_flight_stream(self, html: str) -> str:
+        """Decode and join all self.__next_f.push([id, "payload"]) payloads.
 
-        seen_ids: set = set()
-        for match in re.finditer(match_id_pattern, data):
-            match_id = match.group(1)
-            if match_id in seen_ids:
-                continue
-            seen_ids.add(match_id)
+        Scans the HTML once; each push array is decoded in place with
+        raw_decode (no slicing or unescaping copies of the page).
+        """
+        payloads = []
+        pos = html.find(NEXT_F_PUSH)
+        while pos != -1:
+            start = pos + len(NEXT_F_PUSH)
+            try:
+                value, end = _JSON_DECODER.raw_decode(html, start)
+            except ValueError:
+                end = start
+            else:
+                if isinstance(value, list) and len(value) > 1 and isinstance(value[1], str):
+                    payloads.append(value[1])
+            pos = html.find(NEXT_F_PUSH, end)
+        return "".join(payloads)
 
-            # Find the start of this match's matchInfo block
-            start = data.rfind('"matchInfo":{', 0, match.start())
-            if start == -1:
-                continue
+    def _parse_match_data(self, data: str, start: int = 0) -> dict | None:
+        """Parse every matchInfo object in the data stream from `start` on.
 
-            # Extract the matchInfo using manual field extraction
-            # This is more reliable than trying to parse nested JSON with regex
-            match_info = self._extract_match_info_manually(data[start : start + 2000])
-            if match_info:
+        Each "matchInfo" value is decoded in place with the JSON decoder;
+        objects the decoder rejects fall back to field extraction.
+        """
+        matches = []
+        seen_ids: set[int] = set()
+        marker = '"matchInfo":'
+
+        pos = data.find(marker, start)
+        while pos != -1:
+            obj_start = pos + len(marker)
+            try:
+                raw, end = _JSON_DECODER.raw_decode(data, obj_start)
+                match_info = self._normalize_match_info(raw)
+            except ValueError:
+                end = obj_start
+                match_info = self._extract_match_info_manually(data[pos : pos + 2000])
+
+            if match_info and match_info["matchId"] not in seen_ids:
+                seen_ids.add(match_info["matchId"])
                 matches.append(match_info)
+            pos = data.find(marker, end)
 
         if not matches:
             self._record_parse_error("No valid matches parsed")
@@ -290,8 +317,59 @@ class CricbuzzClient:
 
         return {"matches": matches}
 
+    def _normalize_match_info(self, raw: object) -> dict | None:
+        """Reduce a decoded matchInfo object to the fields we use.
+
+        Same shape as _extract_match_info_manually: numeric IDs/dates as
+        ints, teams with teamId/teamName/teamSName (+ imageId), venueInfo
+        with ground and city.
+        """
+        if not isinstance(raw, dict):
+            return None
+
+        info: dict = {}
+        for field_name in ("matchId", "seriesId", "startDate", "endDate"):
+            value = raw.get(field_name)
+            if isinstance(value, int) or (isinstance(value, str) and value.isdigit()):
+                info[field_name] = int(value)
+
+        for field_name in ("seriesName", "matchDesc", "matchFormat", "state", "status"):
+            value = raw.get(field_name)
+            if isinstance(value, str):
+                info[field_name] = value
+
+        for team_key in ("team1", "team2"):
+            team = raw.get(team_key)
+            if not isinstance(team, dict):
+                continue
+            team_id = team.get("teamId")
+            if not isinstance(team_id, int) or not all(
+                isinstance(team.get(k), str) for k in ("teamName", "teamSName")
+            ):
+                continue
+            info[team_key] = {
+                "teamId": team_id,
+                "teamName": team["teamName"],
+                "teamSName": team["teamSName"],
+            }
+            if isinstance(team.get("imageId"), int):
+                info[team_key]["imageId"] = team["imageId"]
+
+        venue = raw.get("venueInfo")
+        if (
+            isinstance(venue, dict)
+            and isinstance(venue.get("ground"), str)
+            and isinstance(venue.get("city"), str)
+        ):
+            info["venueInfo"] = {"ground": venue["ground"], "city": venue["city"]}
+
+        # Validate we got minimum required fields
+        if info.get("matchId") and info.get("team1") and info.get("team2"):
+            return info
+        return None
+
     def _extract_match_info_manually(self, data: str) -> dict | None:
-        """Manually extract match info when JSON parsing fails."""
+        """Manually extract match info when JSON decoding fails."""
         try:
             info = {}
 
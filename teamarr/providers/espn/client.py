@@ -5,6 +5,8 @@ No data transformation - just fetch and return JSON.
 
 Configuration via environment variables:
     ESPN_MAX_CONNECTIONS: Max concurrent connections (default: 100)
+    ESPN_INITIAL_CONCURRENCY: Starting concurrent request limit, adapted
+        between 4 and ESPN_MAX_CONNECTIONS at runtime (default: 20)
     ESPN_TIMEOUT: Request timeout in seconds (default: 10)
     ESPN_RETRY_COUNT: Number of retry attempts (default: 3)
 """
@@ -14,14 +16,20 @@ import os
 import random
 import threading
 import time
+from collections import deque
+from datetime import datetime
 
 import httpx
 
+from teamarr.providers.recording import provider_transports, replay_enabled
+from teamarr.utilities.dns_cache import warm_up_connections
+
 logger = logging.getLogger(__name__)
 
 # Environment variable configuration with defaults
 # These allow users with DNS throttling (PiHole, AdGuard) to tune performance
 ESPN_MAX_CONNECTIONS = int(os.environ.get("ESPN_MAX_CONNECTIONS", 100))
+ESPN_INITIAL_CONCURRENCY = int(os.environ.get("ESPN_INITIAL_CONCURRENCY", 20))
 ESPN_TIMEOUT = float(os.environ.get("ESPN_TIMEOUT", 10.0))
 ESPN_RETRY_COUNT = int(os.environ.get("ESPN_RETRY_COUNT", 3))
 
@@ -59,11 +67,135 @@ ESPN_TEAM_ID_CORRECTIONS: dict[tuple[str, str], str] = {
 }
 
 
+class AdaptiveConcurrencyLimiter:
+    """AIMD limit on concurrent ESPN requests.
+
+    Starts at ESPN_INITIAL_CONCURRENCY and, after every window of completed
+    requests, adds ADDITIVE_STEP slots while p95 latency and error rate stay
+    healthy and the limit was actually reached. Timeouts, 429s and connect
+    errors (DNS failures included) halve the limit immediately, at most once
+    per DECREASE_COOLDOWN. Bounded by [MIN_LIMIT, max_limit].
+
+    This keeps resolvers like PiHole/AdGuard from being overloaded without
+    leaving throughput unused on networks that can take more.
+    """
+
+    MIN_LIMIT = 4
+    ADDITIVE_STEP = 2
+    DECREASE_FACTOR = 0.5
+    DECREASE_COOLDOWN = 2.0  # seconds
+    WINDOW_SIZE = 50  # completed requests per evaluation
+    MAX_ERROR_RATE = 0.05
+    # p95 counts as healthy up to max(floor, factor x best p95 seen)
+    LATENCY_FLOOR = 1.0  # seconds
+    LATENCY_FACTOR = 2.0
+
+    def __init__(self, max_limit: int, initial_limit: int):
+        self._max_limit = max(self.MIN_LIMIT, max_limit)
+        self._limit = max(self.MIN_LIMIT, min(initial_limit, self._max_limit))
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._latencies: list[float] = []
+        self._errors = 0
+        self._best_p95: float | None = None
+        self._last_p95: float | None = None
+        self._last_decrease = 0.0
+        self._history: deque[dict] = deque(maxlen=50)
+        self._cond = threading.Condition()
+        self._record_change("initial")
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def acquire(self) -> None:
+        """Block until a request slot is available."""
+        with self._cond:
+            while self._in_flight >= self._limit:
+                self._cond.wait()
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    def release(self, latency: float, error: bool = False, congestion: bool = False) -> None:
+        """Release a slot and record the request outcome.
+
+        Args:
+            latency: Request duration in seconds
+            error: Request failed (any HTTP error or exception)
+            congestion: Failure signals overload (timeout, 429, connect error)
+        """
+        with self._cond:
+            self._in_flight -= 1
+            self._latencies.append(latency)
+            self._errors += error or congestion
+
+            if congestion:
+                now = time.monotonic()
+                if now - self._last_decrease >= self.DECREASE_COOLDOWN:
+                    self._last_decrease = now
+                    new_limit = max(self.MIN_LIMIT, int(self._limit * self.DECREASE_FACTOR))
+                    if new_limit != self._limit:
+                        self._limit = new_limit
+                        self._record_change("congestion")
+                    self._reset_window()
+            elif len(self._latencies) >= self.WINDOW_SIZE:
+                self._evaluate_window()
+
+            self._cond.notify_all()
+
+    def _evaluate_window(self) -> None:
+        """Additive increase if the finished window was healthy and saturated."""
+        latencies = sorted(self._latencies)
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        error_rate = self._errors / len(latencies)
+        saturated = self._peak_in_flight >= self._limit
+        self._last_p95 = p95
+        if self._best_p95 is None or p95 < self._best_p95:
+            self._best_p95 = p95
+
+        healthy_p95 = max(self.LATENCY_FLOOR, self.LATENCY_FACTOR * self._best_p95)
+        if error_rate > self.MAX_ERROR_RATE or p95 > healthy_p95:
+            new_limit = max(self.MIN_LIMIT, int(self._limit * self.DECREASE_FACTOR))
+            if new_limit != self._limit:
+                self._limit = new_limit
+                self._record_change("errors" if error_rate > self.MAX_ERROR_RATE else "latency")
+        elif saturated and self._limit < self._max_limit:
+            self._limit = min(self._max_limit, self._limit + self.ADDITIVE_STEP)
+            self._record_change("healthy")
+        self._reset_window()
+
+    def _reset_window(self) -> None:
+        self._latencies = []
+        self._errors = 0
+        self._peak_in_flight = self._in_flight
+
+    def _record_change(self, reason: str) -> None:
+        self._history.append(
+            {"at": datetime.now().isoformat(), "limit": self._limit, "reason": reason}
+        )
+        if reason != "initial":
+            logger.debug("[ESPN] Concurrency limit -> %d (%s)", self._limit, reason)
+
+    def stats(self) -> dict:
+        """Current limit, recent latency and limit history for UI feedback."""
+        with self._cond:
+            return {
+                "limit": self._limit,
+                "min_limit": self.MIN_LIMIT,
+                "max_limit": self._max_limit,
+                "in_flight": self._in_flight,
+                "p95_ms": round(self._last_p95 * 1000) if self._last_p95 is not None else None,
+                "history": list(self._history),
+            }
+
+
 class ESPNClient:
     """Low-level ESPN API client.
 
     Connection pool is configured to maximize keepalive connections, reducing
     DNS lookups. This helps users with rate-limited DNS (PiHole, AdGuard).
+    Concurrent requests are capped by an AdaptiveConcurrencyLimiter that
+    finds the level the network and resolver can sustain.
 
     All settings can be tuned via environment variables for constrained environments.
     """
@@ -81,6 +213,10 @@ class ESPNClient:
         )
         self._client: httpx.Client | None = None
         self._lock = threading.Lock()
+        self._concurrency = AdaptiveConcurrencyLimiter(
+            max_limit=self._max_connections,
+            initial_limit=ESPN_INITIAL_CONCURRENCY,
+        )
 
     def _get_client(self) -> httpx.Client:
         if self._client is None:
@@ -89,12 +225,14 @@ class ESPNClient:
                 if self._client is None:
                     # Set keepalive = max_connections to maximize connection reuse
                     # This reduces DNS lookups, helping users with DNS throttling
+                    limits = httpx.Limits(
+                        max_connections=self._max_connections,
+                        max_keepalive_connections=self._max_connections,
+                    )
                     self._client = httpx.Client(
                         timeout=self._timeout,
-                        limits=httpx.Limits(
-                            max_connections=self._max_connections,
-                            max_keepalive_connections=self._max_connections,
-                        ),
+                        limits=limits,
+                        **provider_transports(limits),
                     )
         return self._client
 
@@ -129,8 +267,7 @@ class ESPNClient:
 
         for attempt in range(self._retry_count + RATE_LIMIT_MAX_RETRIES):
             try:
-                client = self._get_client()
-                response = client.get(url, params=params)
+                response = self._get(url, params)
 
                 # Handle 429 rate limit separately with longer backoff
                 if response.status_code == 429:
@@ -192,6 +329,49 @@ class ESPNClient:
 
         return None
 
+    def _get(self, url: str, params: dict | None) -> httpx.Response:
+        """GET under the adaptive concurrency limit, recording the outcome."""
+        client = self._get_client()
+        self._concurrency.acquire()
+        start = time.monotonic()
+        error = congestion = False
+        try:
+            response = client.get(url, params=params)
+            congestion = response.status_code == 429
+            error = response.status_code >= 500
+            return response
+        except (httpx.TimeoutException, httpx.ConnectError):
+            # Timeouts and connect/DNS failures mean we're pushing too hard
+            congestion = True
+            raise
+        except Exception:
+            error = True
+            raise
+        finally:
+            self._concurrency.release(time.monotonic() - start, error, congestion)
+
+    # Connections opened per ESPN host before a generation fans out
+    WARM_UP_CONNECTIONS = 4
+
+    def warm_up(self) -> None:
+        """Resolve ESPN hosts once and open a few keepalive connections.
+
+        Call before parallel fetching so the first burst of requests reuses
+        warm connections instead of all connecting (and resolving) at once.
+        """
+        if replay_enabled():
+            return
+        hosts = [ESPN_BASE_URL.split("/apis/")[0], ESPN_CORE_URL.split("/v2/")[0]]
+        warm_up_connections(
+            self._get_client(),
+            [f"{host}/" for host in hosts],
+            connections=min(self.WARM_UP_CONNECTIONS, self._concurrency.limit),
+        )
+
+    def concurrency_stats(self) -> dict:
+        """Current adaptive concurrency limit and its recent history."""
+        return self._concurrency.stats()
+
     def _reset_client(self) -> None:
         """Reset the HTTP client to clear stale connections."""
         with self._lock:
@@ -12,11 +12,13 @@ API keys are constants since they're public keys from official league websites.
 
 import logging
 import threading
-from datetime import date
+from dataclasses import dataclass, field
+from datetime import date, timedelta
 
 import httpx
 
 from teamarr.core.interfaces import LeagueMappingSource
+from teamarr.providers.recording import provider_transports
 from teamarr.utilities.cache import TTLCache, make_cache_key
 
 logger = logging.getLogger(__name__)
@@ -79,6 +81,38 @@ API_KEYS: dict[str, str] = {
 }
 
 
+@dataclass
+class ScheduleIndex:
+    """A league's season schedule with lookup indexes.
+
+    Built once per schedule cache fill so per-date and per-team lookups
+    don't rescan the whole season.
+    """
+
+    games: list[dict]
+    by_date: dict[str, list[dict]] = field(default_factory=dict)  # date_played -> games
+    by_team: dict[str, list[dict]] = field(default_factory=dict)  # team_id -> games by date
+    by_id: dict[str, dict] = field(default_factory=dict)  # game_id -> game
+
+    @classmethod
+    def build(cls, games: list[dict]) -> "ScheduleIndex":
+        index = cls(games=games)
+        for game in games:
+            date_played = game.get("date_played")
+            if date_played:
+                index.by_date.setdefault(date_played, []).append(game)
+            home, visiting = game.get("home_team"), game.get("visiting_team")
+            for team_id in (home, visiting) if home != visiting else (home,):
+                if team_id:
+                    index.by_team.setdefault(team_id, []).append(game)
+            game_id = game.get("game_id")
+            if game_id:
+                index.by_id.setdefault(str(game_id), game)
+        for team_games in index.by_team.values():
+            team_games.sort(key=lambda g: g.get("date_played", ""))
+        return index
+
+
 class HockeyTechClient:
     """Low-level HockeyTech API client.
 
@@ -107,9 +141,11 @@ class HockeyTechClient:
         if self._client is None:
             with self._client_lock:
                 if self._client is None:
+                    limits = httpx.Limits(max_connections=100, max_keepalive_connections=50)
                     self._client = httpx.Client(
                         timeout=self._timeout,
-                        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                        limits=limits,
+                        **provider_transports(limits),
                     )
         return self._client
 
@@ -210,10 +246,26 @@ class HockeyTechClient:
         Returns:
             List of game dicts from SiteKit.Schedule
         """
+        index = self.get_schedule_index(league)
+        return index.games if index else []
+
+    def get_schedule_index(self, league: str) -> ScheduleIndex | None:
+        """Get the season schedule with date/team/game indexes.
+
+        The index is cached alongside the schedule, so it is rebuilt only
+        when the schedule is re-fetched. Callers can use object identity to
+        detect a new season load.
+
+        Args:
+            league: League code (ohl, whl, qmjhl, ahl, pwhl, ushl)
+
+        Returns:
+            ScheduleIndex, or None if the league is unknown or the fetch failed
+        """
         config = self.get_league_config(league)
         if not config:
             logger.warning("[HOCKEYTECH] Unknown league: %s", league)
-            return []
+            return None
 
         client_code, api_key = config
         cache_key = make_cache_key("hockeytech", "schedule", league)
@@ -224,19 +276,26 @@ class HockeyTechClient:
 
         data = self._request(client_code, api_key, "schedule")
         if not data:
-            return []
+            return None
 
         schedule = data.get("SiteKit", {}).get("Schedule", [])
+        index = ScheduleIndex.build(schedule)
         if schedule:
-            self._cache.set(cache_key, schedule, CACHE_TTL_SCHEDULE)
-            logger.debug("[HOCKEYTECH] Cached %d games for %s", len(schedule), league)
+            self._cache.set(cache_key, index, CACHE_TTL_SCHEDULE)
+            logger.debug(
+                "[HOCKEYTECH] Cached %d games for %s (%d dates, %d teams)",
+                len(schedule),
+                league,
+                len(index.by_date),
+                len(index.by_team),
+            )
 
-        return schedule
+        return index
 
     def get_events_by_date(self, league: str, target_date: date) -> list[dict]:
         """Get games for a specific date.
 
-        Filters the full schedule by date.
+        Uses the schedule's date index.
 
         Args:
             league: League code (ohl, whl, qmjhl, ahl, pwhl, ushl)
@@ -245,10 +304,10 @@ class HockeyTechClient:
         Returns:
             List of game dicts for that date
         """
-        schedule = self.get_schedule(league)
-        date_str = target_date.strftime("%Y-%m-%d")
-
-        return [game for game in schedule if game.get("date_played") == date_str]
+        index = self.get_schedule_index(league)
+        if not index:
+            return []
+        return list(index.by_date.get(target_date.strftime("%Y-%m-%d"), []))
 
     # Days to look back for .last variable resolution
     DAYS_BACK = 7
@@ -256,7 +315,7 @@ class HockeyTechClient:
     def get_team_schedule(self, league: str, team_id: str, days_ahead: int = 14) -> list[dict]:
         """Get schedule for a specific team including past and future games.
 
-        Filters the full schedule for games where this team is home or away.
+        Uses the schedule's team index (already sorted by date).
         Includes past games (DAYS_BACK) for .last template variable resolution.
 
         Args:
@@ -267,29 +326,26 @@ class HockeyTechClient:
         Returns:
             List of game dicts for this team (sorted by date)
         """
-        from datetime import timedelta
+        index = self.get_schedule_index(league)
+        if not index:
+            return []
 
-        schedule = self.get_schedule(league)
         today = date.today()
         start_date = today - timedelta(days=self.DAYS_BACK)
         end_date = today + timedelta(days=days_ahead)
 
         team_games = []
-        for game in schedule:
-            # Check if team is home or away
-            if game.get("home_team") == team_id or game.get("visiting_team") == team_id:
-                # Check date is within range (includes past games)
-                game_date_str = game.get("date_played")
-                if game_date_str:
-                    try:
-                        game_date = date.fromisoformat(game_date_str)
-                        if start_date <= game_date <= end_date:
-                            team_games.append(game)
-                    except ValueError:
-                        continue
-
-        # Sort by date
-        team_games.sort(key=lambda g: g.get("date_played", ""))
+        for game in index.by_team.get(team_id, []):
+            # Check date is within range (includes past games)
+            game_date_str = game.get("date_played")
+            if game_date_str:
+                try:
+                    game_date = date.fromisoformat(game_date_str)
+                    if start_date <= game_date <= end_date:
+                        team_games.append(game)
+                except ValueError:
+                    continue
+
         return team_games
 
     def get_teams(self, league: str) -> list[dict]:
@@ -352,7 +408,7 @@ class HockeyTechClient:
     def get_game(self, league: str, game_id: str) -> dict | None:
         """Get a specific game by ID.
 
-        Searches the full schedule for the game.
+        Uses the schedule's game ID index.
 
         Args:
             league: League code
@@ -361,11 +417,10 @@ class HockeyTechClient:
         Returns:
             Game dict or None if not found
         """
-        schedule = self.get_schedule(league)
-        for game in schedule:
-            if str(game.get("game_id")) == str(game_id):
-                return game
-        return None
+        index = self.get_schedule_index(league)
+        if not index:
+            return None
+        return index.by_id.get(str(game_id))
 
     def cache_stats(self) -> dict:
         """Get cache statistics."""
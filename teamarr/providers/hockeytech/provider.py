@@ -6,6 +6,7 @@ Used for CHL leagues (OHL, WHL, QMJHL) plus AHL, PWHL, USHL.
 
 import logging
 import re
+import threading
 from datetime import UTC, date, datetime
 
 from teamarr.core import (
@@ -17,7 +18,7 @@ from teamarr.core import (
     TeamStats,
     Venue,
 )
-from teamarr.providers.hockeytech.client import HockeyTechClient
+from teamarr.providers.hockeytech.client import HockeyTechClient, ScheduleIndex
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +38,10 @@ class HockeyTechProvider(SportsProvider):
         self._client = client or HockeyTechClient(
             league_mapping_source=league_mapping_source,
         )
+        # Parsed events per league, tied to the schedule index they came from:
+        # league -> (index, {game_id: Event | None})
+        self._parsed: dict[str, tuple[ScheduleIndex, dict[str, Event | None]]] = {}
+        self._parsed_lock = threading.Lock()
 
     @property
     def name(self) -> str:
@@ -48,15 +53,13 @@ class HockeyTechProvider(SportsProvider):
     def get_events(self, league: str, target_date: date) -> list[Event]:
         """Get events for a league on a specific date.
 
-        Filters the full season schedule by date.
+        Uses the season schedule's date index; games are parsed once per load.
         """
-        games = self._client.get_events_by_date(league, target_date)
-        events = []
-        for game in games:
-            event = self._parse_event(game, league)
-            if event:
-                events.append(event)
-        return events
+        index = self._client.get_schedule_index(league)
+        if not index:
+            return []
+        games = index.by_date.get(target_date.strftime("%Y-%m-%d"), [])
+        return self._events_for(index, games, league)
 
     def get_team_schedule(
         self,
@@ -66,14 +69,13 @@ class HockeyTechProvider(SportsProvider):
     ) -> list[Event]:
         """Get upcoming schedule for a team.
 
-        Filters the full schedule for games where this team is home or away.
+        Uses the season schedule's team index; games are parsed once per load.
         """
+        index = self._client.get_schedule_index(league)
+        if not index:
+            return []
         games = self._client.get_team_schedule(league, team_id, days_ahead)
-        events = []
-        for game in games:
-            event = self._parse_event(game, league)
-            if event:
-                events.append(event)
+        events = self._events_for(index, games, league)
         # Sort by start time
         events.sort(key=lambda e: e.start_time)
         return events
@@ -88,10 +90,14 @@ class HockeyTechProvider(SportsProvider):
 
     def get_event(self, event_id: str, league: str) -> Event | None:
         """Get a specific event by ID."""
-        game = self._client.get_game(league, event_id)
+        index = self._client.get_schedule_index(league)
+        if not index:
+            return None
+        game = index.by_id.get(str(event_id))
         if not game:
             return None
-        return self._parse_event(game, league)
+        events = self._events_for(index, [game], league)
+        return events[0] if events else None
 
     def get_team_stats(self, team_id: str, league: str) -> TeamStats | None:
         """Get team statistics.
@@ -124,6 +130,29 @@ class HockeyTechProvider(SportsProvider):
         mappings = self._league_mapping_source.get_leagues_for_provider("hockeytech")
         return [m.league_code for m in mappings]
 
+    def _events_for(self, index: ScheduleIndex, games: list[dict], league: str) -> list[Event]:
+        """Convert games to Events, parsing each game once per schedule load.
+
+        Parsed events are kept per league and dropped when the client returns
+        a new ScheduleIndex (schedule cache refilled).
+        """
+        with self._parsed_lock:
+            entry = self._parsed.get(league)
+            if entry is None or entry[0] is not index:
+                entry = (index, {})
+                self._parsed[league] = entry
+            parsed = entry[1]
+
+            events = []
+            for game in games:
+                key = str(game.get("game_id"))
+                if key not in parsed:
+                    parsed[key] = self._parse_event(game, league)
+                event = parsed[key]
+                if event:
+                    events.append(event)
+            return events
+
     def _parse_event(self, game: dict, league: str) -> Event | None:
         """Parse HockeyTech game data into Event dataclass."""
         try:
@@ -0,0 +1,225 @@
+"""Provider record/replay for offline benchmarking and deterministic runs.
+
+Record mode writes every provider HTTP response (method, URL, params,
+status, headers, body) to a local archive, gzip-compressed, one file per
+request. Replay mode serves responses from that archive through the same
+httpx client interfaces, so ESPN, TSDB, HockeyTech and Cricbuzz clients
+run unchanged with no network.
+
+Configured via environment variables (read when a client is created):
+- PROVIDER_RECORD_DIR: Record responses into this directory
+- PROVIDER_REPLAY_DIR: Serve responses from this directory (takes precedence)
+- PROVIDER_REPLAY_LATENCY_MS: Artificial latency per replayed request (default 0)
+
+Requests are keyed by method + URL with sorted query params. The TSDB API
+key in the URL path is redacted so archives are shareable and replay with
+any key. Dates in query params (TSDB eventsday.php?d=2026-10-18, ESPN
+scoreboard?dates=20261018) are keyed as offsets from the local date the
+request was made ("today+1d"), so an archive recorded on one day replays on
+any later day: today's scoreboard request is served the recorded day's
+scoreboard. Replay is day-relative by design: the reference is always the
+replaying day, and the recording date isn't stored. Response bodies are
+served as recorded and keep their original dates. Requests missing from the
+archive get a 404 and are logged.
+With neither variable set, clients get the caching-DNS network transport
+plus proxy mounts for HTTP(S)_PROXY/NO_PROXY (see utilities.dns_cache).
+
+Usage:
+    PROVIDER_RECORD_DIR=/tmp/archive python app.py   # record a generation
+    PROVIDER_REPLAY_DIR=/tmp/archive python app.py   # replay it offline
+
+Record with the same settings (teams, groups, lookahead days) you replay
+with; a request the recording run never made is a miss.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from base64 import b64decode, b64encode
+from datetime import date
+from pathlib import Path
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# TSDB puts the API key in the URL path: /api/v1/json/<key>/endpoint.php
+_TSDB_KEY_PATTERN = re.compile(r"(thesportsdb\.com/api/v\d+/json/)[^/]+")
+
+# YYYY-MM-DD or YYYYMMDD not embedded in a longer number
+_DATE_PATTERN = re.compile(r"(?<!\d)(\d{4})(-?)(\d{2})\2(\d{2})(?!\d)")
+
+# Only dates this close to today are keyed relatively (larger offsets are
+# more likely IDs that happen to look like dates)
+_MAX_DATE_OFFSET_DAYS = 366
+
+# Response headers worth keeping (others describe the original transfer)
+_KEPT_HEADERS = ("content-type", "retry-after")
+
+
+def _normalized_url(url: httpx.URL) -> str:
+    """URL with sorted query params and secrets redacted."""
+    params = sorted(url.params.multi_items())
+    base = _TSDB_KEY_PATTERN.sub(r"\1{key}", str(url.copy_with(query=None)))
+    return str(httpx.URL(base, params=params))
+
+
+def _relative_dates(value: str, today: date) -> str:
+    """Replace dates in a query param value with offsets from today."""
+
+    def relative(match: re.Match) -> str:
+        try:
+            day = date(int(match[1]), int(match[3]), int(match[4]))
+        except ValueError:
+            return match[0]
+        offset = (day - today).days
+        if abs(offset) > _MAX_DATE_OFFSET_DAYS:
+            return match[0]
+        return f"{{today{offset:+d}d}}"
+
+    return _DATE_PATTERN.sub(relative, value)
+
+
+class ProviderArchive:
+    """Directory of recorded provider responses."""
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+
+    def key(self, request: httpx.Request, today: date | None = None) -> str:
+        """Archive key for a request, with dates relative to today.
+
+        Args:
+            request: Request to key
+            today: Date offsets are taken from (default: local date now)
+        """
+        today = today or date.today()
+        url = httpx.URL(_normalized_url(request.url))
+        params = [(k, _relative_dates(v, today)) for k, v in url.params.multi_items()]
+        raw = f"{request.method} {url.copy_with(query=None)}?{httpx.QueryParams(params)}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def save(self, request: httpx.Request, response: httpx.Response) -> None:
+        """Write a response to the archive (atomic per file)."""
+        url = _normalized_url(request.url)
+        record = {
+            "method": request.method,
+            "url": url,
+            "params": dict(httpx.URL(url).params.multi_items()),
+            "status": response.status_code,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() in _KEPT_HEADERS},
+            "body": b64encode(response.content).decode("ascii"),
+        }
+        self.path.mkdir(parents=True, exist_ok=True)
+        target = self.path / f"{self.key(request)}.json.gz"
+        tmp = target.with_name(f"{target.name}.{threading.get_ident()}.tmp")
+        try:
+            tmp.write_bytes(gzip.compress(json.dumps(record).encode()))
+            os.replace(tmp, target)
+        except OSError as e:
+            logger.warning("[RECORD] Failed to write %s: %s", url, e)
+
+    def load(self, request: httpx.Request) -> dict | None:
+        """Read a recorded response, or None if not in the archive."""
+        target = self.path / f"{self.key(request)}.json.gz"
+        try:
+            return json.loads(gzip.decompress(target.read_bytes()))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("[REPLAY] Unreadable archive entry %s: %s", target.name, e)
+            return None
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """Transport that performs real requests and archives the responses."""
+
+    def __init__(self, archive: ProviderArchive, inner: httpx.BaseTransport):
+        self._archive = archive
+        self._inner = inner
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self._inner.handle_request(request)
+        response.read()
+        self._archive.save(request, response)
+        return response
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """Transport that serves archived responses without network access."""
+
+    def __init__(self, archive: ProviderArchive, latency_seconds: float = 0.0):
+        self._archive = archive
+        self._latency = latency_seconds
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self._latency > 0:
+            time.sleep(self._latency)
+
+        record = self._archive.load(request)
+        if record is None:
+            logger.warning("[REPLAY] No recorded response for %s", _normalized_url(request.url))
+            return httpx.Response(404, request=request)
+
+        return httpx.Response(
+            record["status"],
+            headers=record.get("headers") or {},
+            content=b64decode(record["body"]),
+            request=request,
+        )
+
+
+def replay_enabled() -> bool:
+    """True if provider responses are served from a replay archive."""
+    return bool(os.getenv("PROVIDER_REPLAY_DIR"))
+
+
+def provider_transports(limits: httpx.Limits | None = None) -> dict:
+    """httpx.Client transport/mounts kwargs based on record/replay settings.
+
+    Network transports resolve hostnames through the shared DNS cache;
+    environment proxies are honoured via mounts (recorded too in record mode).
+
+    Args:
+        limits: Connection limits for the network transports
+
+    Returns:
+        {"transport": ..., "mounts": ...} for httpx.Client(**kwargs)
+    """
+    from teamarr.utilities.dns_cache import proxy_mounts
+
+    replay_dir = os.getenv("PROVIDER_REPLAY_DIR")
+    if replay_dir:
+        latency_ms = float(os.getenv("PROVIDER_REPLAY_LATENCY_MS", "0") or 0)
+        logger.info("[REPLAY] Serving provider responses from %s", replay_dir)
+        # Offline: every URL goes to the archive, proxies don't apply
+        return {"transport": ReplayTransport(ProviderArchive(replay_dir), latency_ms / 1000)}
+
+    mounts = proxy_mounts(limits)
+    record_dir = os.getenv("PROVIDER_RECORD_DIR")
+    if record_dir:
+        logger.info("[RECORD] Recording provider responses to %s", record_dir)
+        archive = ProviderArchive(record_dir)
+        return {
+            "transport": RecordingTransport(archive, _network_transport(limits)),
+            "mounts": {
+                pattern: RecordingTransport(archive, inner) if inner else None
+                for pattern, inner in mounts.items()
+            },
+        }
+
+    return {"transport": _network_transport(limits), "mounts": mounts}
+
+
+def _network_transport(limits: httpx.Limits | None) -> httpx.BaseTransport:
+    from teamarr.utilities.dns_cache import CachingDNSTransport
+
+    return CachingDNSTransport(limits=limits) if limits else CachingDNSTransport()
@@ -12,29 +12,42 @@ Caching is aggressive to stay within rate limits:
 - Teams in league: 24 hours (teams rarely change)
 - League next events: 1 hour
 - Team search: 24 hours
+- Season schedule: 30 minutes (one call covers every date of the season)
+
+Season bulk mode:
+- eventsseason.php returns a league's whole season in one call
+- get_season_schedule() indexes it by date and team (SeasonSchedule)
+- Providers slice dates/teams locally instead of one eventsday call per day
+- Premium only: free tier truncates season responses to a handful of
+  events, so the call is skipped and per-day endpoints are used instead
 
 Rate limit handling:
-- Preemptive: Sliding window limiter prevents hitting API limit
+- Preemptive: Token bucket limiter prevents hitting API limit. With a
+  db_factory the bucket is stored in SQLite and shared by every thread and
+  process; today/tomorrow requests run at high priority
 - Reactive: If we get 429, wait and retry (tracks statistics)
 - All waits are tracked for UI feedback
 
 Dependencies are injected via constructor:
 - LeagueMappingSource: For league configuration lookup
 - api_key: From database settings (passed by factory in providers/__init__.py)
+- db_factory: Optional, only for the shared rate limit bucket
 
-This client has NO direct database access - all config is injected.
+Config is injected; the only database access is the shared rate limit bucket.
 """
 
 import logging
+import sqlite3
 import threading
 import time
-from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import date, datetime
 
 import httpx
 
 from teamarr.core import LeagueMappingSource
+from teamarr.providers.recording import provider_transports
 from teamarr.utilities.cache import TTLCache, make_cache_key
 
 logger = logging.getLogger(__name__)
@@ -45,6 +58,7 @@ TSDB_BASE_URL = "https://www.thesportsdb.com/api/v1/json"
 TSDB_CACHE_TTL_TEAMS = 24 * 60 * 60  # 24 hours - teams in league
 TSDB_CACHE_TTL_NEXT_EVENTS = 1 * 60 * 60  # 1 hour - league next events
 TSDB_CACHE_TTL_SEARCH = 24 * 60 * 60  # 24 hours - team search
+TSDB_CACHE_TTL_SEASON = 30 * 60  # 30 minutes - season schedule (covers today)
 
 
 def get_cache_ttl_for_date(target_date: date) -> int:
@@ -112,26 +126,64 @@ class RateLimitStats:
         }
 
 
+# Request priorities for the rate limiter (lower = served first)
+PRIORITY_HIGH = 0  # Today/tomorrow schedules, season schedules
+PRIORITY_NORMAL = 1
+
+
 class RateLimiter:
-    """Sliding window rate limiter with statistics tracking.
+    """Token bucket rate limiter with statistics tracking.
+
+    The bucket holds up to BURST tokens and refills at
+    (max_requests - BURST) / window_seconds per second, so any window_seconds
+    span allows at most a full bucket plus one window of refill, i.e.
+    max_requests. Each request takes one token; when the bucket is empty the
+    caller sleeps exactly until the next token.
+
+    With a db_factory the bucket lives in the rate_limit_buckets table, so
+    every thread and process (API, scheduler, manual generation) draws from
+    one budget instead of each assuming the full limit. Without one the
+    bucket is kept in memory. If the table is locked for longer than
+    SHARED_BUSY_TIMEOUT (e.g. behind a generation write) or SQLite fails,
+    the in-memory bucket is used for SHARED_RETRY_SECONDS before the
+    shared one is tried again.
+
+    Normal-priority requests leave HIGH_PRIORITY_RESERVE tokens in the bucket
+    and yield to waiting high-priority requests in this process.
 
     Tracks all wait events for UI feedback. Never fails - always waits and continues.
     Premium API keys bypass rate limiting entirely.
     """
 
-    # Cooldown duration when internal limit is hit (seconds)
-    INTERNAL_COOLDOWN = 30.0
+    # Bucket capacity (capped at half of max_requests)
+    BURST = 5
+    # Tokens normal-priority requests leave for high-priority ones
+    HIGH_PRIORITY_RESERVE = 3
+    # Longest single sleep before re-checking the bucket (seconds)
+    MAX_SLEEP = 5.0
+    # Longest wait for the shared bucket's lock before using the local one
+    SHARED_BUSY_TIMEOUT = 1.0
+    # How long to stay on the local bucket after the shared one fails
+    SHARED_RETRY_SECONDS = 60.0
 
     def __init__(
         self,
         max_requests: int = 30,
         window_seconds: float = 60.0,
         is_premium: bool = False,
+        db_factory: Callable | None = None,
+        bucket_name: str = "tsdb",
     ):
-        self._max_requests = max_requests
-        self._window = window_seconds
+        self._capacity = float(max(1, min(self.BURST, max_requests // 2)))
+        # tokens per second
+        self._refill_rate = max(1.0, max_requests - self._capacity) / window_seconds
         self._is_premium = is_premium
-        self._requests: deque[float] = deque()
+        self._db_factory = db_factory
+        self._bucket_name = bucket_name
+        self._tokens = self._capacity
+        self._updated = time.time()
+        self._high_waiting = 0
+        self._shared_retry_at = 0.0  # shared bucket skipped until this time
         self._lock = threading.Lock()
         self._stats = RateLimitStats()
 
@@ -145,18 +197,38 @@ class RateLimiter:
         self._stats = RateLimitStats()
 
     def record_reactive_wait(self, wait_seconds: float, attempt: int, max_attempts: int) -> None:
-        """Record a reactive wait (429 response from API)."""
+        """Record a reactive wait (429 response from API).
+
+        Also empties the bucket so other threads/processes sharing it stop
+        sending requests the API would reject.
+        """
         with self._lock:
             self._stats.reactive_waits += 1
             self._stats.total_wait_seconds += wait_seconds
             self._stats.last_wait_at = datetime.now()
             self._stats.last_wait_seconds = wait_seconds
+            self._tokens, self._updated = 0.0, time.time()
+
+        if self._db_factory:
+            try:
+                with self._db_factory() as conn:
+                    conn.execute(
+                        """INSERT INTO rate_limit_buckets (name, tokens, updated_at)
+                           VALUES (?, 0, ?)
+                           ON CONFLICT (name) DO UPDATE SET
+                               tokens = 0, updated_at = excluded.updated_at""",
+                        (self._bucket_name, time.time()),
+                    )
+            except sqlite3.Error as e:
+                logger.debug("[TSDB] Failed to drain shared rate limit bucket: %s", e)
 
-    def acquire(self) -> None:
-        """Block until a request slot is available. Never fails.
+    def acquire(self, priority: int = PRIORITY_NORMAL) -> None:
+        """Block until a token is available. Never fails.
 
         Premium API keys skip rate limiting entirely.
-        Free API keys wait 30 seconds when limit is reached.
+
+        Args:
+            priority: PRIORITY_HIGH or PRIORITY_NORMAL
         """
         # Premium keys bypass rate limiting
         if self._is_premium:
@@ -164,41 +236,158 @@ class RateLimiter:
                 self._stats.total_requests += 1
             return
 
+        high = priority <= PRIORITY_HIGH
+        if high:
+            with self._lock:
+                self._high_waiting += 1
+
+        waited = 0.0
+        try:
+            while True:
+                wait = self._take(high)
+                if wait <= 0:
+                    break
+                if waited == 0:
+                    logger.info("[TSDB] Rate limit budget spent, next request slot in %.1fs", wait)
+                sleep = min(wait, self.MAX_SLEEP)
+                time.sleep(sleep)
+                waited += sleep
+        finally:
+            if high:
+                with self._lock:
+                    self._high_waiting -= 1
+
         with self._lock:
             self._stats.total_requests += 1
-            now = time.time()
-
-            # Remove expired timestamps
-            while self._requests and self._requests[0] < now - self._window:
-                self._requests.popleft()
-
-            # If at limit, wait with fixed cooldown
-            if len(self._requests) >= self._max_requests:
-                # Track the wait
+            if waited > 0:
                 self._stats.preemptive_waits += 1
-                self._stats.total_wait_seconds += self.INTERNAL_COOLDOWN
+                self._stats.total_wait_seconds += waited
                 self._stats.last_wait_at = datetime.now()
-                self._stats.last_wait_seconds = self.INTERNAL_COOLDOWN
+                self._stats.last_wait_seconds = waited
+
+    def _take(self, high: bool) -> float:
+        """Take a token if available.
 
-                logger.info(
-                    f"TSDB free API limit reached ({self._max_requests}/min). "
-                    f"Waiting {self.INTERNAL_COOLDOWN:.0f}s..."
+        Returns:
+            0 if a token was taken, else seconds until one should be available
+        """
+        if not high:
+            with self._lock:
+                if self._high_waiting:
+                    return 1 / self._refill_rate
+        # Normal requests need the reserve left over after their token
+        needed = 1.0 if high else 1.0 + min(self.HIGH_PRIORITY_RESERVE, self._capacity - 1)
+
+        if self._db_factory and time.time() >= self._shared_retry_at:
+            try:
+                return self._take_shared(needed)
+            except sqlite3.Error as e:
+                logger.warning(
+                    "[TSDB] Shared rate limit unavailable, using local budget for %.0fs: %s",
+                    self.SHARED_RETRY_SECONDS,
+                    e,
                 )
+                self._shared_retry_at = time.time() + self.SHARED_RETRY_SECONDS
 
-                # Release lock while sleeping so other threads can check stats
-                self._lock.release()
-                try:
-                    time.sleep(self.INTERNAL_COOLDOWN)
-                finally:
-                    self._lock.acquire()
+        with self._lock:
+            self._tokens, self._updated, wait = self._refill_and_take(
+                self._tokens, self._updated, needed
+            )
+        return wait
+
+    def _take_shared(self, needed: float) -> float:
+        """Take a token from the SQLite bucket (one IMMEDIATE transaction)."""
+        with self._db_factory() as conn:
+            # Short lock wait: a token take must not queue behind long writes
+            conn.execute(f"PRAGMA busy_timeout={int(self.SHARED_BUSY_TIMEOUT * 1000)}")
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT tokens, updated_at FROM rate_limit_buckets WHERE name = ?",
+                (self._bucket_name,),
+            ).fetchone()
+            if row:
+                tokens, updated = row["tokens"], row["updated_at"]
+            else:
+                tokens, updated = self._capacity, time.time()
+            tokens, updated, wait = self._refill_and_take(tokens, updated, needed)
+            conn.execute(
+                """INSERT INTO rate_limit_buckets (name, tokens, updated_at)
+                   VALUES (?, ?, ?)
+                   ON CONFLICT (name) DO UPDATE SET
+                       tokens = excluded.tokens, updated_at = excluded.updated_at""",
+                (self._bucket_name, tokens, updated),
+            )
+            conn.commit()
+        return wait
 
-                logger.info("[TSDB] Cooldown complete, resuming API requests")
+    def _refill_and_take(
+        self, tokens: float, updated: float, needed: float
+    ) -> tuple[float, float, float]:
+        """Refill a bucket to now and take one token if `needed` are present.
 
-                # Clear the window after cooldown
-                now = time.time()
-                self._requests.clear()
+        Returns:
+            (tokens, updated_at, wait_seconds) - wait is 0 if a token was taken
+        """
+        now = time.time()
+        tokens = min(self._capacity, tokens + max(0.0, now - updated) * self._refill_rate)
+        if tokens >= needed:
+            return tokens - 1, now, 0.0
+        return tokens, now, (needed - tokens) / self._refill_rate
 
-            self._requests.append(time.time())
+
+@dataclass
+class SeasonSchedule:
+    """A league's season schedule indexed for local date/team slicing.
+
+    Attributes:
+        season: Season string the events came from (e.g. "2025-2026")
+        events: Raw TSDB event dicts
+        by_date: dateEvent (YYYY-MM-DD) -> events on that date
+        by_team: idTeam -> events involving that team (home or away)
+        first_date: Earliest dateEvent in the season (None if no events)
+        last_date: Latest dateEvent in the season (None if no events)
+        complete: True once built from a season response
+    """
+
+    season: str | None
+    events: list[dict] = field(default_factory=list)
+    by_date: dict[str, list[dict]] = field(default_factory=dict)
+    by_team: dict[str, list[dict]] = field(default_factory=dict)
+    first_date: str | None = None
+    last_date: str | None = None
+    complete: bool = False
+
+    @classmethod
+    def build(cls, season: str | None, events: list[dict], complete: bool) -> "SeasonSchedule":
+        """Index raw season events by date and team."""
+        schedule = cls(season=season, events=events, complete=complete)
+        for event in events:
+            event_date = event.get("dateEvent")
+            if not event_date:
+                continue
+            schedule.by_date.setdefault(event_date, []).append(event)
+            for prefix in ("Home", "Away"):
+                team_id = event.get(f"id{prefix}Team")
+                if team_id:
+                    schedule.by_team.setdefault(str(team_id), []).append(event)
+        if schedule.by_date:
+            schedule.first_date = min(schedule.by_date)
+            schedule.last_date = max(schedule.by_date)
+        return schedule
+
+    def covers(self, date_str: str) -> bool:
+        """True if the season is authoritative for this date (YYYY-MM-DD).
+
+        Dates outside the season's first/last event may belong to another
+        season (or unscheduled playoffs), so they are not covered.
+        """
+        if not self.complete or not self.first_date or not self.last_date:
+            return False
+        return self.first_date <= date_str <= self.last_date
+
+    def events_on(self, date_str: str) -> list[dict]:
+        """Raw events on a date (empty if none scheduled)."""
+        return self.by_date.get(date_str, [])
 
 
 class TSDBClient:
@@ -229,6 +418,7 @@ class TSDBClient:
         retry_count: int = 3,
         retry_delay: float = 1.0,
         requests_per_minute: int = 30,  # TSDB free tier limit
+        db_factory: Callable | None = None,
     ):
         self._league_mapping_source = league_mapping_source
         self._explicit_key = api_key
@@ -238,6 +428,7 @@ class TSDBClient:
         self._client: httpx.Client | None = None
         self._client_lock = threading.Lock()
         self._requests_per_minute = requests_per_minute
+        self._db_factory = db_factory
         # Rate limiter initialized lazily after we can check is_premium
         self._rate_limiter: RateLimiter | None = None
         self._cache = TTLCache()
@@ -265,6 +456,7 @@ class TSDBClient:
                 max_requests=self._requests_per_minute,
                 window_seconds=60.0,
                 is_premium=self.is_premium,
+                db_factory=self._db_factory,
             )
             if self.is_premium:
                 logger.info("[TSDB] Using premium API key - rate limiting disabled")
@@ -275,9 +467,11 @@ class TSDBClient:
             with self._client_lock:
                 # Double-check after acquiring lock
                 if self._client is None:
+                    limits = httpx.Limits(max_connections=10, max_keepalive_connections=5)
                     self._client = httpx.Client(
                         timeout=self._timeout,
-                        limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+                        limits=limits,
+                        **provider_transports(limits),
                     )
         return self._client
 
@@ -287,11 +481,17 @@ class TSDBClient:
     BACKOFF_MAX = 120.0
     BACKOFF_MAX_RETRIES = 5
 
-    def _request(self, endpoint: str, params: dict | None = None) -> dict | None:
+    def _request(
+        self,
+        endpoint: str,
+        params: dict | None = None,
+        priority: int = PRIORITY_NORMAL,
+    ) -> dict | None:
         """Make HTTP request with rate limiting and retry logic.
 
         Rate limiting strategy:
-        1. Preemptive: Internal limit (30/min for free API) with 30s cooldown
+        1. Preemptive: Token bucket (30/min for free API), shared across
+           processes when a db_factory is configured; priority orders waiters
         2. Reactive: If 429 received, exponential backoff (5s, 10s, 20s, 40s, 80s)
 
         Never fails due to rate limits - always waits and continues.
@@ -299,7 +499,7 @@ class TSDBClient:
         """
         # Wait for rate limit slot (preemptive)
         rate_limiter = self._get_rate_limiter()
-        rate_limiter.acquire()
+        rate_limiter.acquire(priority)
 
         url = f"{TSDB_BASE_URL}/{self._api_key}/{endpoint}"
         backoff_attempt = 0
@@ -436,10 +636,11 @@ class TSDBClient:
             return None
 
         # eventsday.php uses 'l' for league NAME (strLeague), not ID
-        result = self._request("eventsday.php", {"d": date_str, "l": league_name})
+        target_date = date.fromisoformat(date_str)
+        priority = PRIORITY_HIGH if 0 <= (target_date - date.today()).days <= 1 else PRIORITY_NORMAL
+        result = self._request("eventsday.php", {"d": date_str, "l": league_name}, priority)
         if result:
             # Use tiered TTL based on date
-            target_date = date.fromisoformat(date_str)
             ttl = get_cache_ttl_for_date(target_date)
             self._cache.set(cache_key, result, ttl)
             logger.debug("[TSDB] Cached %s for %dh %dm", cache_key, ttl // 3600, (ttl % 3600) // 60)
@@ -466,7 +667,7 @@ class TSDBClient:
         if not league_id:
             return None
 
-        result = self._request("eventsnextleague.php", {"id": league_id})
+        result = self._request("eventsnextleague.php", {"id": league_id}, PRIORITY_HIGH)
         if result:
             self._cache.set(cache_key, result, TSDB_CACHE_TTL_NEXT_EVENTS)
         return result
@@ -584,6 +785,7 @@ class TSDBClient:
 
         Uses eventsseason.php with league ID.
         Free tier returns 15 events per request.
+        Results cached for 30 minutes.
 
         Args:
             league: Canonical league code
@@ -600,25 +802,91 @@ class TSDBClient:
             return None
 
         if not season:
-            from datetime import date
+            season = self._season_candidates(league)[0]
+
+        cache_key = make_cache_key("tsdb", "eventsseason", league, season)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.debug("[TSDB] Cache hit: %s", cache_key)
+            return cached
 
-            year = date.today().year
-            month = date.today().month
-            sport = self.get_sport(league).lower()
+        # Season schedules cover today, so they go ahead of per-day backfill
+        result = self._request("eventsseason.php", {"id": league_id, "s": season}, PRIORITY_HIGH)
+        if result:
+            self._cache.set(cache_key, result, TSDB_CACHE_TTL_SEASON)
+        return result
 
-            # Different sports use different season formats
-            if sport in ("cricket", "boxing"):
-                # Calendar year seasons
-                season = str(year)
-            else:
-                # Fall-spring seasons (hockey, etc.)
-                # Use previous year if before August
-                if month < 8:
-                    season = f"{year - 1}-{year}"
-                else:
-                    season = f"{year}-{year + 1}"
-
-        return self._request("eventsseason.php", {"id": league_id, "s": season})
+    def get_season_schedule(self, league: str) -> SeasonSchedule | None:
+        """Get the league's current season indexed by date and team.
+
+        One eventsseason.php call for the detected season, plus one for the
+        alternate season format if the first returns nothing. The indexed
+        schedule is cached (including empty ones, so an off-season league
+        costs one call per TTL, not one per lookup).
+
+        Free tier truncates season responses, so they could never cover a
+        date; no call is made and callers use the per-day endpoints.
+
+        Args:
+            league: Canonical league code
+
+        Returns:
+            SeasonSchedule, or None on free tier or if the league has no
+            TSDB mapping
+        """
+        if not self.is_premium:
+            return None
+
+        cache_key = make_cache_key("tsdb", "seasonschedule", league)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if not self.get_league_id(league):
+            return None
+
+        schedule = SeasonSchedule(season=None)
+        for season in self._season_candidates(league):
+            result = self.get_season_events(league, season)
+            events = (result.get("events") or []) if result else []
+            if events:
+                schedule = SeasonSchedule.build(season, events, complete=True)
+                break
+
+        logger.debug(
+            "[TSDB] Season schedule %s (%s): %d events, %s to %s",
+            league,
+            schedule.season,
+            len(schedule.events),
+            schedule.first_date,
+            schedule.last_date,
+        )
+        self._cache.set(cache_key, schedule, TSDB_CACHE_TTL_SEASON)
+        return schedule
+
+    def peek_season_schedule(self, league: str) -> SeasonSchedule | None:
+        """Get the cached season schedule without making API calls."""
+        return self._cache.get(make_cache_key("tsdb", "seasonschedule", league))
+
+    def _season_candidates(self, league: str) -> list[str]:
+        """Season strings to try for a league, most likely first.
+
+        Calendar-year sports (cricket, boxing) use "2025"; others use
+        fall-spring "2025-2026" (previous year if before August). The other
+        format is returned second for leagues that don't follow their sport.
+        """
+        today = date.today()
+        year = today.year
+        calendar = str(year)
+        if today.month < 8:
+            fall_spring = f"{year - 1}-{year}"
+        else:
+            fall_spring = f"{year}-{year + 1}"
+
+        sport = self.get_sport(league).lower()
+        if sport in ("cricket", "boxing"):
+            return [calendar, fall_spring]
+        return [fall_spring, calendar]
 
     def get_teams_in_league(self, league: str) -> dict | None:
         """Get all teams in a league.
@@ -69,13 +69,19 @@ class TSDBProvider(SportsProvider):
     def get_events(self, league: str, target_date: date) -> list[Event]:
         """Get events for a league on a specific date.
 
-        Tries multiple endpoints in order:
+        Served from the league's season schedule when it covers the date
+        (one eventsseason.php call per league). Otherwise tries multiple
+        endpoints in order:
         1. eventsday.php - Date-specific (works for most leagues)
         2. eventsnextleague.php - Upcoming events filtered by date
         3. eventsround.php - Full season events filtered by date (Unrivaled, etc.)
         """
         date_str = target_date.strftime("%Y-%m-%d")
 
+        season = self._client.get_season_schedule(league)
+        if season and season.covers(date_str):
+            return self._parse_events(season.events_on(date_str), league)
+
         # Try date-specific endpoint first
         data = self._client.get_events_by_date(league, date_str)
         if data and data.get("events"):
@@ -118,6 +124,30 @@ class TSDBProvider(SportsProvider):
 
         return []
 
+    def get_cached_events(self, league: str, target_date: date) -> list[Event] | None:
+        """Get events from an already-loaded season schedule (no API calls).
+
+        Lets cache-only lookups see every date of a pre-warmed season instead
+        of only the dates that happen to be in the events cache.
+
+        Returns:
+            Events for the date, or None if no loaded season covers it
+        """
+        season = self._client.peek_season_schedule(league)
+        date_str = target_date.strftime("%Y-%m-%d")
+        if not season or not season.covers(date_str):
+            return None
+        return self._parse_events(season.events_on(date_str), league)
+
+    def _parse_events(self, events_data: list[dict], league: str) -> list[Event]:
+        """Parse raw TSDB events, skipping unparseable ones."""
+        events = []
+        for event_data in events_data:
+            event = self._parse_event(event_data, league)
+            if event:
+                events.append(event)
+        return events
+
     # TSDB rate limit optimization: cap at 14 days regardless of caller request
     # ESPN can handle 30+ days, but TSDB's 25 req/min limit makes that expensive
     TSDB_MAX_DAYS_AHEAD = 14
@@ -142,6 +172,20 @@ class TSDBProvider(SportsProvider):
         """
         # Cap days_ahead for rate limit optimization
         days_ahead = min(days_ahead, self.TSDB_MAX_DAYS_AHEAD)
+        today = date.today()
+
+        # Whole window inside a loaded season: slice the team's games locally.
+        # Teams not keyed by ID (e.g. combat sports) use the name scan below,
+        # which is still served per date from the season schedule.
+        season = self._client.get_season_schedule(league)
+        first_day = (today - timedelta(days=self.DAYS_BACK)).strftime("%Y-%m-%d")
+        last_day = (today + timedelta(days=days_ahead - 1)).strftime("%Y-%m-%d")
+        season_games = season.by_team.get(str(team_id)) if season else None
+        if season_games is not None and season.covers(first_day) and season.covers(last_day):
+            team_games = [e for e in season_games if first_day <= e["dateEvent"] <= last_day]
+            events = self._parse_events(team_games, league)
+            events.sort(key=lambda e: e.start_time)
+            return events
 
         # First, get team name from league teams
         team_name = self._get_team_name(team_id, league)
@@ -150,7 +194,6 @@ class TSDBProvider(SportsProvider):
             return []
 
         events = []
-        today = date.today()
         seen_ids: set[str] = set()
 
         # 1. Scan past days for .last variable resolution
@@ -183,11 +226,20 @@ class TSDBProvider(SportsProvider):
     ) -> list[Event]:
         """Get events for a team on a specific date.
 
-        Uses eventsday first, then eventsround as fallback for leagues
-        where eventsday doesn't return data (e.g., Unrivaled).
+        Uses the season schedule when it covers the date, then eventsday,
+        then eventsround as fallback for leagues where eventsday doesn't
+        return data (e.g., Unrivaled).
         """
         date_str = target_date.strftime("%Y-%m-%d")
 
+        season = self._client.get_season_schedule(league)
+        if season and season.covers(date_str):
+            return [
+                event
+                for event in self._parse_events(season.events_on(date_str), league)
+                if self._team_in_event(team_name, event)
+            ]
+
         # Try date-specific endpoint first
         data = self._client.get_events_by_date(league, date_str)
         if data and data.get("events"):
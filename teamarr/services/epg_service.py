@@ -88,6 +88,7 @@ class EPGService:
         from teamarr.consumers.orchestrator import Orchestrator
         from teamarr.consumers.orchestrator import TeamChannelConfig as ConsumerConfig
         from teamarr.consumers.team_epg import TeamEPGOptions as ConsumerOptions
+        from teamarr.templates.event_cache import event_cache_scope
 
         orchestrator = Orchestrator(self._service)
 
@@ -118,7 +119,8 @@ class EPGService:
                 default_duration_hours=options.default_duration_hours,
             )
 
-        result = orchestrator.generate_for_teams(consumer_configs, consumer_options)
+        with event_cache_scope():
+            result = orchestrator.generate_for_teams(consumer_configs, consumer_options)
 
         return GenerationResult(
             programmes=result.programmes,
@@ -149,6 +151,7 @@ class EPGService:
         """
         from teamarr.consumers.event_epg import EventEPGOptions as ConsumerOptions
         from teamarr.consumers.orchestrator import Orchestrator
+        from teamarr.templates.event_cache import event_cache_scope
 
         orchestrator = Orchestrator(self._service)
 
@@ -158,12 +161,13 @@ class EPGService:
                 output_days_ahead=options.output_days_ahead,
             )
 
-        result = orchestrator.generate_for_events(
-            leagues=leagues,
-            target_date=target_date,
-            channel_prefix=channel_prefix,
-            options=consumer_options,
-        )
+        with event_cache_scope():
+            result = orchestrator.generate_for_events(
+                leagues=leagues,
+                target_date=target_date,
+                channel_prefix=channel_prefix,
+                options=consumer_options,
+            )
 
         return GenerationResult(
             programmes=result.programmes,
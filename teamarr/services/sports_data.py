@@ -143,8 +143,18 @@ class SportsDataService:
             except (KeyError, TypeError) as e:
                 logger.warning("[CACHE_ERROR] Deserialization failed: %s", e)
 
-        # If cache_only, don't fetch from API
+        # If cache_only, don't fetch from API - but providers holding the
+        # league's season locally (TSDB season bulk) can still answer
         if cache_only:
+            for provider in self._providers:
+                if provider.supports_league(league):
+                    get_cached = getattr(provider, "get_cached_events", None)
+                    events = get_cached(league, target_date) if get_cached else None
+                    if events is None:
+                        return []
+                    ttl = get_events_cache_ttl(target_date)
+                    self._cache.set(cache_key, [event_to_dict(e) for e in events], ttl)
+                    return events
             return []
 
         # Iterate through providers
@@ -343,11 +353,16 @@ class SportsDataService:
 
         Returns a dict with provider-specific stats including:
         - Rate limit status (TSDB)
+        - Adaptive concurrency limit and history (ESPN)
         - Cache statistics (if provider has internal cache)
 
         Example response:
         {
-            "espn": {"name": "espn", "has_rate_limit": False},
+            "espn": {
+                "name": "espn",
+                "has_rate_limit": False,
+                "concurrency": {"limit": 24, "p95_ms": 180, "history": [...], ...}
+            },
             "tsdb": {
                 "name": "tsdb",
                 "has_rate_limit": True,
@@ -371,6 +386,8 @@ class SportsDataService:
                 if hasattr(client, "rate_limit_stats"):
                     provider_stats["has_rate_limit"] = True
                     provider_stats["rate_limit"] = client.rate_limit_stats().to_dict()
+                if hasattr(client, "concurrency_stats"):
+                    provider_stats["concurrency"] = client.concurrency_stats()
                 if hasattr(client, "cache_stats"):
                     provider_stats["cache"] = client.cache_stats()
 
@@ -378,6 +395,16 @@ class SportsDataService:
 
         return stats
 
+    def warm_up_providers(self) -> None:
+        """Open provider connections ahead of a generation's parallel fetches."""
+        for provider in self._providers:
+            client = getattr(provider, "_client", None)
+            if hasattr(client, "warm_up"):
+                try:
+                    client.warm_up()
+                except Exception as e:
+                    logger.debug("[WARMUP] %s warm-up failed: %s", provider.name, e)
+
     def reset_provider_stats(self) -> None:
         """Reset provider statistics (call at start of EPG generation).
 
@@ -389,18 +416,28 @@ class SportsDataService:
                 if hasattr(client, "reset_rate_limit_stats"):
                     client.reset_rate_limit_stats()
 
-    def prewarm_tsdb_leagues(self, leagues: list[str], days_ahead: int = 14) -> None:
+    def prewarm_tsdb_leagues(
+        self,
+        leagues: list[str],
+        days_ahead: int = 14,
+        seasons_only: bool = False,
+    ) -> None:
         """Pre-warm TSDB events cache for multiple leagues.
 
-        Fetches events for each league/day upfront, populating the cache.
-        This ensures all subsequent get_team_schedule calls are cache hits.
+        Each league's season schedule is loaded first (1-2 eventsseason.php
+        calls), which covers every in-season date. Remaining league/day
+        fetches then run in date order - every league's today, then every
+        league's tomorrow, and so on - so the dates EPG needs most are cached
+        first while the rate limiter spends its budget.
 
         NOTE: Team name lookup uses seeded database cache (not API), so we
-        only need to pre-warm events, not teams. This saves 2 API calls per league.
+        only need to pre-warm events, not teams.
 
         Args:
             leagues: List of canonical league codes to pre-warm
             days_ahead: Number of days to pre-warm (default 14, matches get_team_schedule)
+            seasons_only: Only load season schedules (bounded API cost, used
+                during event group processing). A no-op on free tier.
         """
         from datetime import timedelta
 
@@ -418,29 +455,43 @@ class SportsDataService:
             logger.debug("[PREWARM] No TSDB provider registered, skipping pre-warm")
             return
 
-        unique_leagues = list(set(leagues))
+        unique_leagues = sorted(
+            league for league in set(leagues) if tsdb_provider.supports_league(league)
+        )
+        if not unique_leagues:
+            return
+
+        client = tsdb_provider._client
+        if seasons_only and not client.is_premium:
+            # Season schedules are premium-only; nothing to load
+            return
+
+        requests_before = client.rate_limit_stats().total_requests
         today = date.today()
 
         # Cap to TSDB's max days (same as provider)
         days_ahead = min(days_ahead, 14)
+        day_strs = [(today + timedelta(days=i)).isoformat() for i in range(days_ahead)]
+
+        # Phase 1: season schedules (one or two calls per league)
+        covered: set[tuple[str, str]] = set()
+        for league in unique_leagues:
+            season = client.get_season_schedule(league)
+            if season:
+                covered.update((league, d) for d in day_strs if season.covers(d))
+
+        # Phase 2: uncovered league/days, soonest dates first
+        if not seasons_only:
+            for i, day_str in enumerate(day_strs):
+                for league in unique_leagues:
+                    if (league, day_str) not in covered:
+                        # Use get_events which goes through provider → client cache
+                        tsdb_provider.get_events(league, today + timedelta(days=i))
 
-        total_calls = len(unique_leagues) * days_ahead  # N days per league
         logger.info(
-            "[PREWARM] TSDB: %d leagues × %d days = ~%d API calls",
+            "[PREWARM] TSDB: %d leagues, %d/%d league-days from season schedules, %d API calls",
             len(unique_leagues),
-            days_ahead,
-            total_calls,
+            len(covered),
+            len(unique_leagues) * days_ahead,
+            client.rate_limit_stats().total_requests - requests_before,
         )
-
-        for league in unique_leagues:
-            if not tsdb_provider.supports_league(league):
-                continue
-
-            # Pre-warm events cache for each day
-            # Team names come from seeded database cache (no API needed)
-            for i in range(days_ahead):
-                target_date = today + timedelta(days=i)
-                # Use get_events which goes through provider → client cache
-                tsdb_provider.get_events(league, target_date)
-
-            logger.debug("[PREWARM] TSDB league %s: %d days", league, days_ahead)
@@ -12,10 +12,15 @@ otherwise falls back to standard 're' module.
 
 import logging
 import re
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from re import Pattern
 
-from teamarr.utilities.constants import PLACEHOLDER_PATTERNS, SPORT_HINT_PATTERNS
+from teamarr.utilities.pattern_scanner import (
+    NUMBERS_ONLY_PATTERN,
+    PLACEHOLDER_SCANNER,
+    SPORT_HINT_SCANNER,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -62,16 +67,12 @@ def is_placeholder(text: str) -> bool:
 
     text_lower = text.lower().strip()
 
-    # Check against placeholder patterns
-    for pattern in PLACEHOLDER_PATTERNS:
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            return True
-
-    # Additional check: very short names with just numbers
-    if re.match(r"^[\d\s\-:]+$", text_lower):
+    # Check against placeholder patterns (one compiled scan)
+    if PLACEHOLDER_SCANNER.matches(text_lower):
         return True
 
-    return False
+    # Additional check: very short names with just numbers
+    return NUMBERS_ONLY_PATTERN.match(text_lower) is not None
 
 
 def detect_sport_hint(text: str) -> str | None:
@@ -95,11 +96,7 @@ def detect_sport_hint(text: str) -> str | None:
 
     text_lower = text.lower()
 
-    for pattern, sport in SPORT_HINT_PATTERNS:
-        if re.search(pattern, text_lower, re.IGNORECASE):
-            return sport
-
-    return None
+    return SPORT_HINT_SCANNER.first(text_lower)
 
 
 # Builtin patterns for identifying EVENT streams (inclusion approach)
@@ -284,7 +281,7 @@ class StreamFilter:
         if config.require_event_pattern:
             self._event_pattern = get_builtin_event_pattern()
 
-    def filter(self, streams: list[dict]) -> FilterResult:
+    def filter(self, streams: Iterable[dict]) -> FilterResult:
         """Apply filters and return filtered streams with stats.
 
         Filter order:
@@ -299,15 +296,19 @@ class StreamFilter:
         The skip_builtin flag controls all built-in eligibility checks (2a, 2b, 2c).
         When skip_builtin=True, only stale filtering and user-defined regex filters apply.
 
+        Streams are consumed one at a time, so a generator (e.g. paged API
+        results) can be filtered without materializing the full input.
+
         Args:
-            streams: List of stream dicts with at least 'id' and 'name' keys
+            streams: Iterable of stream dicts with at least 'id' and 'name' keys
 
         Returns:
             FilterResult with passed streams and stats
         """
-        result = FilterResult(total_input=len(streams))
+        result = FilterResult()
 
         for stream in streams:
+            result.total_input += 1
             name = stream.get("name", "")
 
             # 1. Stale filter: always skip streams marked as stale in Dispatcharr
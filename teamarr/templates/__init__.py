@@ -26,6 +26,11 @@ from teamarr.templates.context_builder import (
     ContextBuilder,
     build_context_for_event,
 )
+from teamarr.templates.event_cache import (
+    clear_event_cache,
+    event_cache_scope,
+    get_event_cache_stats,
+)
 from teamarr.templates.resolver import TemplateResolver, resolve
 from teamarr.templates.variables import (
     Category,
@@ -48,6 +53,10 @@ __all__ = [
     "Odds",
     "TeamChannelContext",
     "TemplateContext",
+    # Event-derived data memo
+    "clear_event_cache",
+    "event_cache_scope",
+    "get_event_cache_stats",
     # Resolver
     "TemplateResolver",
     "resolve",
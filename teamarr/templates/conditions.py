@@ -31,13 +31,21 @@ Example JSON format for description_options:
 import json
 import logging
 import random
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from teamarr.templates.context import GameContext, TemplateContext
 
 logger = logging.getLogger(__name__)
 
+# (ctx, game_ctx) -> condition met
+BoundCondition = Callable[[TemplateContext, GameContext | None], bool]
+
+# Compiled option sets kept (one per distinct template description set)
+COMPILED_OPTIONS_CACHE_SIZE = 256
+
 
 @dataclass
 class ConditionOption:
@@ -75,15 +83,25 @@ class ConditionEvaluator:
         Returns:
             True if condition is met
         """
-        if not game_ctx or not game_ctx.event:
-            return False
+        check = self.bind(condition, value)
+        return check(ctx, game_ctx) if check else False
 
-        # Dispatch to specific evaluator
+    def bind(self, condition: str, value: str | None) -> BoundCondition | None:
+        """Resolve a condition to a callable taking (ctx, game_ctx).
+
+        Returns:
+            Bound check, or None for unknown condition types (never match)
+        """
         method = getattr(self, f"_eval_{condition}", None)
-        if method:
+        if not method:
+            return None
+
+        def check(ctx: TemplateContext, game_ctx: GameContext | None) -> bool:
+            if not game_ctx or not game_ctx.event:
+                return False
             return method(value, ctx, game_ctx)
 
-        return False
+        return check
 
     # =========================================================================
     # Home/Away conditions
@@ -269,11 +287,86 @@ class ConditionEvaluator:
         return our_rank <= 25 and opp_rank <= 25
 
 
+@dataclass(frozen=True)
+class CompiledOption:
+    """A validated description option with its condition check pre-bound."""
+
+    template: str
+    priority: int
+    check: BoundCondition | None = None  # None = default, always matches
+
+
+# Priority tiers, lowest priority number (highest precedence) first
+CompiledOptions = tuple[tuple[int, tuple[CompiledOption, ...]], ...]
+
+# Hashable option-set key: ((template, priority, condition, condition_value), ...)
+OptionsKey = tuple[tuple[Any, Any, Any, Any], ...]
+
+
+def _condition_value(value: Any) -> str | None:
+    """Normalise a condition value to the ``str | None`` the evaluators expect."""
+    return str(value) if value else None
+
+
+def _options_key(raw_options: list[Any]) -> OptionsKey:
+    key = []
+    for item in raw_options:
+        if not isinstance(item, dict):
+            continue
+        fields = (
+            item.get("template", ""),
+            item.get("priority", 50),
+            item.get("condition"),
+            item.get("condition_value"),
+        )
+        # Lists/objects from hand-edited JSON can't key the compile cache
+        if any(isinstance(field, (list, dict)) for field in fields):
+            logger.debug("[CONDITION] Skipping option with non-scalar fields: %r", item)
+            continue
+        template, priority, condition, condition_value = fields
+        key.append((template, priority, condition, _condition_value(condition_value)))
+    return tuple(key)
+
+
+@lru_cache(maxsize=COMPILED_OPTIONS_CACHE_SIZE)
+def _compile_options(key: OptionsKey) -> CompiledOptions:
+    """Validate, bind and group an option set by priority (cached per option set)."""
+    evaluator = ConditionEvaluator()
+    tiers: dict[int, list[CompiledOption]] = {}
+
+    for template, priority, condition, condition_value in key:
+        if not template:
+            continue
+        try:
+            priority = int(priority)
+        except (TypeError, ValueError):
+            logger.debug("[CONDITION] Skipping option with invalid priority %r", priority)
+            continue
+
+        option = ConditionOption(template, priority, condition, condition_value)
+        if option.is_default:
+            tiers.setdefault(priority, []).append(CompiledOption(template, priority))
+            continue
+
+        # Conditionals need a known condition type to ever match
+        if not condition:
+            continue
+        check = evaluator.bind(condition, condition_value)
+        if not check:
+            logger.debug("[CONDITION] Skipping option with unknown condition %r", condition)
+            continue
+        tiers.setdefault(priority, []).append(CompiledOption(template, priority, check))
+
+    return tuple((priority, tuple(tiers[priority])) for priority in sorted(tiers))
+
+
 class ConditionalDescriptionSelector:
-    """Selects the best description based on conditions and priority."""
+    """Selects the best description based on conditions and priority.
 
-    def __init__(self):
-        self._evaluator = ConditionEvaluator()
+    Option sets are compiled once per distinct set of options (i.e. per
+    template version) into priority tiers of pre-bound checks; selection
+    stops at the first tier with a satisfied option.
+    """
 
     def select(
         self,
@@ -291,83 +384,52 @@ class ConditionalDescriptionSelector:
         Returns:
             Selected template string, or empty string if none match
         """
-        options = self._parse_options(description_options)
-        if not options:
-            return ""
-
-        # Group matching options by priority
-        priority_groups: dict[int, list[str]] = {}
-
-        for opt in options:
-            if not opt.template:
+        for priority, options in self.compile(description_options):
+            matching_templates = [
+                opt.template for opt in options if opt.check is None or opt.check(ctx, game_ctx)
+            ]
+            if not matching_templates:
                 continue
 
-            # Default descriptions always match
-            if opt.is_default:
-                if opt.priority not in priority_groups:
-                    priority_groups[opt.priority] = []
-                priority_groups[opt.priority].append(opt.template)
-                continue
+            # Random selection from same-priority templates
+            selected = random.choice(matching_templates)
+            logger.debug(
+                "[CONDITION] Selected priority=%d from %d options",
+                priority,
+                len(matching_templates),
+            )
+            return selected
 
-            # Conditionals need to be evaluated
-            if not opt.condition:
-                continue
+        logger.debug("[CONDITION] No matching conditions found")
+        return ""
 
-            if self._evaluator.evaluate(opt.condition, opt.condition_value, ctx, game_ctx):
-                if opt.priority not in priority_groups:
-                    priority_groups[opt.priority] = []
-                priority_groups[opt.priority].append(opt.template)
-
-        if not priority_groups:
-            logger.debug("[CONDITION] No matching conditions found")
-            return ""
-
-        # Get highest priority (lowest number)
-        highest_priority = min(priority_groups.keys())
-        matching_templates = priority_groups[highest_priority]
-
-        # Random selection from same-priority templates
-        selected = random.choice(matching_templates)
-        logger.debug(
-            "[CONDITION] Selected priority=%d from %d options",
-            highest_priority,
-            len(matching_templates),
-        )
-        return selected
+    def compile(self, description_options: str | list[dict[str, Any]] | None) -> CompiledOptions:
+        """Compile description options into priority tiers (cached)."""
+        raw_options = self._load_options(description_options)
+        if not raw_options:
+            return ()
+        return _compile_options(_options_key(raw_options))
+
+    @staticmethod
+    @lru_cache(maxsize=COMPILED_OPTIONS_CACHE_SIZE)
+    def _parse_json(description_options: str) -> tuple[Any, ...] | None:
+        try:
+            raw_options = json.loads(description_options)
+        except json.JSONDecodeError:
+            return None
+        return tuple(raw_options) if isinstance(raw_options, list) else None
 
-    def _parse_options(
+    def _load_options(
         self, description_options: str | list[dict[str, Any]] | None
-    ) -> list[ConditionOption]:
-        """Parse description options into ConditionOption objects."""
+    ) -> tuple[Any, ...] | list[Any] | None:
+        """Raw option dicts from a JSON string or list."""
         if not description_options:
-            return []
-
-        # Parse JSON string if needed
+            return None
         if isinstance(description_options, str):
-            try:
-                raw_options = json.loads(description_options)
-            except json.JSONDecodeError:
-                return []
-        else:
-            raw_options = description_options
-
-        if not isinstance(raw_options, list):
-            return []
-
-        options = []
-        for item in raw_options:
-            if not isinstance(item, dict):
-                continue
-            options.append(
-                ConditionOption(
-                    template=item.get("template", ""),
-                    priority=item.get("priority", 50),
-                    condition=item.get("condition"),
-                    condition_value=item.get("condition_value"),
-                )
-            )
-
-        return options
+            return self._parse_json(description_options)
+        if not isinstance(description_options, list):
+            return None
+        return description_options
 
 
 # Default singleton
@@ -14,6 +14,7 @@ from teamarr.templates.context import (
     TeamChannelContext,
     TemplateContext,
 )
+from teamarr.templates.event_cache import get_event_odds
 from teamarr.utilities.sports import get_sport_from_league
 
 logger = logging.getLogger(__name__)
@@ -150,8 +151,12 @@ class ContextBuilder:
         # Fetch opponent stats
         opponent_stats = self._get_team_stats(opponent.id, league)
 
-        # Convert odds data to Odds dataclass
-        odds = self._build_odds(event.odds_data, is_home) if event.odds_data else None
+        # Convert odds data to Odds dataclass (shared with other perspectives on the event)
+        odds = None
+        if event.odds_data:
+            odds = get_event_odds(
+                event, is_home, lambda: self._build_odds(event.odds_data, is_home)
+            )
 
         return GameContext(
             event=event,
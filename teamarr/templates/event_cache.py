@@ -0,0 +1,160 @@
+"""Per-run memo of event-derived template data.
+
+The same event is resolved many times per generation run: for each tracked
+team in it (both sides of a rivalry or conference game), as .next/.last
+context of neighbouring programmes, for event-group channels and for filler.
+Variables that depend only on the event (venue, broadcasts, local date/time,
+positional home/away teams, season type) and the odds built from it are the
+same each time, so they are computed once per event and shared; each
+perspective only adds its home/away-specific values.
+
+Entries are keyed by (provider, event_id, status key), where the status key
+covers state, detail, period, clock and start time, plus the display
+settings the datetime variables read. Scores are not part of the key, so
+score-derived variables are never marked event-level.
+
+The key does not cover broadcasts, venue or logos, so the memo only lives
+for one generation run: entry points (full generation, single-group
+processing and preview, team/event EPG services) open an event_cache_scope,
+which starts empty and is cleared when the outermost scope closes. Outside
+a scope nothing is memoized, so template previews and other one-off callers
+always build fresh values.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from teamarr.config import get_show_timezone, get_time_format, get_user_timezone_str
+from teamarr.core import Event
+
+if TYPE_CHECKING:
+    from teamarr.templates.context import Odds
+
+logger = logging.getLogger(__name__)
+
+# Events kept in the memo (a full run touches a few thousand at most)
+EVENT_CACHE_SIZE = 10000
+
+EventKey = tuple[Hashable, ...]
+
+
+@dataclass
+class EventDerived:
+    """Event-derived values shared by every perspective on an event."""
+
+    variables: dict[str, str] | None = None
+    odds: dict[bool, "Odds"] = field(default_factory=dict)  # keyed by is_home
+
+
+_event_cache: OrderedDict[EventKey, EventDerived] = OrderedDict()
+_event_cache_lock = threading.Lock()
+_event_cache_stats = {"hits": 0, "misses": 0}
+_open_scopes = 0
+
+
+def event_key(event: Event) -> EventKey:
+    """Memo key: (provider, event_id, status key, display settings)."""
+    status = event.status
+    return (
+        event.provider,
+        event.id,
+        (status.state, status.detail, status.period, status.clock, event.start_time),
+        (get_user_timezone_str(), get_time_format(), get_show_timezone()),
+    )
+
+
+@contextmanager
+def event_cache_scope() -> Iterator[None]:
+    """Memoize event-derived data for the duration of a generation run.
+
+    Scopes nest (a single-group run inside a full generation shares its
+    memo). The memo starts empty when the first scope opens and is cleared
+    when the last one closes. Also usable as a function decorator.
+    """
+    global _open_scopes
+    with _event_cache_lock:
+        if not _open_scopes:
+            _event_cache.clear()
+            _event_cache_stats.update(hits=0, misses=0)
+        _open_scopes += 1
+    try:
+        yield
+    finally:
+        with _event_cache_lock:
+            _open_scopes -= 1
+            last = not _open_scopes
+        if last:
+            clear_event_cache()
+
+
+def _entry(event: Event) -> EventDerived | None:
+    """Memo entry for an event (None outside an event_cache_scope)."""
+    key = event_key(event)
+    with _event_cache_lock:
+        if not _open_scopes:
+            return None
+        entry = _event_cache.get(key)
+        if entry is not None:
+            _event_cache.move_to_end(key)
+            _event_cache_stats["hits"] += 1
+            return entry
+        _event_cache_stats["misses"] += 1
+        entry = _event_cache[key] = EventDerived()
+        while len(_event_cache) > EVENT_CACHE_SIZE:
+            _event_cache.popitem(last=False)
+    return entry
+
+
+def get_event_variables(event: Event, build: Callable[[], dict[str, str]]) -> dict[str, str]:
+    """Event-level variable values for an event, built once per run.
+
+    Args:
+        event: Event the values derive from
+        build: Computes the values on a miss
+
+    Returns:
+        Variable name -> value (shared; do not mutate)
+    """
+    entry = _entry(event)
+    if entry is None:
+        return build()
+    if entry.variables is None:
+        entry.variables = build()
+    return entry.variables
+
+
+def get_event_odds(event: Event, is_home: bool, build: Callable[[], "Odds"]) -> "Odds":
+    """Odds for an event from one side's perspective, built once per run."""
+    entry = _entry(event)
+    if entry is None:
+        return build()
+    odds = entry.odds.get(is_home)
+    if odds is None:
+        odds = entry.odds[is_home] = build()
+    return odds
+
+
+def clear_event_cache() -> None:
+    """Drop all memoized event data (done when the outermost scope closes)."""
+    with _event_cache_lock:
+        stats = {"size": len(_event_cache), **_event_cache_stats}
+        _event_cache.clear()
+        _event_cache_stats.update(hits=0, misses=0)
+    if stats["size"]:
+        logger.debug(
+            "[EVENT_CACHE] Cleared %d events (%d hits, %d misses)",
+            stats["size"],
+            stats["hits"],
+            stats["misses"],
+        )
+
+
+def get_event_cache_stats() -> dict[str, int]:
+    """Memo size and hit/miss counts since the last clear."""
+    with _event_cache_lock:
+        return {"size": len(_event_cache), **_event_cache_stats}
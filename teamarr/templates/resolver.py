@@ -13,6 +13,7 @@ from typing import Any
 
 from teamarr.templates.conditions import get_condition_selector
 from teamarr.templates.context import GameContext, TemplateContext
+from teamarr.templates.event_cache import get_event_variables
 from teamarr.templates.variables import SuffixRules, get_registry
 
 logger = logging.getLogger(__name__)
@@ -105,28 +106,57 @@ class TemplateResolver:
         """
         variables: dict[str, str] = {}
 
+        # Event-level values are shared across perspectives (see event_cache)
+        base_event = self._event_variables(ctx, ctx.game_context)
+        next_event = self._event_variables(ctx, ctx.next_game)
+        last_event = self._event_variables(ctx, ctx.last_game)
+
         for var_def in self._registry.all_variables():
             rules = var_def.suffix_rules
+            event_level = var_def.event_level
 
             # Base variable (current game)
             if rules != SuffixRules.LAST_ONLY:
-                value = var_def.extractor(ctx, ctx.game_context)
+                if event_level and base_event is not None:
+                    value = base_event[var_def.name]
+                else:
+                    value = var_def.extractor(ctx, ctx.game_context)
                 variables[var_def.name] = value
 
             # .next suffix
             if rules in (SuffixRules.ALL, SuffixRules.BASE_NEXT_ONLY):
                 if ctx.next_game:
-                    value = var_def.extractor(ctx, ctx.next_game)
+                    if event_level and next_event is not None:
+                        value = next_event[var_def.name]
+                    else:
+                        value = var_def.extractor(ctx, ctx.next_game)
                     variables[f"{var_def.name}.next"] = value
 
             # .last suffix
             if rules in (SuffixRules.ALL, SuffixRules.LAST_ONLY):
                 if ctx.last_game:
-                    value = var_def.extractor(ctx, ctx.last_game)
+                    if event_level and last_event is not None:
+                        value = last_event[var_def.name]
+                    else:
+                        value = var_def.extractor(ctx, ctx.last_game)
                     variables[f"{var_def.name}.last"] = value
 
         return variables
 
+    def _event_variables(
+        self, ctx: TemplateContext, game_ctx: GameContext | None
+    ) -> dict[str, str] | None:
+        """Memoized event-level variable values for a game, or None without an event."""
+        if not game_ctx or not game_ctx.event:
+            return None
+        return get_event_variables(
+            game_ctx.event,
+            lambda: {
+                var_def.name: var_def.extractor(ctx, game_ctx)
+                for var_def in self._registry.event_level_variables()
+            },
+        )
+
     def resolve_conditional(
         self,
         description_options: str | list[dict[str, Any]] | None,
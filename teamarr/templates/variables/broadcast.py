@@ -60,6 +60,7 @@ def _sort_broadcasts(broadcasts: list[str]) -> list[str]:
     category=Category.BROADCAST,
     suffix_rules=SuffixRules.ALL,
     description="Comma-separated broadcast networks (e.g., 'ESPN, ABC')",
+    event_level=True,
 )
 def extract_broadcast_simple(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     broadcasts = _get_broadcasts(game_ctx)
@@ -72,6 +73,7 @@ def extract_broadcast_simple(ctx: TemplateContext, game_ctx: GameContext | None)
     category=Category.BROADCAST,
     suffix_rules=SuffixRules.ALL,
     description="Primary broadcast network (first in list)",
+    event_level=True,
 )
 def extract_broadcast_network(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     broadcasts = _get_broadcasts(game_ctx)
@@ -84,6 +86,7 @@ def extract_broadcast_network(ctx: TemplateContext, game_ctx: GameContext | None
     category=Category.BROADCAST,
     suffix_rules=SuffixRules.ALL,
     description="National broadcast networks only",
+    event_level=True,
 )
 def extract_broadcast_national_network(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     broadcasts = _get_broadcasts(game_ctx)
@@ -96,6 +99,7 @@ def extract_broadcast_national_network(ctx: TemplateContext, game_ctx: GameConte
     category=Category.BROADCAST,
     suffix_rules=SuffixRules.ALL,
     description="'true' if game is on national TV",
+    event_level=True,
 )
 def extract_is_national_broadcast(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     broadcasts = _get_broadcasts(game_ctx)
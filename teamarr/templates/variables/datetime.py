@@ -31,6 +31,7 @@ def _get_local_time(game_ctx: GameContext | None) -> datetime | None:
     category=Category.DATETIME,
     suffix_rules=SuffixRules.ALL,
     description="Full game date (e.g., 'Tuesday, December 10, 2024')",
+    event_level=True,
 )
 def extract_game_date(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     dt = _get_local_time(game_ctx)
@@ -44,6 +45,7 @@ def extract_game_date(ctx: TemplateContext, game_ctx: GameContext | None) -> str
     category=Category.DATETIME,
     suffix_rules=SuffixRules.ALL,
     description="Short game date (e.g., 'Dec 10')",
+    event_level=True,
 )
 def extract_game_date_short(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     dt = _get_local_time(game_ctx)
@@ -57,6 +59,7 @@ def extract_game_date_short(ctx: TemplateContext, game_ctx: GameContext | None)
     category=Category.DATETIME,
     suffix_rules=SuffixRules.ALL,
     description="Day of week (e.g., 'Tuesday')",
+    event_level=True,
 )
 def extract_game_day(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     dt = _get_local_time(game_ctx)
@@ -70,6 +73,7 @@ def extract_game_day(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     category=Category.DATETIME,
     suffix_rules=SuffixRules.ALL,
     description="Short day of week (e.g., 'Tue')",
+    event_level=True,
 )
 def extract_game_day_short(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     dt = _get_local_time(game_ctx)
@@ -83,6 +87,7 @@ def extract_game_day_short(ctx: TemplateContext, game_ctx: GameContext | None) -
     category=Category.DATETIME,
     suffix_rules=SuffixRules.ALL,
     description="Game time formatted per user settings (e.g., '7:30 PM EST' or '19:30')",
+    event_level=True,
 )
 def extract_game_time(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     if not game_ctx or not game_ctx.event:
@@ -96,6 +101,7 @@ def extract_game_time(ctx: TemplateContext, game_ctx: GameContext | None) -> str
     category=Category.DATETIME,
     suffix_rules=SuffixRules.ALL,
     description="'today' or 'tonight' based on 5pm cutoff",
+    event_level=True,
 )
 def extract_today_tonight(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     dt = _get_local_time(game_ctx)
@@ -109,6 +115,7 @@ def extract_today_tonight(ctx: TemplateContext, game_ctx: GameContext | None) ->
     category=Category.DATETIME,
     suffix_rules=SuffixRules.ALL,
     description="'Today' or 'Tonight' (title case)",
+    event_level=True,
 )
 def extract_today_tonight_title(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     dt = _get_local_time(game_ctx)
@@ -108,6 +108,7 @@ def extract_vs_symbol(ctx: TemplateContext, game_ctx: GameContext | None) -> str
     category=Category.HOME_AWAY,
     suffix_rules=SuffixRules.ALL,
     description="Home team name (positional)",
+    event_level=True,
 )
 def extract_home_team(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     if not game_ctx or not game_ctx.event:
@@ -120,6 +121,7 @@ def extract_home_team(ctx: TemplateContext, game_ctx: GameContext | None) -> str
     category=Category.HOME_AWAY,
     suffix_rules=SuffixRules.ALL,
     description="Away team name (positional)",
+    event_level=True,
 )
 def extract_away_team(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     if not game_ctx or not game_ctx.event:
@@ -132,6 +134,7 @@ def extract_away_team(ctx: TemplateContext, game_ctx: GameContext | None) -> str
     category=Category.HOME_AWAY,
     suffix_rules=SuffixRules.ALL,
     description="Home team abbreviation uppercase",
+    event_level=True,
 )
 def extract_home_team_abbrev(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     if not game_ctx or not game_ctx.event:
@@ -144,6 +147,7 @@ def extract_home_team_abbrev(ctx: TemplateContext, game_ctx: GameContext | None)
     category=Category.HOME_AWAY,
     suffix_rules=SuffixRules.ALL,
     description="Away team abbreviation uppercase",
+    event_level=True,
 )
 def extract_away_team_abbrev(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     if not game_ctx or not game_ctx.event:
@@ -156,6 +160,7 @@ def extract_away_team_abbrev(ctx: TemplateContext, game_ctx: GameContext | None)
     category=Category.HOME_AWAY,
     suffix_rules=SuffixRules.ALL,
     description="Home team abbreviation lowercase",
+    event_level=True,
 )
 def extract_home_team_abbrev_lower(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     if not game_ctx or not game_ctx.event:
@@ -168,6 +173,7 @@ def extract_home_team_abbrev_lower(ctx: TemplateContext, game_ctx: GameContext |
     category=Category.HOME_AWAY,
     suffix_rules=SuffixRules.ALL,
     description="Away team abbreviation lowercase",
+    event_level=True,
 )
 def extract_away_team_abbrev_lower(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     if not game_ctx or not game_ctx.event:
@@ -180,6 +186,7 @@ def extract_away_team_abbrev_lower(ctx: TemplateContext, game_ctx: GameContext |
     category=Category.HOME_AWAY,
     suffix_rules=SuffixRules.ALL,
     description="Home team name in PascalCase",
+    event_level=True,
 )
 def extract_home_team_pascal(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     if not game_ctx or not game_ctx.event:
@@ -192,6 +199,7 @@ def extract_home_team_pascal(ctx: TemplateContext, game_ctx: GameContext | None)
     category=Category.HOME_AWAY,
     suffix_rules=SuffixRules.ALL,
     description="Away team name in PascalCase",
+    event_level=True,
 )
 def extract_away_team_pascal(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     if not game_ctx or not game_ctx.event:
@@ -204,6 +212,7 @@ def extract_away_team_pascal(ctx: TemplateContext, game_ctx: GameContext | None)
     category=Category.HOME_AWAY,
     suffix_rules=SuffixRules.ALL,
     description="Home team logo URL",
+    event_level=True,
 )
 def extract_home_team_logo(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     if not game_ctx or not game_ctx.event:
@@ -216,6 +225,7 @@ def extract_home_team_logo(ctx: TemplateContext, game_ctx: GameContext | None) -
     category=Category.HOME_AWAY,
     suffix_rules=SuffixRules.ALL,
     description="Away team logo URL",
+    event_level=True,
 )
 def extract_away_team_logo(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     if not game_ctx or not game_ctx.event:
@@ -121,6 +121,7 @@ def extract_opponent_abbrev_lower(ctx: TemplateContext, game_ctx: GameContext |
     category=Category.IDENTITY,
     suffix_rules=SuffixRules.ALL,
     description="Full matchup string (e.g., 'Tampa Bay @ Detroit')",
+    event_level=True,
 )
 def extract_matchup(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     if not game_ctx or not game_ctx.event:
@@ -134,6 +135,7 @@ def extract_matchup(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     category=Category.IDENTITY,
     suffix_rules=SuffixRules.ALL,
     description="Abbreviated matchup uppercase (e.g., 'TB @ DET')",
+    event_level=True,
 )
 def extract_matchup_abbrev(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     if not game_ctx or not game_ctx.event:
@@ -23,6 +23,7 @@ def _get_season_type(game_ctx: GameContext | None) -> str:
     category=Category.PLAYOFFS,
     suffix_rules=SuffixRules.ALL,
     description="Season type (e.g., 'Regular Season', 'Playoffs', 'Preseason')",
+    event_level=True,
 )
 def extract_season_type(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     return _get_season_type(game_ctx)
@@ -33,6 +34,7 @@ def extract_season_type(ctx: TemplateContext, game_ctx: GameContext | None) -> s
     category=Category.PLAYOFFS,
     suffix_rules=SuffixRules.ALL,
     description="'true' if playoff/postseason game",
+    event_level=True,
 )
 def extract_is_playoff(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     season_type = _get_season_type(game_ctx).lower()
@@ -46,6 +48,7 @@ def extract_is_playoff(ctx: TemplateContext, game_ctx: GameContext | None) -> st
     category=Category.PLAYOFFS,
     suffix_rules=SuffixRules.ALL,
     description="'true' if preseason/exhibition game",
+    event_level=True,
 )
 def extract_is_preseason(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     season_type = _get_season_type(game_ctx).lower()
@@ -59,6 +62,7 @@ def extract_is_preseason(ctx: TemplateContext, game_ctx: GameContext | None) ->
     category=Category.PLAYOFFS,
     suffix_rules=SuffixRules.ALL,
     description="'true' if regular season game",
+    event_level=True,
 )
 def extract_is_regular_season(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     season_type = _get_season_type(game_ctx).lower()
@@ -61,6 +61,8 @@ class VariableDefinition:
     suffix_rules: SuffixRules
     extractor: Extractor
     description: str = ""
+    # Depends only on game_ctx.event (not perspective, stats or now) - memoized per event
+    event_level: bool = False
 
 
 class VariableRegistry:
@@ -86,6 +88,7 @@ class VariableRegistry:
         suffix_rules: SuffixRules,
         extractor: Extractor,
         description: str = "",
+        event_level: bool = False,
     ) -> None:
         """Register a variable definition."""
         self._variables[name] = VariableDefinition(
@@ -94,6 +97,7 @@ class VariableRegistry:
             suffix_rules=suffix_rules,
             extractor=extractor,
             description=description,
+            event_level=event_level,
         )
 
     def get(self, name: str) -> VariableDefinition | None:
@@ -104,6 +108,10 @@ class VariableRegistry:
         """Get all registered variables."""
         return list(self._variables.values())
 
+    def event_level_variables(self) -> list[VariableDefinition]:
+        """Get variables whose value depends only on the event."""
+        return [v for v in self._variables.values() if v.event_level]
+
     def by_category(self, category: Category) -> list[VariableDefinition]:
         """Get all variables in a category."""
         return [v for v in self._variables.values() if v.category == category]
@@ -122,9 +130,14 @@ def register_variable(
     category: Category,
     suffix_rules: SuffixRules = SuffixRules.ALL,
     description: str = "",
+    event_level: bool = False,
 ) -> Callable[[Extractor], Extractor]:
     """Decorator to register a variable extractor.
 
+    Set event_level=True only for extractors that read nothing but
+    game_ctx.event (and display settings), and not scores or the current
+    time; their values are memoized per event across perspectives.
+
     Usage:
         @register_variable(
             name="opponent",
@@ -140,7 +153,9 @@ def register_variable(
     """
 
     def decorator(func: Extractor) -> Extractor:
-        VariableRegistry().register(name, category, suffix_rules, func, description)
+        VariableRegistry().register(
+            name, category, suffix_rules, func, description, event_level=event_level
+        )
         return func
 
     return decorator
@@ -16,6 +16,7 @@ from teamarr.templates.variables.registry import (
     category=Category.VENUE,
     suffix_rules=SuffixRules.ALL,
     description="Stadium/arena name (e.g., 'Ford Field')",
+    event_level=True,
 )
 def extract_venue(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     if not game_ctx or not game_ctx.event or not game_ctx.event.venue:
@@ -28,6 +29,7 @@ def extract_venue(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     category=Category.VENUE,
     suffix_rules=SuffixRules.ALL,
     description="Venue city (e.g., 'Detroit')",
+    event_level=True,
 )
 def extract_venue_city(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     if not game_ctx or not game_ctx.event or not game_ctx.event.venue:
@@ -40,6 +42,7 @@ def extract_venue_city(ctx: TemplateContext, game_ctx: GameContext | None) -> st
     category=Category.VENUE,
     suffix_rules=SuffixRules.ALL,
     description="Venue state (e.g., 'Michigan')",
+    event_level=True,
 )
 def extract_venue_state(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     if not game_ctx or not game_ctx.event or not game_ctx.event.venue:
@@ -52,6 +55,7 @@ def extract_venue_state(ctx: TemplateContext, game_ctx: GameContext | None) -> s
     category=Category.VENUE,
     suffix_rules=SuffixRules.ALL,
     description="Full venue location (e.g., 'Ford Field, Detroit, Michigan')",
+    event_level=True,
 )
 def extract_venue_full(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     if not game_ctx or not game_ctx.event or not game_ctx.event.venue:
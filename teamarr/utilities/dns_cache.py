@@ -0,0 +1,215 @@
+"""In-process DNS cache and connection warm-up for httpx clients.
+
+Every new pooled connection normally triggers a getaddrinfo() lookup. Pool
+churn, client resets after errors and parallel first connections turn that
+into bursts of identical lookups, which DNS-throttling resolvers (PiHole,
+AdGuard) answer slowly or refuse.
+
+CachingDNSTransport is an httpx.HTTPTransport whose connections resolve
+hostnames through one process-wide DNSCache:
+- One lookup per host per TTL, shared by all provider and Dispatcharr clients
+- Concurrent first lookups for a host wait on a single resolution
+- A host's entry is dropped when connecting to every cached address fails,
+  so changed addresses are picked up on the next connection
+
+The system resolver doesn't expose record TTLs, so entries live for
+DNS_CACHE_TTL seconds (default 300, 0 disables the cache).
+
+Passing transport= to httpx.Client disables its HTTP(S)_PROXY/ALL_PROXY/
+NO_PROXY handling, so clients also pass mounts=proxy_mounts(limits): proxied
+URL patterns get a plain proxy transport (the proxy resolves the target),
+NO_PROXY patterns fall through to the caching transport.
+
+Connection warm-up is opt-in via PROVIDER_WARM_UP=1 (default off): it
+sends HEAD requests to provider hosts at the start of every generation run.
+
+Usage:
+    client = httpx.Client(
+        transport=CachingDNSTransport(limits=limits),
+        mounts=proxy_mounts(limits),
+    )
+    warm_up_connections(client, ["https://site.api.espn.com/"], connections=4)
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+
+import httpcore
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DNS_CACHE_TTL = float(os.environ.get("DNS_CACHE_TTL", 300))
+PROVIDER_WARM_UP = os.environ.get("PROVIDER_WARM_UP", "").lower() in ("1", "true", "yes")
+
+
+class DNSCache:
+    """Thread-safe hostname -> addresses cache with per-host single-flight."""
+
+    def __init__(self, ttl_seconds: float = DNS_CACHE_TTL):
+        self._ttl = ttl_seconds
+        self._entries: dict[tuple[str, int], tuple[float, list[str]]] = {}
+        self._host_locks: dict[tuple[str, int], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._lookups = 0
+        self._hits = 0
+
+    def resolve(self, host: str, port: int) -> list[str]:
+        """Get IP addresses for host (cached), in resolver order.
+
+        Raises:
+            OSError: Resolution failed (not cached)
+        """
+        key = (host, port)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self._hits += 1
+                return entry[1]
+            host_lock = self._host_locks.setdefault(key, threading.Lock())
+
+        with host_lock:
+            # Another thread may have resolved it while we waited
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry and entry[0] > time.monotonic():
+                    self._hits += 1
+                    return entry[1]
+
+            infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            addresses = list(dict.fromkeys(info[4][0] for info in infos))
+            with self._lock:
+                self._lookups += 1
+                self._entries[key] = (time.monotonic() + self._ttl, addresses)
+            logger.debug("[DNS] Resolved %s -> %s", host, ", ".join(addresses))
+            return addresses
+
+    def invalidate(self, host: str, port: int) -> None:
+        """Drop a host's cached addresses."""
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+    def stats(self) -> dict:
+        """Lookup/hit counts for diagnostics."""
+        with self._lock:
+            return {"hosts": len(self._entries), "lookups": self._lookups, "hits": self._hits}
+
+
+_dns_cache = DNSCache()
+
+
+def get_dns_cache() -> DNSCache:
+    """Get the process-wide DNS cache."""
+    return _dns_cache
+
+
+class _CachingNetworkBackend(httpcore.NetworkBackend):
+    """httpcore backend that connects to cached addresses."""
+
+    def __init__(self, cache: DNSCache):
+        self._cache = cache
+        self._backend = httpcore.SyncBackend()
+
+    def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: typing.Iterable[typing.Any] | None = None,
+    ) -> httpcore.NetworkStream:
+        try:
+            addresses = self._cache.resolve(host, port)
+        except OSError as e:
+            raise httpcore.ConnectError(str(e)) from e
+
+        last_error: Exception | None = None
+        for address in addresses:
+            try:
+                # IP literal - no further lookup; TLS still verifies the hostname
+                return self._backend.connect_tcp(
+                    address, port, timeout, local_address, socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                last_error = e
+
+        self._cache.invalidate(host, port)
+        raise last_error or httpcore.ConnectError(f"No addresses for {host}")
+
+    def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: typing.Iterable[typing.Any] | None = None,
+    ) -> httpcore.NetworkStream:
+        return self._backend.connect_unix_socket(path, timeout, socket_options)
+
+    def sleep(self, seconds: float) -> None:
+        self._backend.sleep(seconds)
+
+
+class CachingDNSTransport(httpx.HTTPTransport):
+    """httpx.HTTPTransport that resolves hostnames through the shared DNSCache."""
+
+    def __init__(self, *args, dns_cache: DNSCache | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        cache = dns_cache or _dns_cache
+        if cache._ttl <= 0:
+            return
+        # httpx builds the httpcore pool internally and has no network_backend
+        # option, so swap in our backend. A proxy= argument would make this an
+        # HTTPProxy pool, which is left alone; proxied routes should instead be
+        # mounted via proxy_mounts() and never reach this transport.
+        if type(self._pool) is httpcore.ConnectionPool and hasattr(self._pool, "_network_backend"):
+            self._pool._network_backend = _CachingNetworkBackend(cache)
+        else:
+            logger.debug("[DNS] Unsupported connection pool %s, DNS cache disabled", self._pool)
+
+
+def proxy_mounts(limits: httpx.Limits | None = None) -> dict[str, httpx.BaseTransport | None]:
+    """httpx mounts reproducing environment proxy settings.
+
+    httpx only honours HTTP(S)_PROXY/ALL_PROXY/NO_PROXY when no transport is
+    passed; clients using CachingDNSTransport pass these mounts instead.
+    Proxied patterns get a proxy HTTPTransport; NO_PROXY patterns map to None
+    (the client's own transport).
+    """
+    from httpx._utils import get_environment_proxies
+
+    mounts: dict[str, httpx.BaseTransport | None] = {}
+    for pattern, proxy in get_environment_proxies().items():
+        if proxy is None:
+            mounts[pattern] = None
+        elif limits:
+            mounts[pattern] = httpx.HTTPTransport(proxy=proxy, limits=limits)
+        else:
+            mounts[pattern] = httpx.HTTPTransport(proxy=proxy)
+    return mounts
+
+
+def warm_up_connections(client: httpx.Client, urls: list[str], connections: int = 4) -> None:
+    """Open pooled connections before a parallel fan-out.
+
+    Issues `connections` concurrent HEAD requests per URL so the first
+    burst of real requests reuses warm keepalive connections (and one
+    cached DNS lookup) instead of all connecting at once. Failures are
+    logged and ignored.
+    """
+
+    def head(url: str) -> None:
+        try:
+            client.head(url)
+        except httpx.HTTPError as e:
+            logger.debug("[DNS] Warm-up request to %s failed: %s", url, e)
+
+    targets = [url for url in urls for _ in range(connections)]
+    if not targets:
+        return
+    with ThreadPoolExecutor(max_workers=len(targets), thread_name_prefix="warm-up") as executor:
+        list(executor.map(head, targets))
@@ -0,0 +1,64 @@
+"""First-match-wins pattern tables compiled into single regexes.
+
+Hint/placeholder detection checks an ordered table of patterns and returns
+the value of the first pattern (in table order, not string position) that
+matches anywhere in the text. PatternScanner compiles a table once into:
+
+- a prefilter: one alternation of all patterns; a miss means no pattern
+  matches, answered in a single scan
+- a priority regex: an anchored alternation of lookaheads, one per pattern
+  in table order, each followed by an empty named group. The regex engine
+  tries alternatives in order, so the first one that succeeds is the
+  first-priority pattern, identified by match.lastgroup.
+
+Both run inside the regex engine in one call, instead of one re.search per
+pattern from Python.
+"""
+
+import re
+from typing import Generic, TypeVar
+
+from teamarr.utilities.constants import (
+    LEAGUE_HINT_PATTERNS,
+    PLACEHOLDER_PATTERNS,
+    SPORT_HINT_PATTERNS,
+)
+
+T = TypeVar("T")
+
+
+class PatternScanner(Generic[T]):
+    """Ordered (pattern, value) table answering first-match-wins lookups."""
+
+    def __init__(self, table: list[tuple[str, T]], flags: int = re.IGNORECASE):
+        self._values = [value for _, value in table]
+        self._prefilter = re.compile("|".join(f"(?:{p})" for p, _ in table), flags)
+        # [\s\S]*? lets each pattern match anywhere, like re.search; ^ anchors
+        # inside the lookahead still only match at the start of the text
+        self._priority = re.compile(
+            "|".join(f"(?=[\\s\\S]*?(?:{p}))(?P<p{i}>)" for i, (p, _) in enumerate(table)),
+            flags,
+        )
+
+    def first(self, text: str) -> T | None:
+        """Value of the first pattern in table order that matches text."""
+        if not self._prefilter.search(text):
+            return None
+        match = self._priority.match(text)
+        if not match:
+            return None
+        return self._values[int(match.lastgroup[1:])]
+
+    def matches(self, text: str) -> bool:
+        """True if any pattern matches text."""
+        return self._prefilter.search(text) is not None
+
+
+# Placeholder fallback: names made only of digits, spaces, dashes and colons
+NUMBERS_ONLY_PATTERN = re.compile(r"^[\d\s\-:]+$")
+
+PLACEHOLDER_SCANNER: PatternScanner[bool] = PatternScanner(
+    [(p, True) for p in PLACEHOLDER_PATTERNS]
+)
+LEAGUE_HINT_SCANNER: PatternScanner[str | list[str]] = PatternScanner(LEAGUE_HINT_PATTERNS)
+SPORT_HINT_SCANNER: PatternScanner[str] = PatternScanner(SPORT_HINT_PATTERNS)
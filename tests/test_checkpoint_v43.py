@@ -633,9 +633,9 @@ class TestFullMigrationPath:
 
         _run_migrations(conn)
 
-        # Should now be at latest schema version (v43 checkpoint + v44 + v45 + v46 migrations)
+        # Should now be at latest schema version (v43 checkpoint + v44-v50 migrations)
         row = conn.execute("SELECT schema_version FROM settings WHERE id = 1").fetchone()
-        assert row["schema_version"] == 46
+        assert row["schema_version"] == 50
 
 
 if __name__ == "__main__":
@@ -0,0 +1,64 @@
+"""Tests for memoized stream classification."""
+
+from datetime import date, datetime
+
+import pytest
+
+from teamarr.consumers.matching import classifier
+from teamarr.consumers.matching.classifier import (
+    CustomRegexConfig,
+    classify_stream,
+    clear_classification_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_classification_cache()
+    yield
+    clear_classification_cache()
+
+
+def test_repeated_name_returns_cached_result():
+    first = classify_stream("NFL: Chiefs vs Bills")
+    assert classify_stream("NFL: Chiefs vs Bills") is first
+    assert first.team1 and first.team2
+
+
+def test_custom_regex_is_part_of_key():
+    config = CustomRegexConfig(time_pattern=r"(?P<time>\d{1,2}:\d{2}\s*[ap]m)", time_enabled=True)
+    plain = classify_stream("Chiefs vs Bills 8:15pm")
+    custom = classify_stream("Chiefs vs Bills 8:15pm", None, config)
+    assert plain is not custom
+    assert classify_stream("Chiefs vs Bills 8:15pm", None, config) is custom
+
+
+def test_results_expire_at_midnight(monkeypatch):
+    class NextDay(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2099, 1, 1, 0, 0, 1)
+
+    first = classify_stream("Chiefs vs Bills 1/17")
+    monkeypatch.setattr(classifier, "datetime", NextDay)
+    assert classify_stream("Chiefs vs Bills 1/17") is not first
+
+
+def test_reference_date_drives_year_inference():
+    december = classify_stream("Chiefs vs Bills 1/2", today=date(2025, 12, 30))
+    june = classify_stream("Chiefs vs Bills 1/2", today=date(2026, 6, 1))
+
+    assert december.normalized.extracted_date == date(2026, 1, 2)
+    assert june.normalized.extracted_date == date(2026, 1, 2)
+    assert december is not june
+
+    new_year = classify_stream("Chiefs vs Bills 12/31", today=date(2026, 1, 2))
+    assert new_year.normalized.extracted_date == date(2025, 12, 31)
+
+
+def test_custom_date_regex_uses_reference_year():
+    config = CustomRegexConfig(date_pattern=r"\[(?P<date>\w+ \d+)\]", date_enabled=True)
+
+    result = classify_stream("Chiefs vs Bills [Dec 30]", None, config, today=date(2025, 12, 29))
+
+    assert result.normalized.extracted_date == date(2025, 12, 30)
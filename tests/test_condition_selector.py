@@ -0,0 +1,75 @@
+"""Tests for compiled conditional description selection."""
+
+from datetime import UTC, datetime
+
+from teamarr.core.types import Event, EventStatus, Team
+from teamarr.templates.conditions import ConditionalDescriptionSelector
+from teamarr.templates.context import GameContext, TeamChannelContext, TemplateContext
+
+OPTIONS = [
+    {"condition": "is_away", "priority": 10, "template": "away"},
+    {"condition": "is_home", "priority": 50, "template": "home"},
+    {"condition": "unknown_condition", "priority": 1, "template": "never"},
+    {"priority": 100, "template": "default"},
+]
+
+
+def _contexts(is_home: bool) -> tuple[TemplateContext, GameContext]:
+    team = Team(
+        id="1", provider="espn", name="Detroit Lions", short_name="Lions",
+        abbreviation="DET", league="nfl", sport="football",
+    )  # fmt: skip
+    event = Event(
+        id="e1",
+        provider="espn",
+        name="Chicago Bears at Detroit Lions",
+        short_name="CHI @ DET",
+        start_time=datetime(2026, 1, 10, 18, tzinfo=UTC),
+        home_team=team,
+        away_team=team,
+        status=EventStatus(state="scheduled"),
+        league="nfl",
+        sport="football",
+    )
+    game_ctx = GameContext(event=event, is_home=is_home, team=team)
+    ctx = TemplateContext(
+        game_context=game_ctx,
+        team_config=TeamChannelContext(
+            team_id="1", league="nfl", sport="football", team_name="Detroit Lions"
+        ),
+        team_stats=None,
+    )
+    return ctx, game_ctx
+
+
+def test_highest_satisfied_priority_wins():
+    selector = ConditionalDescriptionSelector()
+    assert selector.select(OPTIONS, *_contexts(is_home=False)) == "away"
+    assert selector.select(OPTIONS, *_contexts(is_home=True)) == "home"
+    assert selector.select(OPTIONS, _contexts(True)[0], None) == "default"
+
+
+def test_compiled_once_per_option_set():
+    selector = ConditionalDescriptionSelector()
+    compiled = selector.compile(OPTIONS)
+    assert selector.compile([dict(opt) for opt in OPTIONS]) is compiled
+    assert [priority for priority, _ in compiled] == [10, 50, 100]
+
+
+def test_json_string_options():
+    selector = ConditionalDescriptionSelector()
+    ctx, game_ctx = _contexts(is_home=True)
+    assert selector.select('[{"priority": 100, "template": "x"}]', ctx, game_ctx) == "x"
+    assert selector.select("not json", ctx, game_ctx) == ""
+
+
+def test_non_scalar_condition_values_are_skipped():
+    selector = ConditionalDescriptionSelector()
+    options = [
+        {"condition": "win_streak", "condition_value": ["3"], "priority": 10, "template": "x"},
+        {"condition": "is_home", "condition_value": {"a": 1}, "priority": 20, "template": "y"},
+        {"condition": "is_away", "condition_value": 0, "priority": 30, "template": "away"},
+        {"priority": 100, "template": "default"},
+    ]
+    assert [priority for priority, _ in selector.compile(options)] == [30, 100]
+    assert selector.select(options, *_contexts(is_home=False)) == "away"
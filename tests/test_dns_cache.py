@@ -0,0 +1,33 @@
+"""Caching-DNS clients must keep honouring environment proxies."""
+
+import httpx
+
+from teamarr.providers.recording import provider_transports
+from teamarr.utilities.dns_cache import CachingDNSTransport
+
+
+def test_env_proxies_are_mounted(monkeypatch):
+    for var in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(var, raising=False)
+        monkeypatch.delenv(var.lower(), raising=False)
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+    monkeypatch.setenv("NO_PROXY", "localhost")
+
+    client = httpx.Client(**provider_transports(httpx.Limits(max_connections=5)))
+
+    proxied = client._transport_for_url(httpx.URL("https://site.api.espn.com/"))
+    direct = client._transport_for_url(httpx.URL("https://localhost/"))
+    assert not isinstance(proxied, CachingDNSTransport)
+    assert isinstance(direct, CachingDNSTransport)
+
+
+def test_no_proxy_env_uses_caching_transport(monkeypatch):
+    for var in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(var, raising=False)
+        monkeypatch.delenv(var.lower(), raising=False)
+
+    client = httpx.Client(**provider_transports())
+
+    assert isinstance(
+        client._transport_for_url(httpx.URL("https://site.api.espn.com/")), CachingDNSTransport
+    )
@@ -0,0 +1,107 @@
+"""Tests for the per-run event-derived template data memo."""
+
+from dataclasses import replace
+from datetime import UTC, datetime
+
+import pytest
+
+from teamarr.core.types import Event, EventStatus, Team, Venue
+from teamarr.templates.context_builder import ContextBuilder
+from teamarr.templates.event_cache import event_cache_scope, get_event_cache_stats
+from teamarr.templates.resolver import TemplateResolver
+from teamarr.templates.variables import get_registry
+
+
+class StatsService:
+    def get_team_stats(self, team_id: str, league: str):
+        return None
+
+
+def _team(team_id: str, name: str, abbrev: str) -> Team:
+    return Team(
+        id=team_id, provider="espn", name=name, short_name=name.split()[-1],
+        abbreviation=abbrev, league="nfl", sport="football",
+    )  # fmt: skip
+
+
+EVENT = Event(
+    id="401",
+    provider="espn",
+    name="Chicago Bears at Detroit Lions",
+    short_name="CHI @ DET",
+    start_time=datetime(2026, 1, 10, 23, 30, tzinfo=UTC),
+    home_team=_team("8", "Detroit Lions", "DET"),
+    away_team=_team("3", "Chicago Bears", "CHI"),
+    status=EventStatus(state="scheduled"),
+    league="nfl",
+    sport="football",
+    venue=Venue(name="Ford Field", city="Detroit", state="Michigan"),
+    broadcasts=["FOX", "NFL Network"],
+    season_type="Regular Season",
+    odds_data={"provider": "ESPN BET", "spread": -3.5, "home_moneyline": -180},
+)
+
+
+@pytest.fixture
+def run_scope():
+    with event_cache_scope():
+        yield
+
+
+def _uncached(ctx) -> dict[str, str]:
+    return {
+        var_def.name: var_def.extractor(ctx, ctx.game_context)
+        for var_def in get_registry().event_level_variables()
+    }
+
+
+def test_both_perspectives_share_event_values(run_scope):
+    builder = ContextBuilder(StatsService())
+    resolver = TemplateResolver()
+
+    for team_id in ("8", "3"):
+        ctx = builder.build_for_event(EVENT, team_id=team_id, league="nfl")
+        assert resolver._event_variables(ctx, ctx.game_context) == _uncached(ctx)
+
+    stats = get_event_cache_stats()
+    assert stats["size"] == 1
+    assert stats["hits"] >= 2
+
+
+def test_odds_are_per_perspective(run_scope):
+    builder = ContextBuilder(StatsService())
+    home = builder.build_for_event(EVENT, team_id="8", league="nfl").game_context.odds
+    away = builder.build_for_event(EVENT, team_id="3", league="nfl").game_context.odds
+    assert home.team_moneyline == -180
+    assert away.opponent_moneyline == -180
+
+
+def test_status_change_is_a_new_entry(run_scope):
+    resolver = TemplateResolver()
+    builder = ContextBuilder(StatsService())
+    ctx = builder.build_for_event(EVENT, team_id="8", league="nfl")
+    assert resolver._event_variables(ctx, ctx.game_context)["venue"] == "Ford Field"
+    moved = replace(EVENT, status=EventStatus(state="postponed"), venue=Venue(name="Soldier Field"))
+    ctx = builder.build_for_event(moved, team_id="8", league="nfl")
+    assert resolver._event_variables(ctx, ctx.game_context)["venue"] == "Soldier Field"
+    assert get_event_cache_stats()["size"] == 2
+
+
+def test_nothing_is_memoized_outside_a_run():
+    resolver = TemplateResolver()
+    builder = ContextBuilder(StatsService())
+    ctx = builder.build_for_event(EVENT, team_id="8", league="nfl")
+    assert resolver._event_variables(ctx, ctx.game_context)["venue"] == "Ford Field"
+
+    # Same status key, new venue: a preview after the run sees the edit
+    moved = replace(EVENT, venue=Venue(name="Soldier Field"))
+    ctx = builder.build_for_event(moved, team_id="8", league="nfl")
+    assert resolver._event_variables(ctx, ctx.game_context)["venue"] == "Soldier Field"
+    assert get_event_cache_stats()["size"] == 0
+
+
+def test_scope_is_cleared_when_the_run_ends(run_scope):
+    builder = ContextBuilder(StatsService())
+    with event_cache_scope():  # nested, e.g. a group run inside full generation
+        builder.build_for_event(EVENT, team_id="8", league="nfl")
+    assert get_event_cache_stats()["size"] == 1
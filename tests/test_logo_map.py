@@ -0,0 +1,119 @@
+"""Tests for the persisted Dispatcharr logo URL -> ID map."""
+
+from functools import partial
+
+import pytest
+
+from teamarr.database.connection import get_db, init_db
+from teamarr.dispatcharr.managers.logos import LogoManager
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, data: dict | None = None):
+        self.status_code = status_code
+        self._data = data or {}
+        self.text = "x" if data else ""
+
+    def json(self) -> dict:
+        return self._data
+
+
+class FakeDispatcharr:
+    """Dispatcharr logo API stand-in that counts full listings."""
+
+    def __init__(self, base_url: str):
+        self._base_url = base_url
+        self.logos: dict[int, dict] = {}
+        self.listings = 0
+
+    def add(self, logo_id: int, url: str) -> None:
+        self.logos[logo_id] = {"id": logo_id, "name": f"logo {logo_id}", "url": url}
+
+    def paginated_get(self, endpoint: str, error_context: str = "") -> list[dict]:
+        self.listings += 1
+        return list(self.logos.values())
+
+    def get(self, endpoint: str) -> FakeResponse:
+        logo_id = int(endpoint.rstrip("/").rsplit("/", 1)[-1])
+        logo = self.logos.get(logo_id)
+        return FakeResponse(200, logo) if logo else FakeResponse(404)
+
+    def post(self, endpoint: str, data: dict) -> FakeResponse:
+        if any(logo["url"] == data["url"] for logo in self.logos.values()):
+            return FakeResponse(400, {"url": ["Logo with this url already exists."]})
+        logo_id = max(self.logos, default=0) + 1
+        self.add(logo_id, data["url"])
+        return FakeResponse(201, self.logos[logo_id])
+
+    def parse_api_error(self, response) -> str:
+        return "rejected"
+
+
+@pytest.fixture
+def db_factory(tmp_path):
+    db_path = tmp_path / "teamarr.db"
+    init_db(db_path)
+    return partial(get_db, db_path)
+
+
+@pytest.fixture
+def dispatcharr(request):
+    client = FakeDispatcharr(f"http://dispatcharr.test/{request.node.name}")
+    yield client
+    LogoManager._caches.pop(client._base_url, None)
+    LogoManager._unverified.pop(client._base_url, None)
+
+
+def test_fresh_map_loads_without_listing(dispatcharr, db_factory):
+    dispatcharr.add(1, "https://img/a.png")
+    LogoManager(dispatcharr, db_factory).find_by_url("https://img/a.png")
+    assert dispatcharr.listings == 1
+
+    # New process (empty in-memory cache) reloads from the persisted map
+    manager = LogoManager(dispatcharr, db_factory)
+    manager.clear_cache()
+    assert manager.find_by_url("https://img/a.png").id == 1
+    assert dispatcharr.listings == 1
+
+
+def test_stale_listing_relists_even_with_recent_entries(dispatcharr, db_factory):
+    dispatcharr.add(1, "https://img/a.png")
+    manager = LogoManager(dispatcharr, db_factory)
+    manager.upload("a", "https://img/a.png")
+
+    # Last full listing is old; entry verification alone must not keep the map fresh
+    with db_factory() as conn:
+        conn.execute("UPDATE dispatcharr_logo_listings SET listed_at = '2000-01-01 00:00:00'")
+        conn.commit()
+    dispatcharr.add(2, "https://img/external.png")  # created outside Teamarr
+
+    manager.clear_cache()
+    assert manager.find_by_url("https://img/external.png").id == 2
+    assert dispatcharr.listings == 2
+
+
+def test_rejected_upload_recovers_existing_logo(dispatcharr, db_factory):
+    manager = LogoManager(dispatcharr, db_factory)
+    manager.find_by_url("https://img/none.png")  # map now lists no logos
+    dispatcharr.add(7, "https://img/external.png")
+
+    result = manager.upload("external", "https://img/external.png")
+
+    assert result.success
+    assert result.logo["id"] == 7
+
+
+def test_cleared_cache_reverifies_aged_entries(dispatcharr, db_factory):
+    dispatcharr.add(1, "https://img/a.png")
+    manager = LogoManager(dispatcharr, db_factory)
+    assert manager.find_by_url("https://img/a.png").id == 1
+
+    # Deleted in Dispatcharr; the entry is past the verify age
+    del dispatcharr.logos[1]
+    with db_factory() as conn:
+        conn.execute("UPDATE dispatcharr_logo_map SET verified_at = '2000-01-01 00:00:00'")
+        conn.commit()
+
+    manager.clear_cache()  # once per channel batch
+    assert manager.find_by_url("https://img/a.png") is None
+    assert dispatcharr.listings == 1
@@ -0,0 +1,252 @@
+"""Golden-corpus accuracy and benchmark suite for stream matching.
+
+Runs the matching pipeline (normalize_stream -> classify_stream ->
+StreamMatcher.match_all) over a checked-in corpus of anonymized stream names
+and recorded events (tests/fixtures/matching_corpus.json) against a fake
+SportsDataService, and scores results against each stream's expected event ID.
+
+The tests guard accuracy: performance changes to the matcher must not lower
+precision or recall below the recorded baseline.
+
+Run directly from the repository root for a benchmark report
+(streams/second, per-stage time, allocations, precision/recall):
+    PYTHONPATH=. python tests/test_matching_corpus.py [iterations]
+"""
+
+import json
+import sys
+import tempfile
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from functools import partial
+from pathlib import Path
+from time import perf_counter
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from teamarr.consumers.matching import (
+    StreamMatcher,
+    classify_stream,
+    clear_classification_cache,
+    normalize_stream,
+)
+from teamarr.core.types import Event, EventStatus, Team
+from teamarr.database.connection import get_db, init_db
+
+CORPUS_PATH = Path(__file__).parent / "fixtures" / "matching_corpus.json"
+
+# Accuracy baseline for the corpus (raise when matching improves). Bare
+# abbreviation streams ("BOS vs NYR") are the known recall gap.
+MIN_PRECISION = 1.0
+MIN_RECALL = 0.82
+
+# Date the corpus is evaluated on. Pinned (and passed to the classifier) so
+# results don't depend on when the suite runs; the corpus spans New Year to
+# cover year inference for dates like "1/2".
+CORPUS_DATE = date(2025, 12, 30)
+
+
+class CorpusSportsDataService:
+    """SportsDataService stand-in serving recorded corpus events."""
+
+    def __init__(self, events: list[Event]):
+        self._by_league_date: dict[tuple[str, date], list[Event]] = {}
+        for event in events:
+            key = (event.league, event.start_time.date())
+            self._by_league_date.setdefault(key, []).append(event)
+
+    def get_provider_name(self, league: str) -> str:
+        return "espn"
+
+    def get_events(self, league: str, target_date: date, cache_only: bool = False) -> list[Event]:
+        return list(self._by_league_date.get((league, target_date), []))
+
+
+@dataclass
+class Corpus:
+    target_date: date
+    user_tz: ZoneInfo
+    days_ahead: int
+    events: list[Event]
+    streams: list[dict]
+    expected: dict[int, str | None]
+
+    @property
+    def leagues(self) -> list[str]:
+        return sorted({event.league for event in self.events})
+
+
+@dataclass
+class CorpusReport:
+    """Accuracy and timing for one corpus run."""
+
+    true_positives: int = 0
+    false_positives: int = 0
+    false_negatives: int = 0
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+    peak_bytes: int = 0
+    mismatches: list[str] = field(default_factory=list)
+
+    @property
+    def precision(self) -> float:
+        matched = self.true_positives + self.false_positives
+        return self.true_positives / matched if matched else 1.0
+
+    @property
+    def recall(self) -> float:
+        expected = self.true_positives + self.false_negatives
+        return self.true_positives / expected if expected else 1.0
+
+
+def _parse_team(data: dict, league: str, sport: str) -> Team:
+    return Team(
+        id=data["id"],
+        provider="espn",
+        name=data["name"],
+        short_name=data["short_name"],
+        abbreviation=data["abbreviation"],
+        league=league,
+        sport=sport,
+    )
+
+
+def _render_name(template: str, day: date) -> str:
+    return template.format(m=day.month, d=day.day, b=f"{day:%b}", dd=f"{day:%d}")
+
+
+def load_corpus(path: Path = CORPUS_PATH, target_date: date = CORPUS_DATE) -> Corpus:
+    """Load the corpus fixture for a target date.
+
+    Event days and stream-name dates are stored as offsets from the target
+    date. The classifier infers years for dates like "1/17" relative to a
+    reference date, so run_corpus passes it the same target date.
+    """
+    data = json.loads(path.read_text())
+    user_tz = ZoneInfo(data["user_tz"])
+    events = [
+        Event(
+            id=e["id"],
+            provider="espn",
+            name=e["name"],
+            short_name=e["short_name"],
+            start_time=datetime.combine(
+                target_date + timedelta(days=e["day"]),
+                time.fromisoformat(e["time"]),
+                tzinfo=user_tz,
+            ),
+            home_team=_parse_team(e["home"], e["league"], e["sport"]),
+            away_team=_parse_team(e["away"], e["league"], e["sport"]),
+            status=EventStatus(state=e["state"]),
+            league=e["league"],
+            sport=e["sport"],
+        )
+        for e in data["events"]
+    ]
+    return Corpus(
+        target_date=target_date,
+        user_tz=user_tz,
+        days_ahead=data["days_ahead"],
+        events=events,
+        streams=[
+            {"id": s["id"], "name": _render_name(s["name"], target_date + timedelta(days=s["day"]))}
+            for s in data["streams"]
+        ],
+        expected={s["id"]: s["expected"] for s in data["streams"]},
+    )
+
+
+def _timed(report: CorpusReport, stage: str, fn: Callable):
+    start = perf_counter()
+    result = fn()
+    report.stage_seconds[stage] = perf_counter() - start
+    return result
+
+
+def run_corpus(corpus: Corpus, db_path: Path, trace_allocations: bool = False) -> CorpusReport:
+    """Run the full pipeline over the corpus with a fresh database and cold caches."""
+    init_db(db_path)
+    db_factory = partial(get_db, db_path)
+    clear_classification_cache()
+    report = CorpusReport()
+    names = [stream["name"] for stream in corpus.streams]
+
+    if trace_allocations:
+        tracemalloc.start()
+
+    today = corpus.target_date
+    _timed(report, "normalize", lambda: [normalize_stream(name, today) for name in names])
+    _timed(report, "classify", lambda: [classify_stream(name, None, None, today) for name in names])
+    clear_classification_cache()
+
+    matcher = StreamMatcher(
+        service=CorpusSportsDataService(corpus.events),
+        db_factory=db_factory,
+        group_id=1,
+        search_leagues=corpus.leagues,
+        user_tz=corpus.user_tz,
+        days_ahead=corpus.days_ahead,
+        generation=1,
+        match_workers=0,
+    )
+    batch = _timed(
+        report, "match_all", lambda: matcher.match_all(corpus.streams, corpus.target_date)
+    )
+
+    if trace_allocations:
+        report.peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    for result in batch.results:
+        expected = corpus.expected[result.stream_id]
+        actual = result.event.id if result.matched and result.event else None
+        if actual == expected:
+            report.true_positives += bool(actual)
+            continue
+        if actual:
+            report.false_positives += 1
+        if expected:
+            report.false_negatives += 1
+        report.mismatches.append(f"{result.stream_name!r}: expected {expected}, got {actual}")
+    return report
+
+
+@pytest.fixture(scope="module")
+def corpus_report(tmp_path_factory) -> CorpusReport:
+    return run_corpus(load_corpus(), tmp_path_factory.mktemp("corpus") / "teamarr.db")
+
+
+def test_corpus_precision(corpus_report):
+    """Matched streams are matched to the right event."""
+    assert corpus_report.precision >= MIN_PRECISION, "\n".join(corpus_report.mismatches)
+
+
+def test_corpus_recall(corpus_report):
+    """Streams with an expected event are found."""
+    assert corpus_report.recall >= MIN_RECALL, "\n".join(corpus_report.mismatches)
+
+
+def _benchmark(iterations: int) -> None:
+    corpus = load_corpus()
+    with tempfile.TemporaryDirectory() as tmp:
+        reports = [
+            run_corpus(corpus, Path(tmp) / f"run{i}.db", trace_allocations=(i == 0))
+            for i in range(iterations)
+        ]
+
+    streams = len(corpus.streams)
+    print(f"corpus: {streams} streams, {len(corpus.events)} events, {iterations} runs")
+    for stage in ("normalize", "classify", "match_all"):
+        best = min(report.stage_seconds[stage] for report in reports)
+        print(f"  {stage:10s} {best * 1000:8.1f} ms  {streams / best:10.0f} streams/s")
+    print(f"  peak allocations {reports[0].peak_bytes / 1024:.0f} KiB (first run)")
+    report = reports[-1]
+    print(f"  precision {report.precision:.3f}  recall {report.recall:.3f}")
+    for line in report.mismatches:
+        print(f"    {line}")
+
+
+if __name__ == "__main__":
+    _benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,129 @@
+"""Parallel team matching must produce the same outcomes as serial matching."""
+
+from datetime import UTC, date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from teamarr.consumers.matching.alias_index import AliasIndex
+from teamarr.consumers.matching.classifier import classify_stream
+from teamarr.consumers.matching.parallel import MatchSnapshot, match_streams_parallel
+from teamarr.consumers.matching.team_matcher import TeamMatcher
+from teamarr.core.types import Event, EventStatus, Team
+
+TARGET = date(2026, 1, 10)
+TEAMS = {
+    "nba": ["Lakers", "Celtics", "Knicks", "Bulls", "Heat", "Warriors"],
+    "nhl": ["Rangers", "Bruins", "Penguins", "Flyers", "Oilers", "Canucks"],
+}
+
+
+def _team(name: str, league: str) -> Team:
+    return Team(
+        id=name.lower(),
+        provider="espn",
+        name=name,
+        short_name=name,
+        abbreviation=name[:3].upper(),
+        league=league,
+        sport="basketball" if league == "nba" else "hockey",
+    )
+
+
+def _events() -> dict[str, list[Event]]:
+    events: dict[str, list[Event]] = {}
+    for league, names in TEAMS.items():
+        for day in range(3):
+            for i in range(0, len(names), 2):
+                home, away = (
+                    _team(names[i], league),
+                    _team(names[(i + day + 1) % len(names)], league),
+                )
+                start = datetime(2026, 1, 10, 19, tzinfo=UTC) + timedelta(days=day)
+                events.setdefault(league, []).append(
+                    Event(
+                        id=f"{league}-{day}-{i}",
+                        provider="espn",
+                        name=f"{away.name} at {home.name}",
+                        short_name=f"{away.abbreviation} @ {home.abbreviation}",
+                        start_time=start,
+                        home_team=home,
+                        away_team=away,
+                        status=EventStatus(state="scheduled"),
+                        league=league,
+                        sport=home.sport,
+                    )
+                )
+    return events
+
+
+def test_parallel_outcomes_match_serial():
+    events = _events()
+    aliases = AliasIndex({("lal", "nba"): "lakers"})
+    streams = [
+        f"{league.upper()}: {a} vs {b}"
+        for league, names in TEAMS.items()
+        for a in names
+        for b in names
+        if a != b
+    ] + ["LAL vs Celtics", "Unknown FC vs Nobody United"]
+    classified = [(i, classify_stream(name)) for i, name in enumerate(streams)]
+    snapshot = MatchSnapshot(
+        enabled_leagues=list(TEAMS),
+        target_date=TARGET,
+        group_id=1,
+        generation=1,
+        user_tz=ZoneInfo("UTC"),
+        days_ahead=3,
+        prefetched_events=events,
+        alias_index=aliases,
+    )
+
+    serial_matcher = TeamMatcher.from_index(aliases, days_ahead=3)
+    serial = [
+        serial_matcher.match_multi_league(
+            classified=c,
+            enabled_leagues=snapshot.enabled_leagues,
+            target_date=TARGET,
+            group_id=1,
+            stream_id=stream_id,
+            generation=1,
+            user_tz=snapshot.user_tz,
+            prefetched_events=events,
+            use_cache=False,
+        )
+        for stream_id, c in classified
+    ]
+    parallel = match_streams_parallel(snapshot, classified, workers=2)
+
+    assert parallel == serial
+    assert any(outcome.is_matched for outcome in serial)
+
+
+def test_empty_prefetch_falls_back_to_serial():
+    snapshot = MatchSnapshot(
+        enabled_leagues=list(TEAMS),
+        target_date=TARGET,
+        group_id=1,
+        generation=1,
+        user_tz=ZoneInfo("UTC"),
+        days_ahead=3,
+        prefetched_events={},
+    )
+    classified = [(1, classify_stream("NBA: Lakers vs Celtics"))]
+
+    assert match_streams_parallel(snapshot, classified, workers=2) is None
+
+
+def test_worker_errors_fall_back_to_serial():
+    # A league with no events list at all makes workers raise inside match_multi_league
+    snapshot = MatchSnapshot(
+        enabled_leagues=["nba"],
+        target_date=TARGET,
+        group_id=1,
+        generation=1,
+        user_tz=ZoneInfo("UTC"),
+        days_ahead=3,
+        prefetched_events={"nba": None},
+    )
+    classified = [(1, classify_stream("NBA: Lakers vs Celtics"))]
+
+    assert match_streams_parallel(snapshot, classified, workers=2) is None
@@ -0,0 +1,127 @@
+"""Tests for compiled hint/placeholder scanners.
+
+The scanners must give the same answers as the per-pattern re.search loops
+they replace, including first-match-wins table order.
+
+Run directly from the repository root for a microbenchmark:
+    PYTHONPATH=. python tests/test_pattern_scanner.py
+"""
+
+import re
+import timeit
+
+import pytest
+
+from teamarr.utilities.constants import (
+    LEAGUE_HINT_PATTERNS,
+    PLACEHOLDER_PATTERNS,
+    SPORT_HINT_PATTERNS,
+)
+from teamarr.utilities.pattern_scanner import (
+    LEAGUE_HINT_SCANNER,
+    PLACEHOLDER_SCANNER,
+    SPORT_HINT_SCANNER,
+    PatternScanner,
+)
+
+SAMPLE_NAMES = [
+    "NFL: Kansas City Chiefs vs Buffalo Bills",
+    "ESPN+ 12: NCAAF Alabama @ Georgia",
+    "NHL 04 | Rangers at Bruins 7:00 PM",
+    "Premier League: Arsenal v Chelsea",
+    "UFC 310: Pantoja vs Asakura",
+    "MLB Network",
+    "NBA: Lakers @ Celtics",
+    "WNBA Liberty vs Aces",
+    "College Basketball: Duke vs UNC",
+    "EPL 3 - Liverpool vs Everton",
+    "Bundesliga: Bayern vs Dortmund",
+    "La Liga - Real Madrid vs Barcelona",
+    "MLS: LAFC vs Galaxy",
+    "OHL: London Knights vs Kitchener Rangers",
+    "Boxing: Fury vs Usyk",
+    "Formula 1 - Monaco GP",
+    "Tennis: Wimbledon Centre Court",
+    "Cricket IPL: CSK vs MI",
+    "Rugby Six Nations: England vs France",
+    "ESPN+ 45",
+    "Coming Soon",
+    "TBD",
+    "No Event Scheduled",
+    "Off Air",
+    "12 - 00:00",
+    "",
+    "Random Channel Name",
+    "NCAAW: UConn vs South Carolina",
+    "Hockey: Canada vs USA",
+    "Golf: The Masters Round 1",
+]
+
+
+def _first_loop(table, text):
+    for pattern, value in table:
+        if re.search(pattern, text, re.IGNORECASE):
+            return value
+    return None
+
+
+def _any_loop(patterns, text):
+    return any(re.search(p, text, re.IGNORECASE) for p in patterns)
+
+
+@pytest.mark.parametrize("name", SAMPLE_NAMES)
+def test_scanners_match_per_pattern_loops(name):
+    """Scanners agree with the original loops on realistic stream names."""
+    text = name.lower()
+    assert LEAGUE_HINT_SCANNER.first(text) == _first_loop(LEAGUE_HINT_PATTERNS, text)
+    assert SPORT_HINT_SCANNER.first(text) == _first_loop(SPORT_HINT_PATTERNS, text)
+    assert PLACEHOLDER_SCANNER.matches(text) == _any_loop(PLACEHOLDER_PATTERNS, text)
+
+
+def test_table_order_beats_string_position():
+    """The first pattern in the table wins, even if a later one matches earlier."""
+    scanner = PatternScanner([(r"\bbeta\b", "beta"), (r"\balpha\b", "alpha")])
+    assert scanner.first("alpha then beta") == "beta"
+    assert scanner.first("alpha only") == "alpha"
+    assert scanner.first("neither") is None
+
+
+def test_anchored_pattern_only_matches_at_start():
+    """^ inside a table pattern keeps its re.search meaning."""
+    scanner = PatternScanner([(r"^nfl\b", "nfl"), (r"\bnba\b", "nba")])
+    assert scanner.first("nfl: game") == "nfl"
+    assert scanner.first("nba and nfl") == "nba"
+    assert scanner.first("x nfl") is None
+
+
+def _benchmark(number: int = 200) -> None:
+    texts = [name.lower() for name in SAMPLE_NAMES]
+    cases = [
+        (
+            "league hint",
+            lambda: [_first_loop(LEAGUE_HINT_PATTERNS, t) for t in texts],
+            lambda: [LEAGUE_HINT_SCANNER.first(t) for t in texts],
+        ),
+        (
+            "sport hint",
+            lambda: [_first_loop(SPORT_HINT_PATTERNS, t) for t in texts],
+            lambda: [SPORT_HINT_SCANNER.first(t) for t in texts],
+        ),
+        (
+            "placeholder",
+            lambda: [_any_loop(PLACEHOLDER_PATTERNS, t) for t in texts],
+            lambda: [PLACEHOLDER_SCANNER.matches(t) for t in texts],
+        ),
+    ]
+    per_call = number * len(texts)
+    for label, loop, scanner in cases:
+        loop_us = timeit.timeit(loop, number=number) / per_call * 1e6
+        scan_us = timeit.timeit(scanner, number=number) / per_call * 1e6
+        print(
+            f"{label:12s} loop {loop_us:8.2f}us  scanner {scan_us:8.2f}us  "
+            f"({loop_us / scan_us:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    _benchmark()
@@ -0,0 +1,100 @@
+"""Tests for snapshot-based channel reconciliation."""
+
+import json
+from functools import partial
+
+import pytest
+
+from teamarr.consumers.reconciliation import ChannelReconciler
+from teamarr.database.channels import create_managed_channel, get_all_managed_channels
+from teamarr.database.connection import get_db, init_db
+from teamarr.dispatcharr.client import DispatcharrClient
+from teamarr.dispatcharr.managers.channels import ChannelManager
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, data: dict | None = None):
+        self.status_code = status_code
+        self._data = data
+
+    def json(self) -> dict | None:
+        return self._data
+
+
+class FakeDispatcharr:
+    """Channel listing served in pages of one; failing pages return 500."""
+
+    paginated_get = DispatcharrClient.paginated_get
+
+    def __init__(self, channels: list[dict], failing_pages: set[int] = frozenset()):
+        self._base_url = f"http://dispatcharr-{id(self)}"
+        self._channels = channels
+        self._failing_pages = failing_pages
+
+    def get(self, endpoint: str) -> FakeResponse:
+        page = int(endpoint.rsplit("page=", 1)[1]) if "page=" in endpoint else 1
+        if page in self._failing_pages:
+            return FakeResponse(500)
+        next_page = f"/api/channels/channels/?page={page + 1}"
+        return FakeResponse(
+            200,
+            {
+                "results": self._channels[page - 1 : page],
+                "next": next_page if page < len(self._channels) else None,
+            },
+        )
+
+
+@pytest.fixture
+def db_factory(tmp_path):
+    db_path = tmp_path / "teamarr.db"
+    init_db(db_path)
+    factory = partial(get_db, db_path)
+    with factory() as conn:
+        group_id = conn.execute(
+            "INSERT INTO event_epg_groups (name, leagues) VALUES (?, ?)",
+            ("Group", json.dumps(["nfl"])),
+        ).lastrowid
+        for channel_id in (101, 102):
+            create_managed_channel(
+                conn,
+                event_epg_group_id=group_id,
+                event_id=f"event-{channel_id}",
+                event_provider="espn",
+                tvg_id=f"teamarr-event-{channel_id}",
+                channel_name=f"Channel {channel_id}",
+                dispatcharr_channel_id=channel_id,
+            )
+        conn.commit()
+    return factory
+
+
+def _channel(channel_id: int) -> dict:
+    return {"id": channel_id, "uuid": f"uuid-{channel_id}", "tvg_id": f"teamarr-event-{channel_id}"}
+
+
+def _reconcile(db_factory, client: FakeDispatcharr):
+    reconciler = ChannelReconciler(db_factory, ChannelManager(client))
+    result = reconciler.reconcile(auto_fix=True)
+    with db_factory() as conn:
+        active = {c.dispatcharr_channel_id for c in get_all_managed_channels(conn)}
+    return result, active
+
+
+def test_failed_page_skips_orphan_detection(db_factory):
+    client = FakeDispatcharr([_channel(101), _channel(102)], failing_pages={2})
+
+    result, active = _reconcile(db_factory, client)
+
+    assert result.summary["orphan_teamarr"] == 0
+    assert active == {101, 102}
+    assert any("incomplete" in error for error in result.errors)
+
+
+def test_complete_listing_marks_missing_channels_deleted(db_factory):
+    client = FakeDispatcharr([_channel(101)])
+
+    result, active = _reconcile(db_factory, client)
+
+    assert result.summary["orphan_teamarr"] == 1
+    assert active == {101}
@@ -0,0 +1,71 @@
+"""Tests for provider record/replay archive keys."""
+
+from datetime import date
+
+import httpx
+import pytest
+
+from teamarr.providers import recording
+from teamarr.providers.recording import ProviderArchive, RecordingTransport, ReplayTransport
+
+RECORDED_ON = date(2026, 10, 18)
+
+
+def _fixed_today(day: date) -> type[date]:
+    class FixedDate(date):
+        @classmethod
+        def today(cls) -> date:
+            return day
+
+    return FixedDate
+
+
+@pytest.fixture
+def archive(tmp_path, monkeypatch) -> ProviderArchive:
+    """Archive with a TSDB and an ESPN response recorded on RECORDED_ON."""
+    monkeypatch.setattr(recording, "date", _fixed_today(RECORDED_ON))
+    archive = ProviderArchive(tmp_path)
+    upstream = httpx.MockTransport(lambda request: httpx.Response(200, text=str(request.url)))
+    with httpx.Client(transport=RecordingTransport(archive, upstream)) as client:
+        client.get(
+            "https://www.thesportsdb.com/api/v1/json/123/eventsday.php",
+            params={"d": "2026-10-19", "l": "NHL"},
+        )
+        client.get(
+            "https://site.api.espn.com/apis/site/v2/sports/hockey/nhl/scoreboard",
+            params={"dates": "20261018"},
+        )
+    return archive
+
+
+def test_replay_on_later_day_matches_relative_dates(archive, monkeypatch):
+    monkeypatch.setattr(recording, "date", _fixed_today(date(2026, 10, 21)))
+
+    with httpx.Client(transport=ReplayTransport(archive)) as client:
+        tomorrow = client.get(
+            "https://www.thesportsdb.com/api/v1/json/456/eventsday.php",
+            params={"l": "NHL", "d": "2026-10-22"},
+        )
+        today = client.get(
+            "https://site.api.espn.com/apis/site/v2/sports/hockey/nhl/scoreboard",
+            params={"dates": "20261021"},
+        )
+        yesterday = client.get(
+            "https://site.api.espn.com/apis/site/v2/sports/hockey/nhl/scoreboard",
+            params={"dates": "20261020"},
+        )
+
+    # Served as recorded (original dates in the body)
+    assert tomorrow.status_code == 200
+    assert "2026-10-19" in tomorrow.text
+    assert today.status_code == 200
+    assert "20261018" in today.text
+    assert yesterday.status_code == 404
+
+
+def test_non_date_values_are_keyed_verbatim():
+    relative = recording._relative_dates
+    assert relative("2025-2026", RECORDED_ON) == "2025-2026"
+    assert relative("401585123", RECORDED_ON) == "401585123"
+    assert relative("20261018", RECORDED_ON) == "{today+0d}"
+    assert relative("20251019-20251020", RECORDED_ON) == "{today-364d}-{today-363d}"
@@ -0,0 +1,66 @@
+"""Tests for Dispatcharr EPG/M3U refresh polling."""
+
+from teamarr.dispatcharr.managers.epg import EPGManager
+from teamarr.dispatcharr.managers.m3u import M3UManager
+from teamarr.dispatcharr.types import DispatcharrEPGSource, DispatcharrM3UAccount, RefreshResult
+
+FAST = {"timeout": 5, "poll_interval": 0, "initial_poll_interval": 0}
+
+
+def _source(status: str, updated_at: str) -> DispatcharrEPGSource:
+    return DispatcharrEPGSource(
+        id=1, name="EPG", source_type="xmltv", status=status, updated_at=updated_at
+    )
+
+
+def _account(status: str, updated_at: str) -> DispatcharrM3UAccount:
+    return DispatcharrM3UAccount(id=1, name="M3U", status=status, updated_at=updated_at)
+
+
+def _epg_manager(states: list[DispatcharrEPGSource]) -> EPGManager:
+    """EPGManager whose get_source walks through states (last one repeats)."""
+    manager = EPGManager(client=None)
+    polls = iter(states)
+    manager.get_source = lambda epg_id: next(polls, states[-1])
+    manager.refresh = lambda epg_id: RefreshResult(success=True)
+    return manager
+
+
+def _m3u_manager(states: list[DispatcharrM3UAccount]) -> M3UManager:
+    manager = M3UManager(client=None)
+    polls = iter(states)
+    manager.get_account = lambda account_id: next(polls, states[-1])
+    manager.refresh_account = lambda account_id: RefreshResult(success=True)
+    return manager
+
+
+def test_epg_previous_error_is_not_the_new_result():
+    manager = _epg_manager(
+        [
+            _source("error", "t0"),  # before trigger
+            _source("error", "t0"),  # new import not picked up yet
+            _source("fetching", "t0"),
+            _source("success", "t1"),
+        ]
+    )
+    assert manager.wait_for_refresh(1, **FAST).success
+
+
+def test_epg_new_error_fails():
+    manager = _epg_manager(
+        [_source("error", "t0"), _source("parsing", "t0"), _source("error", "t0")]
+    )
+    assert not manager.wait_for_refresh(1, **FAST).success
+
+
+def test_m3u_previous_error_is_not_the_new_result():
+    manager = _m3u_manager(
+        [
+            _account("error", "t0"),  # before trigger
+            _account("error", "t0"),
+            _account("fetching", "t0"),
+            _account("success", "t1"),
+        ]
+    )
+    result = manager.wait_for_refresh(1, skip_if_recent_minutes=0, **FAST)
+    assert result.success